@@ -0,0 +1,280 @@
+from array import array
+from typing import Callable, Dict, List, Optional, Sequence
+from Modulo_creacionDelArbol import Pregunta
+
+# Casilla del arreglo sin pregunta
+VACIO = -1
+
+class PreguntaCompacta:
+    """
+    Vista de una pregunta guardada en las columnas de un ArbolCompacto.
+
+    Tiene la misma interfaz que Pregunta; los datos viven en el árbol y la
+    vista solo guarda su índice, así que crearla es barato. Dos vistas de la
+    misma pregunta son iguales y tienen el mismo hash. Los observadores del
+    peso se guardan en el árbol, así que cualquier vista de la pregunta los
+    avisa.
+    """
+    __slots__ = ("_arbol", "_indice")
+
+    def __init__(self, arbol: "ArbolCompacto", indice: int) -> None:
+        self._arbol = arbol
+        self._indice = indice
+
+    @property
+    def texto(self) -> str:
+        return self._arbol.textos[self._indice]
+
+    @property
+    def respuesta(self) -> Optional[str]:
+        return self._arbol.respuestas[self._indice] if self._arbol.respuestas else None
+
+    @property
+    def dificultad(self) -> int:
+        return self._arbol.dificultades[self._indice]
+
+    @property
+    def peso(self) -> int:
+        return self._arbol.pesos[self._indice]
+
+    @peso.setter
+    def peso(self, valor: int) -> None:
+        arbol, i = self._arbol, self._indice
+        anterior = arbol.pesos[i]
+        arbol.pesos[i] = valor
+        if arbol._observadores and valor != anterior and i in arbol._observadores:
+            for observador in list(arbol._observadores[i]):
+                observador(self, anterior)
+
+    def observar_peso(self, observador: Callable[["PreguntaCompacta", int], None]) -> None:
+        """Registra una función que se llama con (pregunta, peso_anterior) cada vez que cambia el peso."""
+        if self._arbol._observadores is None:
+            self._arbol._observadores = {}
+        self._arbol._observadores.setdefault(self._indice, []).append(observador)
+
+    def dejar_de_observar_peso(self, observador: Callable[["PreguntaCompacta", int], None]) -> None:
+        """Quita una función registrada con observar_peso()."""
+        observadores = self._arbol._observadores
+        if observadores and observador in observadores.get(self._indice, ()):
+            observadores[self._indice].remove(observador)
+            if not observadores[self._indice]:
+                del observadores[self._indice]
+
+    @property
+    def correctas(self) -> int:
+        return self._arbol.correctas[self._indice]
+
+    @property
+    def incorrectas(self) -> int:
+        return self._arbol.incorrectas[self._indice]
+
+    def registrar_respuesta(self, correcta: bool) -> None:
+        """
+        Registra una respuesta y ajusta el peso de la pregunta.
+
+        Args:
+            correcta (bool): Si la respuesta fue correcta
+        """
+        if correcta:
+            self._arbol.correctas[self._indice] += 1
+            self.peso = max(0, self.peso - 1)
+        else:
+            self._arbol.incorrectas[self._indice] += 1
+            self.peso += 1
+
+    def __eq__(self, otra) -> bool:
+        return (isinstance(otra, PreguntaCompacta)
+                and otra._arbol is self._arbol and otra._indice == self._indice)
+
+    def __hash__(self) -> int:
+        return hash((id(self._arbol), self._indice))
+
+    def __repr__(self):
+        return f"Pregunta('{self.texto}', peso={self.peso})"
+
+class NodoCompacto:
+    """
+    Vista de una posición de un ArbolCompacto con la interfaz de recorrido de NodoArbol.
+
+    Ofrece pregunta, izquierdo, derecho, es_hoja(), altura(), niveles() y
+    nodos_en_nivel(), así que obtener_pregunta_aleatoria y los selectores de
+    preguntas funcionan igual sobre ambos árboles. El árbol no se modifica a
+    través de las vistas.
+    """
+    __slots__ = ("_arbol", "_posicion")
+
+    def __init__(self, arbol: "ArbolCompacto", posicion: int) -> None:
+        self._arbol = arbol
+        self._posicion = posicion
+
+    @property
+    def pregunta(self) -> PreguntaCompacta:
+        return PreguntaCompacta(self._arbol, self._arbol.orden[self._posicion])
+
+    @property
+    def izquierdo(self) -> Optional["NodoCompacto"]:
+        return self._arbol._nodo(2 * self._posicion)
+
+    @property
+    def derecho(self) -> Optional["NodoCompacto"]:
+        return self._arbol._nodo(2 * self._posicion + 1)
+
+    def es_hoja(self) -> bool:
+        """Verifica si el nodo es una hoja."""
+        return self._arbol.alturas[self._posicion] == 1
+
+    def altura(self) -> int:
+        """Devuelve la altura del subárbol desde este nodo."""
+        return self._arbol.alturas[self._posicion]
+
+    def niveles(self) -> List[List["NodoCompacto"]]:
+        """Devuelve los nodos del subárbol agrupados por nivel, de izquierda a derecha."""
+        return [self.nodos_en_nivel(nivel) for nivel in range(1, self.altura() + 1)]
+
+    def nodos_en_nivel(self, nivel: int) -> List["NodoCompacto"]:
+        """
+        Devuelve los nodos a una profundidad dada, contando este nodo como nivel 1.
+
+        En el orden de Eytzinger el nivel k del subárbol de la posición p ocupa
+        las posiciones contiguas [p * 2^(k-1), (p + 1) * 2^(k-1)).
+
+        Args:
+            nivel (int): Profundidad buscada.
+
+        Returns:
+            List[NodoCompacto]: Nodos del nivel de izquierda a derecha; vacía si
+                el nivel no existe.
+        """
+        if not 1 <= nivel <= self.altura():
+            return []
+        if self._posicion == 1:
+            return self._arbol.nodos_en_nivel(nivel)
+        desplazamiento = nivel - 1
+        inicio = self._posicion << desplazamiento
+        fin = min((self._posicion + 1) << desplazamiento, len(self._arbol.orden))
+        orden = self._arbol.orden
+        return [NodoCompacto(self._arbol, p) for p in range(inicio, fin) if orden[p] != VACIO]
+
+    def __eq__(self, otro) -> bool:
+        return (isinstance(otro, NodoCompacto)
+                and otro._arbol is self._arbol and otro._posicion == self._posicion)
+
+    def __hash__(self) -> int:
+        return hash((id(self._arbol), self._posicion))
+
+class ArbolCompacto:
+    """
+    Árbol balanceado de preguntas guardado en arreglos, sin un objeto por nodo.
+
+    La forma es la misma que la de construir_arbol_balanceado (preguntas
+    ordenadas por peso, raíz en el elemento del medio), pero los nodos se
+    ubican en orden de Eytzinger: la raíz está en la posición 1 y los hijos de
+    la posición k en 2k y 2k + 1. Cada casilla de `orden` guarda el índice de
+    su pregunta en las columnas o VACIO. Los datos de las preguntas están en
+    columnas (listas y arreglos de enteros) en lugar de un objeto por pregunta.
+
+    Atributos:
+        textos (List[str]): Texto de cada pregunta.
+        respuestas (List[str], opcional): Respuesta de cada pregunta, si se conocen.
+        dificultades (array): Dificultad declarada de cada pregunta.
+        pesos (array): Peso de cada pregunta.
+        correctas (array): Respuestas correctas de cada pregunta.
+        incorrectas (array): Respuestas incorrectas de cada pregunta.
+        orden (array): Índice de pregunta de cada posición del árbol, desde la 1.
+        alturas (array): Altura del subárbol de cada posición (0 si está vacía).
+
+    La forma se fija al construir: cambiar un peso no reubica la pregunta.
+    Para seguir los pesos, ArbolPesos o MuestreadorPesos observan las
+    preguntas con PreguntaCompacta.observar_peso().
+    """
+    __slots__ = ("textos", "respuestas", "dificultades", "pesos", "correctas", "incorrectas",
+                 "orden", "alturas", "_niveles", "_observadores")
+
+    def __init__(self, textos: Sequence[str], pesos: Optional[Sequence[int]] = None,
+                 respuestas: Optional[Sequence[str]] = None,
+                 dificultades: Optional[Sequence[int]] = None) -> None:
+        """
+        Construye el árbol a partir de las columnas de las preguntas.
+
+        Args:
+            textos (Sequence[str]): Texto de cada pregunta.
+            pesos (Sequence[int], opcional): Peso de cada pregunta. Por defecto 0.
+            respuestas (Sequence[str], opcional): Respuesta de cada pregunta.
+            dificultades (Sequence[int], opcional): Dificultad de cada pregunta. Por defecto 1.
+        """
+        n = len(textos)
+        self.textos = list(textos)
+        self.respuestas = list(respuestas) if respuestas is not None else None
+        self.dificultades = array("i", dificultades) if dificultades is not None else array("i", [1]) * n
+        self.pesos = array("i", pesos) if pesos is not None else array("i", [0]) * n
+        self.correctas = array("i", [0]) * n
+        self.incorrectas = array("i", [0]) * n
+        self._niveles: Optional[List[List[NodoCompacto]]] = None
+        # Observadores del peso por índice de pregunta; None hasta el primero
+        self._observadores: Optional[Dict[int, List[Callable[[PreguntaCompacta, int], None]]]] = None
+
+        # Misma forma que construir_arbol_balanceado: el sort es estable, así que
+        # con pesos iguales se conserva el orden de entrada
+        ordenados = sorted(range(n), key=self.pesos.__getitem__)
+        self.orden = array("i", [VACIO]) * (1 << n.bit_length())
+        self.alturas = array("B", [0]) * len(self.orden)
+        orden, alturas = self.orden, self.alturas
+        pendientes = [(1, 0, n - 1)] if n else []
+        while pendientes:
+            posicion, inicio, fin = pendientes.pop()
+            medio = (inicio + fin) // 2
+            orden[posicion] = ordenados[medio]
+            # Partiendo por el medio, un subárbol de m preguntas tiene altura m.bit_length()
+            alturas[posicion] = (fin - inicio + 1).bit_length()
+            if inicio < medio:
+                pendientes.append((2 * posicion, inicio, medio - 1))
+            if medio < fin:
+                pendientes.append((2 * posicion + 1, medio + 1, fin))
+
+    @classmethod
+    def desde_preguntas(cls, preguntas: Sequence[Pregunta]) -> "ArbolCompacto":
+        """Construye el árbol copiando texto, respuesta, dificultad y peso de objetos Pregunta."""
+        return cls([p.texto for p in preguntas], [p.peso for p in preguntas],
+                   [p.respuesta for p in preguntas], [p.dificultad for p in preguntas])
+
+    def __len__(self) -> int:
+        return len(self.textos)
+
+    @property
+    def raiz(self) -> Optional[NodoCompacto]:
+        """Nodo raíz, o None si el árbol está vacío."""
+        return self._nodo(1)
+
+    def _nodo(self, posicion: int) -> Optional[NodoCompacto]:
+        if posicion < len(self.orden) and self.orden[posicion] != VACIO:
+            return NodoCompacto(self, posicion)
+        return None
+
+    def nodos_en_nivel(self, nivel: int) -> List[NodoCompacto]:
+        """
+        Devuelve los nodos a una profundidad dada, con la raíz en el nivel 1.
+
+        Las listas de todos los niveles se arman juntas la primera vez y se reutilizan.
+
+        Returns:
+            List[NodoCompacto]: Nodos del nivel de izquierda a derecha; vacía si
+                el nivel no existe. No debe modificarse.
+        """
+        if self._niveles is None:
+            self._niveles = []
+            for k in range(self.alturas[1] if len(self.orden) > 1 else 0):
+                inicio, fin = 1 << k, min(2 << k, len(self.orden))
+                self._niveles.append([NodoCompacto(self, p) for p in range(inicio, fin)
+                                      if self.orden[p] != VACIO])
+        if 1 <= nivel <= len(self._niveles):
+            return self._niveles[nivel - 1]
+        return []
+
+def construir_arbol_compacto(preguntas: Sequence[Pregunta]) -> Optional[NodoCompacto]:
+    """
+    Versión compacta de construir_arbol_balanceado.
+
+    Returns:
+        NodoCompacto, opcional: Raíz del árbol, o None si no hay preguntas.
+    """
+    return ArbolCompacto.desde_preguntas(preguntas).raiz
@@ -0,0 +1,300 @@
+from itertools import count
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from Modulo_creacionDelArbol import Pregunta
+
+class NodoPeso:
+    """
+    Nodo de un ArbolPesos, con la interfaz de recorrido de NodoArbol.
+
+    Attributes:
+        pregunta (Pregunta): La pregunta del nodo
+        clave (Tuple[int, int]): Peso con el que está ubicado y orden de inserción
+        izquierdo (NodoPeso, opcional): Subárbol de claves menores
+        derecho (NodoPeso, opcional): Subárbol de claves mayores
+        tamano (int): Cantidad de nodos del subárbol
+    """
+    __slots__ = ("pregunta", "clave", "izquierdo", "derecho", "tamano", "_altura")
+
+    def __init__(self, pregunta: Pregunta, clave: Tuple[int, int]) -> None:
+        self.pregunta = pregunta
+        self.clave = clave
+        self.izquierdo: Optional["NodoPeso"] = None
+        self.derecho: Optional["NodoPeso"] = None
+        self.tamano = 1
+        self._altura = 1
+
+    def es_hoja(self) -> bool:
+        """Verifica si el nodo es una hoja."""
+        return self.izquierdo is None and self.derecho is None
+
+    def altura(self) -> int:
+        """Devuelve la altura del subárbol desde este nodo."""
+        return self._altura
+
+    def niveles(self) -> List[List["NodoPeso"]]:
+        """Devuelve los nodos del subárbol agrupados por nivel, de izquierda a derecha."""
+        niveles = []
+        nivel = [self]
+        while nivel:
+            niveles.append(nivel)
+            nivel = [hijo for nodo in nivel for hijo in (nodo.izquierdo, nodo.derecho) if hijo is not None]
+        return niveles
+
+    def nodos_en_nivel(self, nivel: int) -> List["NodoPeso"]:
+        """
+        Devuelve los nodos a una profundidad dada, contando este nodo como nivel 1.
+
+        El árbol cambia de forma con cada inserción, así que no hay índice: se
+        recorren solo los niveles anteriores al pedido.
+        """
+        if not 1 <= nivel <= self._altura:
+            return []
+        nodos = [self]
+        for _ in range(nivel - 1):
+            nodos = [hijo for nodo in nodos for hijo in (nodo.izquierdo, nodo.derecho) if hijo is not None]
+        return nodos
+
+def _altura(nodo: Optional[NodoPeso]) -> int:
+    return nodo._altura if nodo else 0
+
+def _tamano(nodo: Optional[NodoPeso]) -> int:
+    return nodo.tamano if nodo else 0
+
+def _actualizar(nodo: NodoPeso) -> None:
+    nodo._altura = max(_altura(nodo.izquierdo), _altura(nodo.derecho)) + 1
+    nodo.tamano = _tamano(nodo.izquierdo) + _tamano(nodo.derecho) + 1
+
+def _rotar_derecha(nodo: NodoPeso) -> NodoPeso:
+    raiz = nodo.izquierdo
+    nodo.izquierdo = raiz.derecho
+    raiz.derecho = nodo
+    _actualizar(nodo)
+    _actualizar(raiz)
+    return raiz
+
+def _rotar_izquierda(nodo: NodoPeso) -> NodoPeso:
+    raiz = nodo.derecho
+    nodo.derecho = raiz.izquierdo
+    raiz.izquierdo = nodo
+    _actualizar(nodo)
+    _actualizar(raiz)
+    return raiz
+
+def _balancear(nodo: NodoPeso) -> NodoPeso:
+    """Actualiza altura y tamaño de un nodo y lo rota si sus subárboles difieren en más de 1."""
+    _actualizar(nodo)
+    diferencia = _altura(nodo.izquierdo) - _altura(nodo.derecho)
+    if diferencia > 1:
+        if _altura(nodo.izquierdo.izquierdo) < _altura(nodo.izquierdo.derecho):
+            nodo.izquierdo = _rotar_izquierda(nodo.izquierdo)
+        return _rotar_derecha(nodo)
+    if diferencia < -1:
+        if _altura(nodo.derecho.derecho) < _altura(nodo.derecho.izquierdo):
+            nodo.derecho = _rotar_derecha(nodo.derecho)
+        return _rotar_izquierda(nodo)
+    return nodo
+
+def _insertar(raiz: Optional[NodoPeso], nuevo: NodoPeso) -> NodoPeso:
+    if raiz is None:
+        return nuevo
+    if nuevo.clave < raiz.clave:
+        raiz.izquierdo = _insertar(raiz.izquierdo, nuevo)
+    else:
+        raiz.derecho = _insertar(raiz.derecho, nuevo)
+    return _balancear(raiz)
+
+def _quitar_minimo(raiz: NodoPeso) -> Tuple[Optional[NodoPeso], NodoPeso]:
+    """Quita el nodo de clave mínima; devuelve la nueva raíz y el nodo quitado."""
+    if raiz.izquierdo is None:
+        return raiz.derecho, raiz
+    raiz.izquierdo, minimo = _quitar_minimo(raiz.izquierdo)
+    return _balancear(raiz), minimo
+
+def _eliminar(raiz: Optional[NodoPeso], clave: Tuple[int, int]) -> Optional[NodoPeso]:
+    if raiz is None:
+        return None
+    if clave < raiz.clave:
+        raiz.izquierdo = _eliminar(raiz.izquierdo, clave)
+    elif clave > raiz.clave:
+        raiz.derecho = _eliminar(raiz.derecho, clave)
+    else:
+        if raiz.izquierdo is None:
+            return raiz.derecho
+        if raiz.derecho is None:
+            return raiz.izquierdo
+        derecho, sucesor = _quitar_minimo(raiz.derecho)
+        sucesor.izquierdo, sucesor.derecho = raiz.izquierdo, derecho
+        raiz = sucesor
+    return _balancear(raiz)
+
+class ArbolPesos:
+    """
+    Árbol AVL de estadísticas de orden con las preguntas ordenadas por peso.
+
+    A diferencia de construir_arbol_balanceado, que ordena una sola vez, el
+    árbol observa el peso de cada pregunta: cuando registrar_respuesta lo
+    cambia, la pregunta se reubica en O(log n) y el invariante "más peso a la
+    derecha" del que depende obtener_pregunta_aleatoria se mantiene. Con pesos
+    iguales se conserva el orden de inserción, igual que el sort estable.
+
+    Cada nodo guarda el tamaño de su subárbol, así que el rango de una
+    pregunta, la k-ésima pregunta y la cantidad de preguntas en un rango de
+    pesos también cuestan O(log n).
+
+    La raíz cambia con las rotaciones: hay que pedir `raiz` en cada recorrido
+    en lugar de guardarla.
+    """
+    def __init__(self, preguntas: Iterable[Pregunta] = ()):
+        self.raiz: Optional[NodoPeso] = None
+        self._nodos: Dict[Pregunta, NodoPeso] = {}
+        self._secuencia = count()
+        for pregunta in preguntas:
+            self.insertar(pregunta)
+
+    def __len__(self) -> int:
+        return _tamano(self.raiz)
+
+    def __contains__(self, pregunta: Pregunta) -> bool:
+        return pregunta in self._nodos
+
+    def __iter__(self) -> Iterator[Pregunta]:
+        """Recorre las preguntas de menor a mayor peso."""
+        pila: List[NodoPeso] = []
+        nodo = self.raiz
+        while pila or nodo is not None:
+            while nodo is not None:
+                pila.append(nodo)
+                nodo = nodo.izquierdo
+            nodo = pila.pop()
+            yield nodo.pregunta
+            nodo = nodo.derecho
+
+    def insertar(self, pregunta: Pregunta) -> None:
+        """
+        Agrega una pregunta y empieza a observar su peso.
+
+        Raises:
+            ValueError: Si la pregunta ya está en el árbol.
+        """
+        if pregunta in self._nodos:
+            raise ValueError(f"{pregunta!r} ya está en el árbol")
+        nodo = NodoPeso(pregunta, (pregunta.peso, next(self._secuencia)))
+        self._nodos[pregunta] = nodo
+        self.raiz = _insertar(self.raiz, nodo)
+        pregunta.observar_peso(self._al_cambiar_peso)
+
+    def eliminar(self, pregunta: Pregunta) -> None:
+        """
+        Quita una pregunta y deja de observar su peso.
+
+        Raises:
+            KeyError: Si la pregunta no está en el árbol.
+        """
+        nodo = self._nodos.pop(pregunta)
+        self.raiz = _eliminar(self.raiz, nodo.clave)
+        pregunta.dejar_de_observar_peso(self._al_cambiar_peso)
+
+    def vaciar(self) -> None:
+        """Quita todas las preguntas y deja de observarlas."""
+        for pregunta in self._nodos:
+            pregunta.dejar_de_observar_peso(self._al_cambiar_peso)
+        self._nodos.clear()
+        self.raiz = None
+
+    def _al_cambiar_peso(self, pregunta: Pregunta, anterior: int) -> None:
+        """Reubica una pregunta cuyo peso cambió, conservando su orden entre iguales."""
+        nodo = self._nodos[pregunta]
+        self.raiz = _eliminar(self.raiz, nodo.clave)
+        nodo.clave = (pregunta.peso, nodo.clave[1])
+        nodo.izquierdo = nodo.derecho = None
+        nodo.tamano = nodo._altura = 1
+        self.raiz = _insertar(self.raiz, nodo)
+
+    def rango(self, pregunta: Pregunta) -> int:
+        """
+        Devuelve la posición de una pregunta en el orden por peso, desde 0.
+
+        Raises:
+            KeyError: Si la pregunta no está en el árbol.
+        """
+        clave = self._nodos[pregunta].clave
+        posicion = 0
+        nodo = self.raiz
+        while nodo is not None:
+            if clave < nodo.clave:
+                nodo = nodo.izquierdo
+            elif clave > nodo.clave:
+                posicion += _tamano(nodo.izquierdo) + 1
+                nodo = nodo.derecho
+            else:
+                return posicion + _tamano(nodo.izquierdo)
+        raise KeyError(pregunta)
+
+    def k_esima(self, k: int) -> Pregunta:
+        """
+        Devuelve la pregunta en la posición k del orden por peso, desde 0.
+
+        Raises:
+            IndexError: Si k está fuera de rango.
+        """
+        if not 0 <= k < len(self):
+            raise IndexError(f"Posición fuera de rango: {k}")
+        nodo = self.raiz
+        while True:
+            izquierda = _tamano(nodo.izquierdo)
+            if k < izquierda:
+                nodo = nodo.izquierdo
+            elif k == izquierda:
+                return nodo.pregunta
+            else:
+                k -= izquierda + 1
+                nodo = nodo.derecho
+
+    def _menores(self, peso: int) -> int:
+        """Cantidad de preguntas con peso estrictamente menor."""
+        cantidad = 0
+        nodo = self.raiz
+        while nodo is not None:
+            if nodo.clave[0] < peso:
+                cantidad += _tamano(nodo.izquierdo) + 1
+                nodo = nodo.derecho
+            else:
+                nodo = nodo.izquierdo
+        return cantidad
+
+    def contar_en_rango(self, peso_min: int, peso_max: int) -> int:
+        """Cantidad de preguntas con peso_min <= peso <= peso_max, en O(log n)."""
+        if peso_min > peso_max:
+            return 0
+        return self._menores(peso_max + 1) - self._menores(peso_min)
+
+    def preguntas_en_rango(self, peso_min: int, peso_max: int) -> List[Pregunta]:
+        """
+        Devuelve las preguntas con peso_min <= peso <= peso_max, de menor a mayor peso.
+
+        Solo visita las ramas que pueden tener pesos del rango: O(log n + k).
+        """
+        resultado = []
+
+        def recorrer(nodo: Optional[NodoPeso]) -> None:
+            if nodo is None:
+                return
+            peso = nodo.clave[0]
+            if peso >= peso_min:
+                recorrer(nodo.izquierdo)
+            if peso_min <= peso <= peso_max:
+                resultado.append(nodo.pregunta)
+            if peso <= peso_max:
+                recorrer(nodo.derecho)
+
+        recorrer(self.raiz)
+        return resultado
+
+def construir_arbol_pesos(preguntas: Iterable[Pregunta]) -> ArbolPesos:
+    """
+    Versión autobalanceada de construir_arbol_balanceado que sigue los cambios de peso.
+
+    Returns:
+        ArbolPesos: Árbol con las preguntas; su `raiz` sirve para obtener_pregunta_aleatoria.
+    """
+    return ArbolPesos(preguntas)
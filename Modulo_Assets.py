@@ -1,7 +1,45 @@
+import io
+import math
 import pygame
 import os
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from PIL import Image  
-from typing import Dict, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
+from Modulo_Atlas import PREFIJO_COMUN, SPRITES_CATEGORIA, AtlasSprites, atlas_compartido
+from Modulo_CacheAssets import cache_disco
+from Modulo_Manifiesto import manifiesto_compartido
+from Modulo_RegistroAssets import registro_assets
+
+
+# Imágenes que participan en colisiones; sus máscaras se calculan al cargar
+SPRITES_CON_MASCARA = ("player", "obstacle")
+
+# Filtro de cada calidad de scale_image; forma parte de la clave de la caché en disco
+FILTROS_CALIDAD = {"alta": "lanczos", "media": "smoothscale", "baja": "nearest"}
+REMUESTREO = FILTROS_CALIDAD["alta"]
+
+# get_scaled_image redondea el factor a 1/8 de octava y guarda como máximo
+# MAX_IMAGENES_ESCALADAS resultados
+CUBETAS_POR_OCTAVA = 8
+MAX_IMAGENES_ESCALADAS = 64
+
+def _escalar_con_pil(surface: pygame.Surface, size: Tuple[int, int], filtro) -> pygame.Surface:
+    """
+    Escala con PIL haciendo una sola copia de la imagen de origen y una del resultado.
+    
+    pygame.image.tobytes escribe los pixeles en orden RGBA (o RGBX si la
+    superficie no tiene alfa), que es el formato interno de PIL, así que
+    Image.frombuffer usa esos bytes sin volver a copiarlos. A la vuelta,
+    pygame.image.frombuffer envuelve los bytes del resultado sin copiarlos.
+    """
+    modo = "RGBA" if surface.get_flags() & pygame.SRCALPHA else "RGBX"
+    datos = pygame.image.tobytes(surface, modo)
+    origen = Image.frombuffer(modo, surface.get_size(), datos, "raw", modo, 0, 1)
+    escalada = origen.resize(size, filtro)
+    return pygame.image.frombuffer(escalada.tobytes(), size, modo)
+
 
 class AssetManager:
     """
@@ -12,52 +50,85 @@ class AssetManager:
     
     Atributos:
         categoria (str): Categoría de los recursos (en minúsculas).
-        images (Dict[str, pygame.Surface]): Diccionario de imágenes cargadas.
-        cache (Dict[str, pygame.Surface]): Caché de imágenes escaladas.
+        images (Dict[str, pygame.Surface]): Diccionario de imágenes cargadas, en el formato
+            de la pantalla si ya existe una.
+        originales (Dict[str, pygame.Surface]): Imágenes escaladas antes de convertirlas.
+        cache (OrderedDict[str, pygame.Surface]): Caché LRU de imágenes escaladas, con
+            a lo sumo MAX_IMAGENES_ESCALADAS entradas.
+        mipmaps (Dict[str, List[pygame.Surface]]): Niveles de cada imagen, cada uno
+            de la mitad del tamaño del anterior; el nivel 0 es la imagen en `images`.
+        mascaras (Dict[str, pygame.mask.Mask]): Máscaras de colisión de los sprites,
+            con la misma clave que la imagen en `images` o en `cache`.
         base_path (str): Ruta base del script.
         assets_path (str): Ruta de los recursos para la categoría específica.
+        usar_atlas (bool): Si los sprites se toman del atlas compartido.
     """
-    def __init__(self, categoria: str):
+    def __init__(self, categoria: str, convertir: bool = True, usar_atlas: bool = True):
         """
         Inicializa el gestor de recursos para una categoría específica.
         
         Args:
             categoria (str): Nombre de la categoría de recursos.
+            convertir (bool, opcional): Si se convierten las imágenes al formato de la
+                pantalla al terminar la carga. Debe ser False fuera del hilo principal;
+                la conversión se hace luego con asegurar_formato_pantalla().
+            usar_atlas (bool, opcional): Si player y obstacle se entregan como
+                subsuperficies del atlas de sprites en lugar de cargarse por separado.
         """
         self.categoria = categoria.lower()  # Aseguramos que esté en minúsculas
         self.images: Dict[str, pygame.Surface] = {}
-        self.cache: Dict[str, pygame.Surface] = {}
+        self.originales: Dict[str, pygame.Surface] = {}
+        self.cache: "OrderedDict[str, pygame.Surface]" = OrderedDict()
+        self.mipmaps: Dict[str, List[pygame.Surface]] = {}
+        self.mascaras: Dict[str, pygame.mask.Mask] = {}
+        self._formato_pantalla: Optional[tuple] = None
+        self._claves_registro: List[tuple] = []
+        self.usar_atlas = usar_atlas
+        self._atlas: Optional[AtlasSprites] = None
+        # Nombre de cada imagen tomada del atlas y su clave en él
+        self._claves_atlas: Dict[str, str] = {}
         
         # Obtener la ruta base del script actual
         self.base_path = os.path.dirname(os.path.abspath(__file__))
         self.assets_path = os.path.join(self.base_path, "assets", self.categoria)
         
-        # Crear estructura de carpetas si no existe
-        self._create_asset_structure()
-        # Cargar los assets
+        # Cargar los assets; las rutas salen del manifiesto, sin sondear carpetas
         self._load_assets()
+        self.originales = dict(self.images)
+        for nombre in SPRITES_CON_MASCARA:
+            if nombre in self.originales:
+                self.obtener_mascara(nombre)
+        if convertir:
+            self.asegurar_formato_pantalla()
 
     def scale_image(self, surface: pygame.Surface, new_width: Optional[int] = None, 
-                new_height: Optional[int] = None, force_aspect_ratio: bool = True) -> pygame.Surface:
+                new_height: Optional[int] = None, force_aspect_ratio: bool = True,
+                calidad: str = "alta") -> pygame.Surface:
         """
         Escala una superficie de Pygame a nuevas dimensiones.
         
         Permite redimensionar una imagen manteniendo su proporción original si es necesario.
+        "alta" copia la imagen una vez hacia PIL y el resultado una vez de vuelta;
+        "media" y "baja" escalan directamente con pygame.transform, sin copias.
         
         Args:
             surface (pygame.Surface): Superficie de imagen original a escalar.
             new_width (Optional[int]): Nuevo ancho deseado. Opcional.
             new_height (Optional[int]): Nueva altura deseada. Opcional.
             force_aspect_ratio (bool, optional): Si se debe mantener la proporción original. Por defecto es True.
+            calidad (str, optional): "alta" (LANCZOS con PIL), "media" (smoothscale)
+                o "baja" (vecino más cercano). Por defecto es "alta".
         
         Returns:
-            pygame.Surface: Superficie de imagen escalada.
-        """
-        # Convertir pygame Surface a PIL Image para mejor manejo del escalado
-        temp_string = pygame.image.tostring(surface, 'RGBA')
-        temp_pil_image = Image.frombytes('RGBA', surface.get_size(), temp_string)
+            pygame.Surface: Superficie de imagen escalada; con canal alfa si la
+                original lo tenía.
         
-        original_width, original_height = temp_pil_image.size
+        Raises:
+            ValueError: Si la calidad no es una de FILTROS_CALIDAD.
+        """
+        if calidad not in FILTROS_CALIDAD:
+            raise ValueError(f"Calidad de escalado desconocida: {calidad}")
+        original_width, original_height = surface.get_size()
 
         if force_aspect_ratio:
             if new_width and new_height:
@@ -75,16 +146,12 @@ class AssetManager:
             else:
                 return surface
 
-        # Escalar la imagen usando PIL
-        temp_pil_image = temp_pil_image.resize((new_width, new_height), Image.Resampling.LANCZOS)
-        
-        # Convertir de vuelta a pygame Surface
-        mode = temp_pil_image.mode
-        size = temp_pil_image.size
-        data = temp_pil_image.tobytes()
-        
-        new_surface = pygame.image.fromstring(data, size, mode)
-        return new_surface
+        size = (new_width, new_height)
+        if calidad == "baja":
+            return pygame.transform.scale(surface, size)
+        if calidad == "media" and surface.get_bitsize() in (24, 32):
+            return pygame.transform.smoothscale(surface, size)
+        return _escalar_con_pil(surface, size, Image.Resampling.LANCZOS)
 
     def _load_assets(self):
         """
@@ -94,23 +161,12 @@ class AssetManager:
         Si falla, crea superficies de color por defecto.
         """
         try:
-            # Cargar y escalar imagen del jugador (50x50)
-            player_path = os.path.join(self.assets_path, "player.png")
-            pil_image = Image.open(player_path)
-            player_img = self._pil_to_pygame(pil_image)
-            self.images["player"] = self.scale_image(player_img, 50, 50)
-
-            # Cargar y escalar obstáculos (50x30)
-            obstacle_path = os.path.join(self.assets_path, "obstacle.png")
-            pil_image = Image.open(obstacle_path)
-            obstacle_img = self._pil_to_pygame(pil_image)
-            self.images["obstacle"] = self.scale_image(obstacle_img, 50, 30)
+            # Jugador (50x50) y obstáculos (50x30), del atlas si está disponible
+            for nombre, (ancho, alto) in SPRITES_CATEGORIA.items():
+                self.images[nombre] = self._cargar_sprite(nombre, ancho, alto)
 
             # Cargar y escalar fondo (800x600)
-            background_path = os.path.join(self.assets_path, "background.png")
-            pil_image = Image.open(background_path)
-            background_img = self._pil_to_pygame(pil_image)
-            self.images["background"] = self.scale_image(background_img, 800, 600)
+            self.images["background"] = self._cargar_escalada("background.png", 800, 600)
 
         except (pygame.error, FileNotFoundError) as e:
             print(f"Error cargando imágenes: {e}")
@@ -119,6 +175,109 @@ class AssetManager:
             self.images["obstacle"] = self._create_colored_surface((50, 30), (255, 0, 0))
             self.images["background"] = self._create_colored_surface((800, 600), (100, 100, 255))
 
+    def _obtener_atlas(self) -> Optional[AtlasSprites]:
+        """Devuelve el atlas compartido, o None si está desactivado o no se pudo construir."""
+        if self._atlas is None and self.usar_atlas:
+            try:
+                self._atlas = atlas_compartido()
+            except (pygame.error, OSError) as e:
+                print(f"No se pudo cargar el atlas de sprites: {e}")
+                self.usar_atlas = False
+        return self._atlas
+
+    def _cargar_sprite(self, nombre: str, ancho: int, alto: int) -> pygame.Surface:
+        """
+        Obtiene un sprite de la categoría como subsuperficie del atlas.
+        
+        Si el atlas no lo tiene, lo carga y escala desde su PNG.
+        
+        Args:
+            nombre (str): Nombre del sprite ("player" u "obstacle").
+            ancho (int): Ancho máximo.
+            alto (int): Alto máximo.
+        
+        Returns:
+            pygame.Surface: Imagen escalada conservando la proporción. Es compartida.
+        """
+        atlas = self._obtener_atlas()
+        clave = f"{self.categoria}/{nombre}"
+        if atlas is not None and clave in atlas:
+            self._claves_atlas[nombre] = clave
+            return atlas.original(clave)
+        return self._cargar_escalada(f"{nombre}.png", ancho, alto)
+
+    def obtener_sprite(self, nombre: str) -> pygame.Surface:
+        """
+        Devuelve uno de los sprites sueltos de assets/ (p. ej. "roca") desde el atlas.
+        
+        Args:
+            nombre (str): Nombre del archivo sin extensión.
+        
+        Returns:
+            pygame.Surface: Subsuperficie del atlas, en el formato de la pantalla si
+                ya se convirtió.
+        
+        Raises:
+            KeyError: Si el sprite no existe o el atlas no está disponible.
+        """
+        atlas = self._obtener_atlas()
+        if atlas is None:
+            raise KeyError(nombre)
+        return atlas.sprite(f"{PREFIJO_COMUN}/{nombre}")
+
+    def _cargar_escalada(self, archivo: str, ancho: int, alto: int) -> pygame.Surface:
+        """
+        Obtiene del registro compartido un PNG de la categoría escalado a la caja indicada.
+        
+        La referencia tomada en el registro se devuelve con liberar().
+        
+        Args:
+            archivo (str): Nombre del archivo dentro de la carpeta de la categoría.
+            ancho (int): Ancho máximo.
+            alto (int): Alto máximo.
+        
+        Returns:
+            pygame.Surface: Imagen escalada conservando la proporción. Es compartida.
+        """
+        clave = (self.categoria, archivo, (ancho, alto))
+        imagen = registro_assets.obtener(clave, lambda: self._decodificar_escalada(archivo, ancho, alto))
+        self._claves_registro.append(clave)
+        return imagen
+
+    def _decodificar_escalada(self, archivo: str, ancho: int, alto: int) -> pygame.Surface:
+        """
+        Carga un PNG de la categoría escalado a la caja indicada.
+        
+        La ruta y el hash del archivo salen del manifiesto de assets, así que la
+        caché en disco se consulta sin abrir el PNG; solo si no está ahí se lee,
+        se decodifica, se escala y se guarda el blob.
+        
+        Args:
+            archivo (str): Nombre del archivo dentro de la carpeta de la categoría.
+            ancho (int): Ancho máximo.
+            alto (int): Alto máximo.
+        
+        Returns:
+            pygame.Surface: Imagen escalada conservando la proporción.
+        
+        Raises:
+            FileNotFoundError: Si el archivo no está en el manifiesto.
+        """
+        manifiesto = manifiesto_compartido()
+        entrada = manifiesto.entrada(self.categoria, archivo)
+        if entrada is None:
+            raise FileNotFoundError(f"{self.categoria}/{archivo} no está en el manifiesto de assets")
+        ruta = manifiesto.ruta(entrada)
+        if not cache_disco.activo:
+            return self.scale_image(self._pil_to_pygame(Image.open(ruta)), ancho, alto)
+        imagen = cache_disco.cargar(ruta, entrada.huella, (ancho, alto), REMUESTREO)
+        if imagen is None:
+            with open(ruta, "rb") as f:
+                datos = f.read()
+            imagen = self.scale_image(self._pil_to_pygame(Image.open(io.BytesIO(datos))), ancho, alto)
+            cache_disco.guardar(ruta, cache_disco.huella(datos), (ancho, alto), REMUESTREO, imagen)
+        return imagen
+
     def _pil_to_pygame(self, pil_image: Image.Image) -> pygame.Surface:
         """
         Convierte una imagen PIL a superficie de Pygame.
@@ -151,81 +310,267 @@ class AssetManager:
         surface.fill(color)
         return surface
 
-    def _create_asset_structure(self):
+    def liberar(self):
         """
-        Crea la estructura de carpetas necesaria para los recursos.
+        Devuelve al registro compartido las imágenes de este gestor.
         
-        Genera directorios para diferentes categorías de juego si no existen.
-        Incluye categorías predeterminadas como granja, bosque, ciudad, etc.
+        Las imágenes siguen en el registro hasta que haga falta espacio, así que
+        un gestor nuevo de la misma categoría no vuelve a decodificarlas. Se puede
+        llamar más de una vez.
         """
-        # Crear directorio principal de assets si no existe
-        assets_dir = os.path.join(self.base_path, "assets")
-        os.makedirs(assets_dir, exist_ok=True)
+        for clave in self._claves_registro:
+            registro_assets.liberar(clave)
+        self._claves_registro.clear()
+        self._claves_atlas.clear()
+        self.images.clear()
+        self.originales.clear()
+        self.cache.clear()
+        self.mipmaps.clear()
+
+    def _firma_pantalla(self) -> Optional[tuple]:
+        """Devuelve una firma del formato de pixel de la pantalla actual, o None si no hay pantalla."""
+        pantalla = pygame.display.get_surface()
+        if pantalla is None:
+            return None
+        return (pantalla.get_bitsize(), pantalla.get_masks(), pantalla.get_size())
 
-        # Crear directorios para cada categoría
-        categorias = ["granja", "bosque", "ciudad", "espacio", "marte"]
-        for cat in categorias:
-            cat_path = os.path.join(assets_dir, cat)
-            if not os.path.exists(cat_path):
-                os.makedirs(cat_path)
-                print(f"Creando directorio: {cat_path}")
-                self._create_default_images(cat_path)
+    def _convertir(self, surface: pygame.Surface) -> pygame.Surface:
+        """Convierte una superficie al formato de la pantalla, conservando la transparencia."""
+        if surface.get_flags() & pygame.SRCALPHA:
+            return surface.convert_alpha()
+        return surface.convert()
 
-    def _create_default_images(self, categoria_path: str):
+    def asegurar_formato_pantalla(self) -> bool:
         """
-        Crea imágenes por defecto para una categoría específica.
+        Convierte las imágenes al formato de la pantalla actual si hace falta.
         
-        Args:
-            categoria_path (str): Ruta del directorio de la categoría.
+        Un blit entre superficies con distinto formato convierte cada pixel en cada
+        cuadro; convirtiendo una vez se evita ese costo. Si no hay pantalla todavía
+        no hace nada, y si el modo de video cambió vuelve a convertir desde las
+        imágenes originales.
         
-        Genera imágenes de player, obstacle y background con colores predeterminados
-        si no existen en el directorio.
+        Returns:
+            bool: True si las imágenes se (re)convirtieron en esta llamada.
         """
-        print(f"Creando imágenes por defecto en: {categoria_path}")
-        for name, size, color in [
-            ("player", (50, 50), (0, 255, 0)),      # Verde
-            ("obstacle", (50, 30), (255, 0, 0)),    # Rojo
-            ("background", (800, 600), (100, 100, 255))  # Azul claro
-        ]:
-            try:
-                image_path = os.path.join(categoria_path, f"{name}.png")
-                if not os.path.exists(image_path):
-                    image = Image.new('RGB', size, color)
-                    image.save(image_path)
-                    print(f"Creada imagen: {image_path}")
-            except Exception as e:
-                print(f"Error creando imagen {name}: {e}")
+        firma = self._firma_pantalla()
+        if firma is None or firma == self._formato_pantalla:
+            return False
+        self.images = {nombre: self._convertir(img) for nombre, img in self.originales.items()
+                       if nombre not in self._claves_atlas}
+        if self._claves_atlas:
+            # El atlas se convierte una sola vez para todos los gestores
+            self._atlas.asegurar_formato_pantalla()
+            for nombre, clave in self._claves_atlas.items():
+                self.images[nombre] = self._atlas.sprite(clave)
+        self.cache.clear()
+        self.mipmaps.clear()
+        # La conversión conserva el alfa: solo se descartan las máscaras de la caché
+        self.mascaras = {n: m for n, m in self.mascaras.items() if n in self.originales}
+        self._formato_pantalla = firma
+        return True
 
-    def get_scaled_image(self, image_name: str, scale_factor: float) -> pygame.Surface:
+    def get_scaled_image(self, image_name: str, scale_factor: float, calidad: str = "alta") -> pygame.Surface:
         """
         Obtiene una imagen escalada por un factor específico.
         
-        Utiliza un sistema de caché para almacenar imágenes escaladas previamente.
+        El factor se redondea a la cubeta más cercana (1/8 de octava, menos de un
+        5% de diferencia), así que un factor que varía de forma continua reutiliza
+        los mismos resultados. Cada resultado parte del nivel de mipmap más chico
+        que todavía sea mayor o igual al tamaño pedido, de modo que el escalado
+        final, barato, reduce como mucho a la mitad. La caché es LRU y nunca
+        supera MAX_IMAGENES_ESCALADAS imágenes.
         
         Args:
             image_name (str): Nombre de la imagen a escalar.
             scale_factor (float): Factor de escala (1.0 = tamaño original).
+            calidad (str, opcional): "alta" y "media" terminan con smoothscale,
+                "baja" con vecino más cercano. Los niveles siempre se generan con LANCZOS.
         
         Returns:
-            pygame.Surface: Imagen escalada.
+            pygame.Surface: Imagen escalada; es compartida y no debe modificarse.
         
         Raises:
             KeyError: Si la imagen no existe en el gestor de recursos.
+            ValueError: Si el factor no es positivo o la calidad es desconocida.
         """
-        cache_key = f"{image_name}_{scale_factor}"
-        if cache_key in self.cache:
-            return self.cache[cache_key]
+        if scale_factor <= 0:
+            raise ValueError(f"Factor de escala inválido: {scale_factor}")
+        if calidad not in FILTROS_CALIDAD:
+            raise ValueError(f"Calidad de escalado desconocida: {calidad}")
+        cubeta = round(math.log2(scale_factor) * CUBETAS_POR_OCTAVA)
+        cache_key = f"{image_name}_{cubeta}" if calidad == "alta" else f"{image_name}_{cubeta}_{calidad}"
+        scaled = self.cache.get(cache_key)
+        if scaled is not None:
+            self.cache.move_to_end(cache_key)
+            return scaled
 
-        original = self.images.get(image_name)
-        if original is None:
-            raise KeyError(f"Image {image_name} not found")
+        niveles = self._niveles_mipmap(image_name)
+        factor = 2.0 ** (cubeta / CUBETAS_POR_OCTAVA)
+        ancho, alto = niveles[0].get_size()
+        size = (max(1, int(ancho * factor)), max(1, int(alto * factor)))
+        base = niveles[0]
+        for nivel in niveles[1:]:
+            if nivel.get_width() < size[0] or nivel.get_height() < size[1]:
+                break
+            base = nivel
+        if base.get_size() == size:
+            scaled = base
+        elif calidad == "baja" or base.get_bitsize() not in (24, 32):
+            scaled = pygame.transform.scale(base, size)
+        else:
+            scaled = pygame.transform.smoothscale(base, size)
 
-        new_width = int(original.get_width() * scale_factor)
-        new_height = int(original.get_height() * scale_factor)
-        scaled = self.scale_image(original, new_width, new_height)
         self.cache[cache_key] = scaled
+        if image_name in self.mascaras:
+            self.mascaras[cache_key] = pygame.mask.from_surface(scaled)
+        while len(self.cache) > MAX_IMAGENES_ESCALADAS:
+            expulsada, _ = self.cache.popitem(last=False)
+            self.mascaras.pop(expulsada, None)
         return scaled
 
+    def _niveles_mipmap(self, image_name: str) -> List[pygame.Surface]:
+        """
+        Devuelve los niveles de mipmap de una imagen, generándolos la primera vez.
+        
+        Cada nivel se obtiene del anterior con LANCZOS a la mitad de tamaño, hasta
+        llegar a 1 pixel de lado; en total ocupan un tercio más que la imagen.
+        
+        Raises:
+            KeyError: Si la imagen no existe en el gestor de recursos.
+        """
+        niveles = self.mipmaps.get(image_name)
+        if niveles is not None:
+            return niveles
+        imagen = self.images.get(image_name)
+        if imagen is None:
+            raise KeyError(f"Image {image_name} not found")
+        niveles = [imagen]
+        actual = self.originales.get(image_name, imagen)
+        ancho, alto = actual.get_size()
+        while ancho > 1 or alto > 1:
+            ancho, alto = max(1, ancho // 2), max(1, alto // 2)
+            actual = self.scale_image(actual, ancho, alto, force_aspect_ratio=False)
+            niveles.append(self._convertir(actual) if self._formato_pantalla is not None else actual)
+        self.mipmaps[image_name] = niveles
+        return niveles
+
+    def obtener_mascara(self, nombre: str) -> pygame.mask.Mask:
+        """
+        Obtiene la máscara de colisión de una imagen, calculándola la primera vez.
+        
+        La máscara marca los pixeles con alfa mayor a 127, así que las zonas
+        transparentes del sprite no cuentan como choque.
+        
+        Args:
+            nombre (str): Nombre de la imagen en `images` o clave de la caché de escalado.
+        
+        Returns:
+            pygame.mask.Mask: Máscara del tamaño de la imagen.
+        
+        Raises:
+            KeyError: Si la imagen no existe en el gestor de recursos.
+        """
+        mascara = self.mascaras.get(nombre)
+        if mascara is None:
+            imagen = self.originales.get(nombre) or self.images.get(nombre) or self.cache.get(nombre)
+            if imagen is None:
+                raise KeyError(f"Image {nombre} not found")
+            mascara = pygame.mask.from_surface(imagen)
+            self.mascaras[nombre] = mascara
+        return mascara
+
+class PrecargaAssets:
+    """
+    Carga en segundo plano los recursos de una categoría antes de necesitarlos.
+    
+    La decodificación y el escalado con PIL corren en un hilo de trabajo; la
+    conversión al formato de pantalla, que toca el display, se hace en el hilo
+    principal al entregar el gestor con obtener().
+    
+    Atributos:
+        pendientes (Dict[str, Future]): Cargas solicitadas por categoría.
+    """
+    def __init__(self):
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="precarga_assets")
+        self.pendientes: Dict[str, Future] = {}
+
+    def solicitar(self, categoria: str):
+        """Inicia la carga de una categoría si no se había solicitado ya."""
+        categoria = categoria.lower()
+        if categoria not in self.pendientes:
+            self.pendientes[categoria] = self._executor.submit(AssetManager, categoria, False)
+
+    def obtener(self, categoria: str) -> AssetManager:
+        """
+        Entrega el gestor de una categoría, listo para dibujar.
+        
+        Si la carga sigue en curso espera a que termine; si nunca se solicitó, o
+        falló, carga la categoría en el hilo actual.
+        
+        Args:
+            categoria (str): Categoría a entregar.
+        
+        Returns:
+            AssetManager: Gestor con las imágenes en formato de pantalla.
+        """
+        futuro = self.pendientes.pop(categoria.lower(), None)
+        assets = None
+        if futuro is not None:
+            try:
+                assets = futuro.result()
+            except Exception as e:
+                print(f"Error en la precarga de {categoria}: {e}")
+        if assets is None:
+            return AssetManager(categoria)
+        assets.asegurar_formato_pantalla()
+        return assets
+
+    def cerrar(self):
+        """Cancela las cargas pendientes, libera las que ya terminaron y el hilo de trabajo."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        for futuro in self.pendientes.values():
+            futuro.add_done_callback(_liberar_precarga)
+        self.pendientes.clear()
+
+def _liberar_precarga(futuro: Future):
+    """Devuelve al registro las imágenes de una precarga que nadie llegó a usar."""
+    if not futuro.cancelled() and futuro.exception() is None:
+        futuro.result().liberar()
+
+def precalentar_categorias(categorias: List[str], hilos: Optional[int] = None) -> float:
+    """
+    Decodifica y escala en paralelo los recursos de varias categorías y los deja en el registro.
+    
+    Cada categoría se carga en su propio hilo; PIL suelta el GIL al decodificar
+    y remuestrear, así que las cargas avanzan a la vez. Las imágenes quedan en el
+    registro compartido sin referencias, de modo que los cambios de categoría
+    posteriores las toman de ahí sin decodificar. Al final carga (o construye,
+    ya con las imágenes en el registro) el atlas de sprites.
+    
+    Args:
+        categorias (List[str]): Categorías a cargar.
+        hilos (int, opcional): Hilos de trabajo. Por defecto uno por categoría.
+    
+    Returns:
+        float: Segundos de reloj que tardó el precalentamiento.
+    """
+    inicio_carga = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=hilos or len(categorias),
+                            thread_name_prefix="precalentar_assets") as executor:
+        futuros = {
+            categoria: executor.submit(AssetManager, categoria, False, False) for categoria in categorias
+        }
+        for categoria, futuro in futuros.items():
+            try:
+                futuro.result().liberar()
+            except Exception as e:
+                print(f"Error precalentando {categoria}: {e}")
+    try:
+        atlas_compartido()
+    except (pygame.error, OSError) as e:
+        print(f"No se pudo cargar el atlas de sprites: {e}")
+    return time.perf_counter() - inicio_carga
+
 def inicio(categoria: str = None):
     """
     Función de inicio para verificar y crear recursos.
@@ -0,0 +1,242 @@
+import argparse
+import json
+import os
+import threading
+import pygame
+from typing import Dict, Optional, Tuple
+from Modulo_CacheAssets import escribir_blob, leer_blob
+from Modulo_Manifiesto import CATEGORIAS, PREFIJO_COMUN, EntradaAsset, ManifiestoAssets, manifiesto_compartido
+
+
+BASE_PATH = os.path.dirname(os.path.abspath(__file__))
+ASSETS_PATH = os.path.join(BASE_PATH, "assets")
+# Pixeles crudos con la cabecera de los blobs de la caché de assets: se cargan
+# con mmap sin decodificar, que con el PNG era casi todo el tiempo de carga
+RUTA_ATLAS = os.path.join(ASSETS_PATH, ".cache", "atlas.rgba")
+RUTA_INDICE = os.path.join(ASSETS_PATH, ".cache", "atlas.json")
+VERSION_INDICE = 3
+
+# Sprites de cada categoría que van al atlas, con la caja a la que se escalan.
+# Las imágenes sueltas de assets/*.png van con su tamaño original y el prefijo PREFIJO_COMUN.
+SPRITES_CATEGORIA = {"player": (50, 50), "obstacle": (50, 30)}
+
+def fuentes_atlas(manifiesto: ManifiestoAssets) -> Dict[str, Tuple[EntradaAsset, Optional[Tuple[int, int]]]]:
+    """
+    Lista los sprites que se empaquetan en el atlas según el manifiesto de assets.
+
+    Returns:
+        Dict[str, Tuple[EntradaAsset, Tuple[int, int]]]: Por clave ("granja/player",
+            "comun/roca"), la entrada del PNG y la caja de escalado (None = tamaño original).
+    """
+    fuentes = {}
+    for categoria in CATEGORIAS:
+        for nombre, caja in SPRITES_CATEGORIA.items():
+            entrada = manifiesto.entrada(categoria, f"{nombre}.png")
+            if entrada is not None:
+                fuentes[f"{categoria}/{nombre}"] = (entrada, caja)
+    for archivo, entrada in sorted(manifiesto.categorias.get(PREFIJO_COMUN, {}).items()):
+        fuentes[f"{PREFIJO_COMUN}/{os.path.splitext(archivo)[0]}"] = (entrada, None)
+    return fuentes
+
+def empaquetar(tamanos: Dict[str, Tuple[int, int]], ancho_max: int = 512,
+               margen: int = 1) -> Tuple[Dict[str, Tuple[int, int]], Tuple[int, int]]:
+    """
+    Ubica rectángulos en estantes (filas) de un lienzo de ancho acotado.
+
+    Ordena por altura descendente y llena cada fila de izquierda a derecha;
+    para sprites de tamaños parecidos desperdicia poco espacio. El margen
+    evita que un filtro de escalado mezcle pixeles de sprites vecinos.
+
+    Args:
+        tamanos (Dict[str, Tuple[int, int]]): Ancho y alto por clave.
+        ancho_max (int): Ancho máximo del lienzo.
+        margen (int): Separación entre sprites.
+
+    Returns:
+        Tuple: Posición (x, y) por clave y tamaño (ancho, alto) del lienzo.
+    """
+    posiciones = {}
+    x = y = alto_fila = ancho_usado = 0
+    for clave in sorted(tamanos, key=lambda c: (-tamanos[c][1], c)):
+        w, h = tamanos[clave]
+        if x and x + w > ancho_max:
+            y += alto_fila + margen
+            x = alto_fila = 0
+        posiciones[clave] = (x, y)
+        x += w + margen
+        alto_fila = max(alto_fila, h)
+        ancho_usado = max(ancho_usado, x - margen)
+    return posiciones, (max(1, ancho_usado), max(1, y + alto_fila))
+
+class AtlasSprites:
+    """
+    Atlas de texturas: todos los sprites del juego en una sola superficie.
+
+    Los gestores de assets entregan subsuperficies del atlas en lugar de una
+    superficie por sprite, y todos los sprites de todas las categorías se
+    cargan con un solo archivo de pixeles crudos, mapeado en memoria. El atlas se convierte al formato
+    de la pantalla una única vez y las subsuperficies se toman de esa copia.
+
+    Atributos:
+        superficie (pygame.Surface): Atlas en formato RGBA.
+        rects (Dict[str, pygame.Rect]): Ubicación de cada sprite por clave.
+    """
+    def __init__(self, superficie: pygame.Surface, rects: Dict[str, pygame.Rect]):
+        self.superficie = superficie
+        self.rects = rects
+        self._convertida: Optional[pygame.Surface] = None
+        self._formato_pantalla: Optional[tuple] = None
+
+    def __contains__(self, clave: str) -> bool:
+        return clave in self.rects
+
+    def original(self, clave: str) -> pygame.Surface:
+        """Subsuperficie del sprite en el atlas sin convertir."""
+        return self.superficie.subsurface(self.rects[clave])
+
+    def sprite(self, clave: str) -> pygame.Surface:
+        """
+        Subsuperficie del sprite, en el formato de la pantalla si ya se convirtió el atlas.
+
+        Raises:
+            KeyError: Si el sprite no está en el atlas.
+        """
+        return (self._convertida or self.superficie).subsurface(self.rects[clave])
+
+    def asegurar_formato_pantalla(self) -> bool:
+        """
+        Convierte el atlas al formato de la pantalla si cambió. Solo desde el hilo principal.
+
+        Returns:
+            bool: True si se convirtió en esta llamada.
+        """
+        pantalla = pygame.display.get_surface()
+        if pantalla is None:
+            return False
+        firma = (pantalla.get_bitsize(), pantalla.get_masks(), pantalla.get_size())
+        if firma == self._formato_pantalla:
+            return False
+        self._convertida = self.superficie.convert_alpha()
+        self._formato_pantalla = firma
+        return True
+
+    def guardar(self, ruta_atlas: str, ruta_indice: str, origenes: Dict[str, dict]):
+        """Escribe los pixeles del atlas como blob crudo y su índice JSON."""
+        escribir_blob(ruta_atlas, self.superficie)
+        indice = {
+            "version": VERSION_INDICE,
+            "tamano": list(self.superficie.get_size()),
+            "sprites": {
+                clave: dict(origenes[clave], rect=list(rect)) for clave, rect in sorted(self.rects.items())
+            },
+        }
+        temporal = ruta_indice + ".tmp"
+        with open(temporal, "w") as f:
+            json.dump(indice, f, indent=2)
+        os.replace(temporal, ruta_indice)
+
+    @classmethod
+    def cargar(cls, manifiesto: ManifiestoAssets, ruta_atlas: str = RUTA_ATLAS,
+               ruta_indice: str = RUTA_INDICE) -> Optional["AtlasSprites"]:
+        """
+        Lee un atlas guardado si sigue al día con sus archivos de origen.
+
+        Compara las fuentes y el hash de cada PNG según el manifiesto con los
+        del índice, sin leer los PNG.
+
+        Returns:
+            AtlasSprites, opcional: El atlas, o None si falta, está dañado o quedó obsoleto.
+        """
+        try:
+            with open(ruta_indice) as f:
+                indice = json.load(f)
+            if indice.get("version") != VERSION_INDICE:
+                return None
+            sprites = indice["sprites"]
+            fuentes = fuentes_atlas(manifiesto)
+            if set(sprites) != set(fuentes):
+                return None
+            for clave, (entrada, caja) in fuentes.items():
+                datos = sprites[clave]
+                if datos["huella"] != entrada.huella or datos["caja"] != (list(caja) if caja else None):
+                    return None
+            superficie = leer_blob(ruta_atlas)
+            if list(superficie.get_size()) != indice["tamano"]:
+                return None
+        except (OSError, ValueError, KeyError, pygame.error):
+            return None
+        return cls(superficie, {clave: pygame.Rect(datos["rect"]) for clave, datos in sprites.items()})
+
+def construir_atlas(manifiesto: Optional[ManifiestoAssets] = None, ruta_atlas: str = RUTA_ATLAS,
+                    ruta_indice: str = RUTA_INDICE, ancho_max: int = 512) -> AtlasSprites:
+    """
+    Escala todos los sprites, los empaqueta en un atlas y lo guarda con su índice.
+
+    Los sprites de categoría pasan por el mismo escalado que AssetManager, así
+    que el atlas tiene exactamente los mismos pixeles.
+
+    Args:
+        manifiesto (ManifiestoAssets, opcional): Archivos de origen. Por defecto
+            el manifiesto compartido.
+
+    Returns:
+        AtlasSprites: El atlas construido.
+    """
+    from Modulo_Assets import AssetManager
+
+    manifiesto = manifiesto or manifiesto_compartido()
+    fuentes = fuentes_atlas(manifiesto)
+    imagenes = {}
+    for categoria in CATEGORIAS:
+        if not any(c.startswith(f"{categoria}/") for c in fuentes):
+            continue
+        gestor = AssetManager(categoria, convertir=False, usar_atlas=False)
+        for nombre in SPRITES_CATEGORIA:
+            if f"{categoria}/{nombre}" in fuentes:
+                imagenes[f"{categoria}/{nombre}"] = gestor.originales[nombre]
+        gestor.liberar()
+    for clave, (entrada, caja) in fuentes.items():
+        if caja is None:
+            imagenes[clave] = pygame.image.load(manifiesto.ruta(entrada))
+
+    posiciones, tamano = empaquetar({c: img.get_size() for c, img in imagenes.items()}, ancho_max)
+    superficie = pygame.Surface(tamano, pygame.SRCALPHA, 32)
+    rects = {}
+    for clave, imagen in imagenes.items():
+        # BLEND_RGBA_MAX sobre el lienzo transparente copia los pixeles sin mezclarlos
+        rects[clave] = superficie.blit(imagen, posiciones[clave], special_flags=pygame.BLEND_RGBA_MAX)
+    origenes = {
+        clave: {"origen": entrada.ruta, "huella": entrada.huella, "caja": list(caja) if caja else None}
+        for clave, (entrada, caja) in fuentes.items()
+    }
+    atlas = AtlasSprites(superficie, rects)
+    atlas.guardar(ruta_atlas, ruta_indice, origenes)
+    return atlas
+
+_atlas: Optional[AtlasSprites] = None
+_candado = threading.Lock()
+
+def atlas_compartido() -> AtlasSprites:
+    """
+    Devuelve el atlas del proceso, cargándolo o construyéndolo la primera vez.
+
+    Si el atlas guardado falta o quedó obsoleto se reconstruye en el momento.
+    """
+    global _atlas
+    with _candado:
+        if _atlas is None:
+            manifiesto = manifiesto_compartido()
+            _atlas = AtlasSprites.cargar(manifiesto) or construir_atlas(manifiesto)
+        return _atlas
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Construye el atlas de sprites")
+    parser.add_argument("--ancho-max", type=int, default=512)
+    args = parser.parse_args(argv)
+    pygame.init()
+    atlas = construir_atlas(ancho_max=args.ancho_max)
+    ancho, alto = atlas.superficie.get_size()
+    print(f"Atlas de {ancho}x{alto} con {len(atlas.rects)} sprites en {RUTA_ATLAS}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,987 @@
+import argparse
+import ctypes
+import gc
+import math
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+import numpy as np
+import pygame
+from typing import Dict
+from PIL import Image
+from Modulo_Assets import MAX_IMAGENES_ESCALADAS, AssetManager, precalentar_categorias
+from Modulo_Atlas import SPRITES_CATEGORIA, AtlasSprites, construir_atlas
+from Modulo_CacheAssets import cache_disco
+from Modulo_Manifiesto import ManifiestoAssets, manifiesto_compartido
+from Modulo_RegistroAssets import registro_assets
+from Modulo_Juego import CATEGORIA_PROGRESSION, GameConfig, JuegoMejorado
+from Modulo_Repeticion import GrabadorPartida, RegistroPartida, reproducir
+from Modulo_ArbolCompacto import ArbolCompacto
+from Modulo_ArbolPesos import ArbolPesos
+from Modulo_MuestreoPesos import MuestreadorPesos, peso_de_muestreo
+from Modulo_creacionDelArbol import Pregunta, construir_arbol_balanceado, obtener_pregunta_aleatoria
+from Modulo_EstructuraArbol import obtener_pregunta_por_dificultad
+from Modulo_SeleccionPreguntas import ConfiguracionPartida, SelectorPreguntas
+from Modulo_Simulacion import EntradaAleatoria, crear_juego_headless, responder_siempre
+
+
+FASES_LOGICA = [
+    "handle_player_movement",
+    "update_obstacles",
+    "check_collisions",
+    "check_category_progression",
+]
+
+def _preparar_juego(categoria: str, semilla: int, max_obstaculos: int = None):
+    """Crea un juego headless y, si se pide, lo llena con más obstáculos de lo normal."""
+    juego = crear_juego_headless(categoria, semilla)
+    if max_obstaculos:
+        juego.config.MAX_OBSTACLE_COUNT = max_obstaculos
+        juego.config.INITIAL_OBSTACLE_COUNT = max_obstaculos
+        juego.config.OBSTACLE_SPAWN_DELAY = 1
+        juego.current_obstacle_count = max_obstaculos
+        juego.obstacles.reservar(max_obstaculos)
+        while len(juego.obstacles) < max_obstaculos:
+            juego.spawn_obstacle(random_position=True)
+    return juego
+
+def benchmark_simulacion(ticks: int = 10000, categoria: str = "granja", semilla: int = 0,
+                         max_obstaculos: int = None) -> Dict[str, float]:
+    """
+    Ejecuta la lógica del juego sin ventana tan rápido como permita la CPU.
+
+    Las colisiones se cuentan pero no restan vidas, para que la carga sea estable
+    durante toda la medición.
+
+    Args:
+        ticks (int): Número de ticks a simular.
+        categoria (str): Categoría inicial.
+        semilla (int): Semilla de la partida.
+        max_obstaculos (int, opcional): Sobrescribe la cantidad de obstáculos en pantalla.
+
+    Returns:
+        Dict[str, float]: Ticks por segundo, colisiones y microsegundos por tick de cada fase.
+    """
+    juego = _preparar_juego(categoria, semilla, max_obstaculos)
+
+    fases = [(nombre, getattr(juego, nombre)) for nombre in FASES_LOGICA]
+    acumulado = {nombre: 0.0 for nombre in FASES_LOGICA}
+    colisiones = 0
+    reloj = time.perf_counter
+
+    inicio = reloj()
+    for _ in range(ticks):
+        for nombre, fase in fases:
+            t0 = reloj()
+            resultado = fase()
+            acumulado[nombre] += reloj() - t0
+            if nombre == "check_collisions" and resultado:
+                colisiones += 1
+    total = reloj() - inicio
+    juego.cleanup()
+
+    resultados = {"ticks_por_segundo": ticks / total, "colisiones": colisiones}
+    for nombre, segundos in acumulado.items():
+        resultados[f"{nombre}_us"] = segundos / ticks * 1e6
+    return resultados
+
+def benchmark_render(cuadros: int = 600, categoria: str = "granja", semilla: int = 0,
+                     max_obstaculos: int = None) -> Dict[str, float]:
+    """
+    Compara el tiempo de draw() redibujando la pantalla completa y con dirty rects.
+
+    Ambos modos simulan la misma partida (misma semilla). Con el driver "dummy"
+    flip()/update() no llegan a una pantalla real, así que la medición refleja
+    el trabajo de blit, que es el que cambia entre modos.
+
+    Args:
+        cuadros (int): Número de cuadros a dibujar por modo.
+        categoria (str): Categoría inicial.
+        semilla (int): Semilla de la partida.
+        max_obstaculos (int, opcional): Sobrescribe la cantidad de obstáculos en pantalla.
+
+    Returns:
+        Dict[str, float]: Milisegundos promedio por cuadro de cada modo y la aceleración.
+    """
+    resultados = {}
+    for modo, sucio in (("completo", False), ("dirty_rects", True)):
+        juego = _preparar_juego(categoria, semilla, max_obstaculos)
+        juego.config.DIRTY_RECTS = sucio
+        total = 0.0
+        for _ in range(cuadros):
+            juego.handle_player_movement()
+            juego.update_obstacles()
+            juego.check_category_progression()
+            t0 = time.perf_counter()
+            juego.draw()
+            total += time.perf_counter() - t0
+        juego.cleanup()
+        resultados[f"{modo}_ms"] = total / cuadros * 1e3
+    resultados["aceleracion"] = resultados["completo_ms"] / resultados["dirty_rects_ms"]
+    return resultados
+
+def benchmark_blits(sprites: int = 1000, repeticiones: int = 50,
+                    categoria: str = "granja") -> Dict[str, float]:
+    """
+    Mide el rendimiento de blit de la capa de obstáculos.
+
+    Compara la imagen sin convertir dibujada de a una (el camino anterior), la
+    imagen en formato de pantalla dibujada de a una y la misma imagen con un
+    único Surface.blits por capa.
+
+    Args:
+        sprites (int): Obstáculos por capa.
+        repeticiones (int): Veces que se dibuja la capa en cada caso.
+        categoria (str): Categoría de la que se toma la imagen del obstáculo.
+
+    Returns:
+        Dict[str, float]: Miles de blits por segundo de cada caso.
+    """
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    pygame.init()
+    pantalla = pygame.display.set_mode((800, 600))
+    assets = AssetManager(categoria)
+    rng = random.Random(0)
+    posiciones = [(rng.randint(0, 750), rng.randint(0, 570)) for _ in range(sprites)]
+
+    def individual(imagen):
+        for pos in posiciones:
+            pantalla.blit(imagen, pos)
+
+    def lote(imagen):
+        pantalla.blits([(imagen, pos) for pos in posiciones], doreturn=False)
+
+    casos = [
+        ("sin_convertir_individual", individual, assets.originales["obstacle"]),
+        ("convertida_individual", individual, assets.images["obstacle"]),
+        ("convertida_blits", lote, assets.images["obstacle"]),
+    ]
+    resultados = {}
+    for nombre, dibujar, imagen in casos:
+        inicio = time.perf_counter()
+        for _ in range(repeticiones):
+            dibujar(imagen)
+        total = time.perf_counter() - inicio
+        resultados[f"{nombre}_kblits_s"] = sprites * repeticiones / total / 1e3
+    pygame.quit()
+    return resultados
+
+def benchmark_carga(repeticiones: int = 5) -> Dict[str, float]:
+    """
+    Mide la carga de las cinco categorías con y sin la caché de assets en disco.
+
+    "sin_cache" decodifica y escala los PNG como siempre; "cache_fria" además
+    escribe los blobs; "cache_caliente" los lee con mmap. Que los pixeles
+    coincidan lo verifica tests/test_assets.py.
+
+    Args:
+        repeticiones (int): Cargas completas por caso; se informa la mejor.
+
+    Returns:
+        Dict[str, float]: Milisegundos por carga completa de cada caso.
+    """
+    if not pygame.get_init():
+        pygame.init()
+    activo = cache_disco.activo
+
+    def cargar_todas():
+        # Sin el registro compartido ni el atlas, para medir solo el camino de disco
+        registro_assets.vaciar()
+        for categoria in CATEGORIA_PROGRESSION:
+            AssetManager(categoria, convertir=False, usar_atlas=False).liberar()
+
+    def medir(n):
+        mejor = float("inf")
+        for _ in range(n):
+            inicio = time.perf_counter()
+            cargar_todas()
+            mejor = min(mejor, time.perf_counter() - inicio)
+        return mejor * 1e3
+
+    resultados = {}
+    try:
+        cache_disco.activo = False
+        resultados["sin_cache_ms"] = medir(repeticiones)
+        cache_disco.activo = True
+        cache_disco.vaciar()
+        resultados["cache_fria_ms"] = medir(1)
+        resultados["cache_caliente_ms"] = medir(repeticiones)
+    finally:
+        cache_disco.activo = activo
+    resultados["aceleracion"] = resultados["sin_cache_ms"] / resultados["cache_caliente_ms"]
+    return resultados
+
+def benchmark_atlas(repeticiones: int = 20) -> Dict[str, float]:
+    """
+    Compara la carga de los sprites de las cinco categorías por separado y desde el atlas.
+
+    Cada camino se mide sin nada en memoria (registro vacío, sin atlas del
+    proceso) en dos estados:
+
+    - "frio": sin cachés en disco. Los separados decodifican y escalan cada
+      PNG; el atlas se construye desde los PNG, como en el primer arranque.
+    - "cache": con lo que deja en disco la primera carga. Los separados leen
+      los blobs de la caché de assets; el atlas lee su archivo y su índice.
+
+    El atlas además trae los sprites sueltos de assets/. Que los pixeles
+    coincidan lo verifica tests/test_atlas.py.
+
+    Args:
+        repeticiones (int): Cargas completas por caso; se informa la mejor.
+
+    Returns:
+        Dict[str, float]: Milisegundos por carga de cada caso, archivos leídos y
+            aceleración del atlas en cada estado.
+    """
+    if not pygame.get_init():
+        pygame.init()
+    manifiesto = manifiesto_compartido()
+    activo = cache_disco.activo
+
+    def separados():
+        registro_assets.vaciar()
+        sprites = {}
+        for categoria in CATEGORIA_PROGRESSION:
+            gestor = AssetManager(categoria, convertir=False, usar_atlas=False)
+            for nombre in SPRITES_CATEGORIA:
+                sprites[f"{categoria}/{nombre}"] = gestor.originales[nombre].copy()
+            gestor.liberar()
+        return sprites
+
+    def medir(cargar, n=repeticiones):
+        mejor = float("inf")
+        for _ in range(n):
+            inicio = time.perf_counter()
+            sprites = cargar()
+            mejor = min(mejor, time.perf_counter() - inicio)
+        return mejor * 1e3, sprites
+
+    resultados = {}
+    with tempfile.TemporaryDirectory() as directorio:
+        rutas = (os.path.join(directorio, "atlas.rgba"), os.path.join(directorio, "atlas.json"))
+
+        def construir():
+            registro_assets.vaciar()
+            atlas = construir_atlas(manifiesto, *rutas)
+            return {clave: atlas.original(clave) for clave in atlas.rects}
+
+        def desde_atlas():
+            atlas = AtlasSprites.cargar(manifiesto, *rutas)
+            return {clave: atlas.original(clave) for clave in atlas.rects}
+
+        try:
+            cache_disco.activo = False
+            resultados["separados_frio_ms"], referencia = medir(separados)
+            resultados["atlas_frio_ms"], _ = medir(construir, max(1, repeticiones // 4))
+            cache_disco.activo = True
+            separados()  # deja los blobs en la caché de assets
+            resultados["separados_cache_ms"], _ = medir(separados)
+            resultados["atlas_cache_ms"], sprites = medir(desde_atlas)
+        finally:
+            cache_disco.activo = activo
+            registro_assets.vaciar()
+    resultados["archivos_separados"] = len(referencia)
+    resultados["archivos_atlas"] = 2
+    resultados["sprites_en_atlas"] = len(sprites)
+    resultados["aceleracion_frio"] = resultados["separados_frio_ms"] / resultados["atlas_frio_ms"]
+    resultados["aceleracion_cache"] = resultados["separados_cache_ms"] / resultados["atlas_cache_ms"]
+    return resultados
+
+def benchmark_arranque(repeticiones: int = 3) -> Dict[str, float]:
+    """
+    Mide el precalentamiento de las cinco categorías con un hilo y con uno por categoría.
+
+    Cada caso parte del registro vacío y se mide sin la caché en disco
+    (decodificando los PNG) y con ella caliente. Después del último
+    precalentamiento mide los cambios de categoría, que deberían salir del
+    registro sin decodificar nada.
+
+    Args:
+        repeticiones (int): Precalentamientos por caso; se informa el mejor.
+
+    Returns:
+        Dict[str, float]: Milisegundos de reloj de cada caso, aciertos y fallos
+            del registro en los cambios de categoría y tiempo por cambio.
+    """
+    if not pygame.get_init():
+        pygame.init()
+    activo = cache_disco.activo
+
+    def medir(hilos):
+        mejor = float("inf")
+        for _ in range(repeticiones):
+            registro_assets.vaciar()
+            mejor = min(mejor, precalentar_categorias(CATEGORIA_PROGRESSION, hilos))
+        return mejor * 1e3
+
+    resultados = {}
+    try:
+        cache_disco.activo = False
+        resultados["sin_cache_secuencial_ms"] = medir(1)
+        resultados["sin_cache_paralelo_ms"] = medir(None)
+        cache_disco.activo = True
+        medir(1)  # llena la caché en disco
+        resultados["cache_secuencial_ms"] = medir(1)
+        resultados["cache_paralelo_ms"] = medir(None)
+    finally:
+        cache_disco.activo = activo
+    resultados["aceleracion_sin_cache"] = resultados["sin_cache_secuencial_ms"] / resultados["sin_cache_paralelo_ms"]
+
+    registro_assets.aciertos = registro_assets.fallos = 0
+    inicio = time.perf_counter()
+    for categoria in CATEGORIA_PROGRESSION:
+        AssetManager(categoria, convertir=False).liberar()
+    resultados["cambio_categoria_ms"] = (time.perf_counter() - inicio) * 1e3 / len(CATEGORIA_PROGRESSION)
+    resultados["aciertos_registro"] = registro_assets.aciertos
+    resultados["fallos_registro"] = registro_assets.fallos
+    return resultados
+
+# Eventos de auditoría del sistema de archivos contados por benchmark_manifiesto
+EVENTOS_ARCHIVOS = ("open", "os.listdir", "os.scandir", "os.mkdir")
+_eventos_archivos = None
+
+def _contar_eventos(evento, argumentos):
+    if _eventos_archivos is not None and evento in EVENTOS_ARCHIVOS:
+        _eventos_archivos[evento] = _eventos_archivos.get(evento, 0) + 1
+
+def benchmark_manifiesto(repeticiones: int = 20) -> Dict[str, float]:
+    """
+    Mide el manifiesto de assets y las operaciones de archivos de un cambio de categoría.
+
+    Cuenta con un hook de auditoría las aperturas de archivos y listados de
+    carpetas al crear el gestor de cada categoría con el registro vacío y la
+    caché en disco caliente: con el manifiesto ya leído, cada imagen debería
+    abrir solo su blob.
+
+    Args:
+        repeticiones (int): Lecturas y validaciones medidas; se informa la mejor.
+
+    Returns:
+        Dict[str, float]: Milisegundos de lectura, reconstrucción y validación del
+            manifiesto, y eventos de archivos por categoría cargada.
+    """
+    global _eventos_archivos
+    if not pygame.get_init():
+        pygame.init()
+    manifiesto = manifiesto_compartido()
+
+    def medir(funcion, n=repeticiones):
+        mejor = float("inf")
+        for _ in range(n):
+            inicio = time.perf_counter()
+            funcion()
+            mejor = min(mejor, time.perf_counter() - inicio)
+        return mejor * 1e3
+
+    resultados = {
+        "entradas": sum(len(entradas) for entradas in manifiesto.categorias.values()),
+        "leer_ms": medir(ManifiestoAssets.leer),
+        "reconstruir_ms": medir(ManifiestoAssets.construir, 3),
+        "validar_ms": medir(manifiesto.validar, 3),
+    }
+    for categoria in CATEGORIA_PROGRESSION:
+        AssetManager(categoria, convertir=False).liberar()  # llena la caché en disco
+    sys.addaudithook(_contar_eventos)
+    registro_assets.vaciar()
+    _eventos_archivos = {}
+    for categoria in CATEGORIA_PROGRESSION:
+        AssetManager(categoria, convertir=False).liberar()
+    eventos, _eventos_archivos = _eventos_archivos, None
+    for evento in EVENTOS_ARCHIVOS:
+        resultados[f"{evento}_por_categoria"] = eventos.get(evento, 0) / len(CATEGORIA_PROGRESSION)
+    return resultados
+
+def benchmark_registro(rondas: int = 3, presupuesto_mb: float = 32.0) -> Dict[str, float]:
+    """
+    Recorre las cinco categorías varias veces como lo haría una partida.
+
+    Cada cambio crea el gestor de la categoría nueva y libera el anterior, como
+    check_category_progression(). La primera ronda carga desde disco; las
+    siguientes deberían salir del registro compartido salvo que el presupuesto
+    obligue a expulsar imágenes.
+
+    Args:
+        rondas (int): Vueltas completas por las categorías.
+        presupuesto_mb (float): Presupuesto de memoria del registro en MB.
+
+    Returns:
+        Dict[str, float]: Milisegundos por cambio en la primera ronda y en las
+            siguientes, y los contadores del registro.
+    """
+    if not pygame.get_init():
+        pygame.init()
+    presupuesto = registro_assets.presupuesto_bytes
+    registro_assets.vaciar()
+    registro_assets.presupuesto_bytes = int(presupuesto_mb * 1024 * 1024)
+    tiempos = []
+    try:
+        actual = None
+        for _ in range(rondas):
+            for categoria in CATEGORIA_PROGRESSION:
+                inicio = time.perf_counter()
+                if actual:
+                    actual.liberar()
+                actual = AssetManager(categoria, convertir=False)
+                tiempos.append(time.perf_counter() - inicio)
+        actual.liberar()
+        estadisticas = registro_assets.estadisticas()
+    finally:
+        registro_assets.presupuesto_bytes = presupuesto
+    n = len(CATEGORIA_PROGRESSION)
+    resultados = {
+        "primera_ronda_ms": sum(tiempos[:n]) / n * 1e3,
+        "rondas_siguientes_ms": sum(tiempos[n:]) / max(1, len(tiempos) - n) * 1e3,
+    }
+    resultados.update(estadisticas)
+    return resultados
+
+def benchmark_repeticion(ticks: int = 3000, categoria: str = "granja") -> Dict[str, float]:
+    """
+    Mide el tamaño y la repetición de partidas grabadas sin ventana.
+
+    Cubre la configuración por defecto, una con más obstáculos y más velocidad
+    (la grabación debe repetirse con su propia configuración, no la del juego
+    recién creado) y una semilla negativa. Que la repetición coincida lo
+    verifica tests/test_repeticion.py.
+
+    Args:
+        ticks (int): Ticks grabados por partida.
+        categoria (str): Categoría inicial.
+
+    Returns:
+        Dict[str, float]: Por caso, bytes del archivo y milisegundos de la repetición.
+    """
+    casos = {
+        "defecto": (0, GameConfig()),
+        "config": (1, GameConfig(MAX_OBSTACLE_COUNT=20, INITIAL_OBSTACLE_COUNT=12, BASE_OBSTACLE_SPEED=8)),
+        "semilla_negativa": (-5, GameConfig()),
+    }
+    resultados = {}
+    with tempfile.TemporaryDirectory() as carpeta:
+        for nombre, (semilla, config) in casos.items():
+            juego = JuegoMejorado(categoria, headless=True, semilla=semilla,
+                                  entrada=EntradaAleatoria(semilla),
+                                  responder=responder_siempre(semilla % 2 == 0), config=config)
+            grabador = GrabadorPartida(juego)
+            if juego.manejar_preguntas_inicio_categoria():
+                for _ in range(ticks):
+                    if not juego.update():
+                        break
+            ruta = os.path.join(carpeta, f"{nombre}.jgr")
+            grabador.terminar(ruta)
+            juego.cleanup()
+
+            inicio = time.perf_counter()
+            reproducir(RegistroPartida.cargar(ruta))
+            resultados[f"{nombre}_repetir_ms"] = (time.perf_counter() - inicio) * 1e3
+            resultados[f"{nombre}_bytes"] = os.path.getsize(ruta)
+    return resultados
+
+def _leer_kb_estado(campo: str) -> int:
+    """Lee un campo en kB de /proc/self/status (p. ej. "VmRSS")."""
+    with open("/proc/self/status") as f:
+        for linea in f:
+            if linea.startswith(campo + ":"):
+                return int(linea.split()[1])
+    raise KeyError(campo)
+
+def _pico_rss_kb(funcion) -> float:
+    """
+    Memoria residente máxima que agrega una llamada, en KB, contando PIL y SDL.
+
+    Reinicia el máximo de RSS del proceso (VmHWM) antes de llamar. Para que los
+    buffers no reutilicen memoria que ya estaba residente, fija el umbral de
+    mmap de glibc en 64 KB y devuelve al sistema la memoria libre antes de
+    medir. Solo funciona en Linux con glibc; en otros sistemas devuelve NaN.
+    """
+    try:
+        libc = ctypes.CDLL("libc.so.6")
+        libc.mallopt(-3, 65536)  # M_MMAP_THRESHOLD
+        gc.collect()
+        libc.malloc_trim(0)
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        base = _leer_kb_estado("VmRSS")
+    except OSError:
+        return float("nan")
+    resultado = funcion()
+    pico = _leer_kb_estado("VmHWM") - base
+    del resultado
+    return float(pico)
+
+def _escalar_con_copias(surface: pygame.Surface, size) -> pygame.Surface:
+    """Camino de escalado anterior: cuatro copias completas del buffer por llamada."""
+    datos = pygame.image.tostring(surface, "RGBA")
+    imagen = Image.frombytes("RGBA", surface.get_size(), datos)
+    imagen = imagen.resize(size, Image.Resampling.LANCZOS)
+    return pygame.image.fromstring(imagen.tobytes(), imagen.size, imagen.mode)
+
+def benchmark_escalado(repeticiones: int = 20, categoria: str = "granja") -> Dict[str, float]:
+    """
+    Compara tiempo y memoria pico de scale_image con el camino anterior por copias.
+
+    Escala el PNG original del fondo y del obstáculo a su tamaño de juego. La
+    memoria pico es el RSS máximo que agrega la llamada, así que incluye los
+    buffers internos de PIL y SDL y no solo los objetos de Python. También
+    informa la diferencia máxima por canal respecto del camino anterior; que
+    "alta" sea idéntico lo verifica tests/test_assets.py.
+
+    Args:
+        repeticiones (int): Escalados por caso; se informa el mejor tiempo.
+        categoria (str): Categoría de la que se toman los PNG.
+
+    Returns:
+        Dict[str, float]: Milisegundos, KB pico y diferencia máxima por caso e imagen.
+    """
+    if not pygame.get_init():
+        pygame.init()
+    gestor = AssetManager(categoria, convertir=False)
+    casos = {
+        "copias": _escalar_con_copias,
+        "alta": lambda s, t: gestor.scale_image(s, *t, force_aspect_ratio=False, calidad="alta"),
+        "media": lambda s, t: gestor.scale_image(s, *t, force_aspect_ratio=False, calidad="media"),
+        "baja": lambda s, t: gestor.scale_image(s, *t, force_aspect_ratio=False, calidad="baja"),
+    }
+    resultados = {}
+    for nombre, archivo in (("fondo", "background.png"), ("obstaculo", "obstacle.png")):
+        original = gestor._pil_to_pygame(Image.open(os.path.join(gestor.assets_path, archivo)))
+        tam = gestor.images["background" if nombre == "fondo" else "obstacle"].get_size()
+        referencia = np.frombuffer(pygame.image.tostring(_escalar_con_copias(original, tam), "RGBA"), np.uint8)
+        for caso, escalar in casos.items():
+            mejor = float("inf")
+            for _ in range(repeticiones):
+                inicio = time.perf_counter()
+                escalada = escalar(original, tam)
+                mejor = min(mejor, time.perf_counter() - inicio)
+            pico = _pico_rss_kb(lambda: escalar(original, tam))
+            pixeles = np.frombuffer(pygame.image.tostring(escalada, "RGBA"), np.uint8)
+            diferencia = np.abs(pixeles.astype(np.int16) - referencia).max()
+            resultados[f"{nombre}_{caso}_ms"] = mejor * 1e3
+            resultados[f"{nombre}_{caso}_pico_kb"] = pico
+            resultados[f"{nombre}_{caso}_dif_max"] = float(diferencia)
+    return resultados
+
+def benchmark_mipmaps(cuadros: int = 600, imagen: str = "background",
+                      categoria: str = "granja") -> Dict[str, float]:
+    """
+    Simula un efecto de pulso con get_scaled_image y lo compara con el camino anterior.
+
+    El factor de escala varía de forma continua entre 0.25 y 1.0, así que
+    casi todos los cuadros piden un factor distinto. El camino anterior escala
+    cada factor nuevo con LANCZOS desde la imagen original y lo guarda sin
+    límite; get_scaled_image lo resuelve con cubetas y mipmaps. La diferencia
+    media por canal se mide contra LANCZOS exacto al mismo tamaño.
+
+    Args:
+        cuadros (int): Pedidos de escalado.
+        imagen (str): Imagen del gestor a escalar.
+        categoria (str): Categoría de la que se toma la imagen.
+
+    Returns:
+        Dict[str, float]: Milisegundos totales, entradas y MB de caché de cada
+            camino, y diferencias media y máxima del camino con mipmaps.
+    """
+    if not pygame.get_init():
+        pygame.init()
+    gestor = AssetManager(categoria, convertir=False)
+    original = gestor.images[imagen]
+    factores = [0.625 + 0.375 * math.sin(i * 0.05) for i in range(cuadros)]
+
+    anterior = {}
+    inicio = time.perf_counter()
+    for factor in factores:
+        clave = f"{imagen}_{factor}"
+        if clave not in anterior:
+            anterior[clave] = gestor.scale_image(original, int(original.get_width() * factor),
+                                                 int(original.get_height() * factor))
+    tiempo_anterior = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    for factor in factores:
+        gestor.get_scaled_image(imagen, factor)
+    tiempo_mipmaps = time.perf_counter() - inicio
+
+    diferencias = []
+    for factor in factores[::max(1, cuadros // 20)]:
+        escalada = gestor.get_scaled_image(imagen, factor)
+        exacta = gestor.scale_image(original, *escalada.get_size(), force_aspect_ratio=False)
+        a = np.frombuffer(pygame.image.tostring(escalada, "RGB"), np.uint8).astype(np.int16)
+        b = np.frombuffer(pygame.image.tostring(exacta, "RGB"), np.uint8)
+        diferencias.append(np.abs(a - b))
+    diferencias = np.concatenate(diferencias)
+
+    def megabytes(superficies):
+        return sum(s.get_pitch() * s.get_height() for s in superficies) / 2 ** 20
+
+    resultados = {
+        "anterior_ms": tiempo_anterior * 1e3,
+        "mipmaps_ms": tiempo_mipmaps * 1e3,
+        "anterior_entradas": len(anterior),
+        "mipmaps_entradas": len(gestor.cache),
+        "mipmaps_limite": MAX_IMAGENES_ESCALADAS,
+        "anterior_mb": megabytes(anterior.values()),
+        "mipmaps_mb": megabytes(gestor.cache.values()) + megabytes(gestor.mipmaps[imagen][1:]),
+        "dif_media": float(diferencias.mean()),
+        "dif_max": float(diferencias.max()),
+    }
+    resultados["aceleracion"] = resultados["anterior_ms"] / resultados["mipmaps_ms"]
+    gestor.liberar()
+    return resultados
+
+def _pregunta_en_nivel_dfs(nodo, nivel, usadas=None, nivel_actual=1):
+    """Búsqueda anterior: recorrido en profundidad desde la raíz en cada pedido."""
+    if nodo is None or nivel_actual > nivel:
+        return None
+    if nivel_actual == nivel:
+        if usadas is None or nodo.pregunta not in usadas:
+            return nodo.pregunta
+        return None
+    return (_pregunta_en_nivel_dfs(nodo.izquierdo, nivel, usadas, nivel_actual + 1)
+            or _pregunta_en_nivel_dfs(nodo.derecho, nivel, usadas, nivel_actual + 1))
+
+def _altura_recursiva(nodo) -> int:
+    """Altura anterior: recorre todo el subárbol en cada llamada."""
+    if nodo is None:
+        return 0
+    return max(_altura_recursiva(nodo.izquierdo), _altura_recursiva(nodo.derecho)) + 1
+
+def benchmark_preguntas(tamanos=(127, 1023, 8191), consultas: int = 2000,
+                        semilla: int = 0) -> Dict[str, float]:
+    """
+    Compara las búsquedas por nivel del árbol de preguntas con el recorrido anterior.
+
+    Por cada tamaño mide la consulta del nivel más profundo con
+    obtener_pregunta_por_dificultad, altura() y la selección de todas las
+    preguntas del último nivel sin repetir con SelectorPreguntas. Que índice,
+    alturas y búsquedas coincidan con los recorridos anteriores lo verifica
+    tests/test_arbol.py.
+
+    Args:
+        tamanos: Cantidad de preguntas de cada árbol.
+        consultas (int): Consultas medidas por caso.
+        semilla (int): Semilla de los pesos.
+
+    Returns:
+        Dict[str, float]: Microsegundos por consulta o por pregunta elegida de
+            cada caso y tamaño.
+    """
+    rng = random.Random(semilla)
+    resultados = {}
+
+    def medir(funcion, n=consultas):
+        inicio = time.perf_counter()
+        for _ in range(n):
+            funcion()
+        return (time.perf_counter() - inicio) * 1e6 / n
+
+    for tamano in tamanos:
+        preguntas = [Pregunta(f"p{i}") for i in range(tamano)]
+        for pregunta in preguntas:
+            pregunta.peso = rng.randrange(10)
+        arbol = construir_arbol_balanceado(preguntas)
+        profundo = arbol.altura()
+        resultados[f"nivel_dfs_{tamano}_us"] = medir(lambda: _pregunta_en_nivel_dfs(arbol, profundo))
+        resultados[f"nivel_indice_{tamano}_us"] = medir(lambda: obtener_pregunta_por_dificultad(arbol, profundo))
+        resultados[f"altura_recursiva_{tamano}_us"] = medir(lambda: _altura_recursiva(arbol))
+        resultados[f"altura_cacheada_{tamano}_us"] = medir(arbol.altura)
+
+        selector = SelectorPreguntas("Granja", ConfiguracionPartida(num_preguntas=0))
+        selector.arbol = arbol
+        en_nivel = len(arbol.nodos_en_nivel(profundo))
+        usadas = set()
+        inicio = time.perf_counter()
+        for _ in range(en_nivel):
+            usadas.add(_pregunta_en_nivel_dfs(arbol, profundo, usadas))
+        resultados[f"seleccion_dfs_{tamano}_us"] = (time.perf_counter() - inicio) * 1e6 / en_nivel
+        inicio = time.perf_counter()
+        for _ in range(en_nivel):
+            selector._seleccionar_pregunta_nivel(profundo)
+        resultados[f"seleccion_indice_{tamano}_us"] = (time.perf_counter() - inicio) * 1e6 / en_nivel
+    return resultados
+
+def benchmark_arbol_compacto(tamanos=(1000, 10000, 50000), consultas: int = 20000,
+                             semilla: int = 0) -> Dict[str, float]:
+    """
+    Compara memoria y velocidad del árbol de punteros con el árbol compacto en arreglo.
+
+    La memoria es la que reserva cada construcción según tracemalloc, incluidos
+    los objetos Pregunta del árbol de punteros; los textos ya existen antes y no
+    se cuentan en ninguno. Las consultas son obtener_pregunta_aleatoria con la
+    misma semilla en ambos árboles, y un recorrido completo por niveles. Que
+    ambos árboles den las mismas preguntas lo verifica tests/test_arbol_compacto.py.
+
+    Args:
+        tamanos: Cantidad de preguntas de cada árbol.
+        consultas (int): Llamadas a obtener_pregunta_aleatoria por árbol.
+        semilla (int): Semilla de los pesos y de las consultas.
+
+    Returns:
+        Dict[str, float]: Bytes por pregunta, milisegundos de construcción,
+            y microsegundos por consulta y por recorrido.
+    """
+    resultados = {}
+    for tamano in tamanos:
+        rng = random.Random(semilla)
+        textos = [f"¿Pregunta número {i}?" for i in range(tamano)]
+        pesos = [rng.randrange(10) for _ in range(tamano)]
+
+        def punteros():
+            preguntas = [Pregunta(texto) for texto in textos]
+            for pregunta, peso in zip(preguntas, pesos):
+                pregunta.peso = peso
+            return construir_arbol_balanceado(preguntas)
+
+        def compacto():
+            return ArbolCompacto(textos, pesos).raiz
+
+        arboles = {}
+        for nombre, construir in (("punteros", punteros), ("compacto", compacto)):
+            inicio = time.perf_counter()
+            construir()
+            resultados[f"{nombre}_{tamano}_construir_ms"] = (time.perf_counter() - inicio) * 1e3
+            gc.collect()
+            tracemalloc.start()
+            arboles[nombre] = construir()
+            memoria = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+            resultados[f"{nombre}_{tamano}_bytes_por_pregunta"] = memoria / tamano
+
+        for nombre, arbol in arboles.items():
+            random.seed(semilla)
+            inicio = time.perf_counter()
+            for _ in range(consultas):
+                obtener_pregunta_aleatoria(arbol)
+            resultados[f"{nombre}_{tamano}_consulta_us"] = (time.perf_counter() - inicio) * 1e6 / consultas
+            inicio = time.perf_counter()
+            for nivel in range(1, arbol.altura() + 1):
+                for nodo in arbol.nodos_en_nivel(nivel):
+                    nodo.pregunta.peso
+            resultados[f"{nombre}_{tamano}_recorrido_ms"] = (time.perf_counter() - inicio) * 1e3
+    return resultados
+
+def benchmark_arbol_pesos(tamanos=(1000, 10000), respuestas: int = 2000, reconstrucciones: int = 100,
+                          semilla: int = 0) -> Dict[str, float]:
+    """
+    Compara mantener el orden por peso con ArbolPesos contra reconstruir el árbol.
+
+    Registra respuestas al azar. El árbol de construir_arbol_balanceado se
+    reconstruye después de cada respuesta (solo `reconstrucciones` veces por
+    su costo). ArbolPesos se reubica solo al cambiar el peso; además se mide
+    el rango de una pregunta y el conteo de un rango de pesos. Que el orden se
+    mantenga lo verifica tests/test_arbol_pesos.py.
+
+    Args:
+        tamanos: Cantidad de preguntas de cada banco.
+        respuestas (int): Respuestas registradas en cada caso.
+        reconstrucciones (int): Respuestas medidas con reconstrucción completa.
+        semilla (int): Semilla de los pesos y las respuestas.
+
+    Returns:
+        Dict[str, float]: Microsegundos por respuesta y por consulta.
+    """
+    resultados = {}
+    for tamano in tamanos:
+        rng = random.Random(semilla)
+        preguntas = [Pregunta(f"p{i}") for i in range(tamano)]
+        for pregunta in preguntas:
+            pregunta.peso = rng.randrange(5)
+        secuencia = [(rng.choice(preguntas), rng.random() < 0.5) for _ in range(respuestas)]
+
+        inicio = time.perf_counter()
+        for pregunta, correcta in secuencia[:reconstrucciones]:
+            pregunta.registrar_respuesta(correcta)
+            construir_arbol_balanceado(preguntas)
+        resultados[f"reconstruir_{tamano}_us"] = (time.perf_counter() - inicio) * 1e6 / reconstrucciones
+
+        arbol = ArbolPesos(preguntas)
+        inicio = time.perf_counter()
+        for pregunta, correcta in secuencia[reconstrucciones:]:
+            pregunta.registrar_respuesta(correcta)
+        resultados[f"arbol_pesos_{tamano}_us"] = (
+            (time.perf_counter() - inicio) * 1e6 / (respuestas - reconstrucciones))
+
+        consultas = [rng.choice(preguntas) for _ in range(1000)]
+        inicio = time.perf_counter()
+        for pregunta in consultas:
+            arbol.rango(pregunta)
+            arbol.contar_en_rango(pregunta.peso, pregunta.peso + 2)
+        resultados[f"rango_y_conteo_{tamano}_us"] = (time.perf_counter() - inicio) * 1e6 / len(consultas)
+        arbol.vaciar()
+    return resultados
+
+def _descenso_moneda(nodo):
+    """Sorteo anterior de SelectorPreguntas: en cada nodo, moneda entre quedarse o bajar."""
+    if nodo is None:
+        return None
+    if random.random() < 0.5:
+        return nodo.pregunta
+    return _descenso_moneda(nodo.izquierdo) or _descenso_moneda(nodo.derecho)
+
+def benchmark_muestreo(preguntas_distribucion: int = 31, sorteos: int = 100000,
+                       tamano: int = 100000, semilla: int = 0) -> Dict[str, float]:
+    """
+    Compara la distribución y el costo del MuestreadorPesos con los sorteos por árbol.
+
+    La distribución objetivo es proporcional a peso + 1. Para cada método se
+    informa la distancia de variación total entre las frecuencias observadas
+    y el objetivo (0 = exacta; el ruido de muestreo da alrededor de 0.01).
+    El costo se mide sobre un banco de `tamano` preguntas. Lotes sin
+    repetición, total exacto y partidas sin preguntas repetidas los verifica
+    tests/test_muestreo.py.
+
+    Args:
+        preguntas_distribucion (int): Preguntas del banco usado para la distribución.
+        sorteos (int): Sorteos por método para estimar la distribución.
+        tamano (int): Preguntas del banco usado para medir tiempos.
+        semilla (int): Semilla de pesos y sorteos.
+
+    Returns:
+        Dict[str, float]: Distancia de variación total de cada método y
+            microsegundos por sorteo, por actualización y por lote de 10 sin
+            reposición.
+    """
+    rng = random.Random(semilla)
+    preguntas = [Pregunta(f"p{i}") for i in range(preguntas_distribucion)]
+    for pregunta in preguntas:
+        pregunta.peso = rng.randrange(8)
+    total = sum(peso_de_muestreo(p.peso) for p in preguntas)
+    objetivo = {p: peso_de_muestreo(p.peso) / total for p in preguntas}
+    arbol = construir_arbol_balanceado(preguntas)
+    muestreador = MuestreadorPesos(preguntas)
+    metodos = {
+        "muestreador": lambda: muestreador.muestrear(),
+        "aleatoria_arbol": lambda: obtener_pregunta_aleatoria(arbol),
+        "descenso_moneda": lambda: _descenso_moneda(arbol),
+    }
+    resultados = {}
+    for nombre, sortear in metodos.items():
+        random.seed(semilla)
+        frecuencias = dict.fromkeys(preguntas, 0)
+        for _ in range(sorteos):
+            frecuencias[sortear()] += 1
+        resultados[f"distancia_{nombre}"] = 0.5 * sum(
+            abs(frecuencias[p] / sorteos - objetivo[p]) for p in preguntas)
+    muestreador.vaciar()
+
+    banco = [Pregunta(f"q{i}") for i in range(tamano)]
+    for pregunta in banco:
+        pregunta.peso = rng.randrange(8)
+    inicio = time.perf_counter()
+    muestreador = MuestreadorPesos(banco)
+    resultados["construir_ms"] = (time.perf_counter() - inicio) * 1e3
+    n = 20000
+    inicio = time.perf_counter()
+    for _ in range(n):
+        muestreador.muestrear(rng)
+    resultados["sorteo_us"] = (time.perf_counter() - inicio) * 1e6 / n
+    respuestas = [(rng.choice(banco), rng.random() < 0.5) for _ in range(n)]
+    inicio = time.perf_counter()
+    for pregunta, correcta in respuestas:
+        pregunta.registrar_respuesta(correcta)
+    resultados["registrar_respuesta_us"] = (time.perf_counter() - inicio) * 1e6 / n
+    inicio = time.perf_counter()
+    for _ in range(n // 10):
+        muestreador.muestrear_varias(10, rng)
+    resultados["lote_10_sin_reposicion_us"] = (time.perf_counter() - inicio) * 1e6 / (n // 10)
+    muestreador.vaciar()
+    return resultados
+
+def _imprimir(titulo: str, resultados: Dict[str, float]):
+    print(f"\n{titulo}")
+    for clave, valor in resultados.items():
+        print(f"  {clave:<36} {valor:>14.2f}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks del juego")
+    sub = parser.add_subparsers(dest="comando", required=True)
+
+    sim = sub.add_parser("simulacion", help="Ticks de lógica por segundo sin ventana")
+    sim.add_argument("--ticks", type=int, default=10000)
+    sim.add_argument("--categoria", default="granja")
+    sim.add_argument("--semilla", type=int, default=0)
+    sim.add_argument("--obstaculos", type=int, default=None)
+
+    render = sub.add_parser("render", help="Tiempo de dibujo: pantalla completa vs dirty rects")
+    render.add_argument("--cuadros", type=int, default=600)
+    render.add_argument("--categoria", default="granja")
+    render.add_argument("--semilla", type=int, default=0)
+    render.add_argument("--obstaculos", type=int, default=None)
+
+    blits = sub.add_parser("blits", help="Blits por segundo de la capa de obstáculos")
+    blits.add_argument("--sprites", type=int, default=1000)
+    blits.add_argument("--repeticiones", type=int, default=50)
+    blits.add_argument("--categoria", default="granja")
+
+    carga = sub.add_parser("carga", help="Carga de assets con y sin la caché en disco")
+    carga.add_argument("--repeticiones", type=int, default=5)
+
+    atlas = sub.add_parser("atlas", help="Carga de sprites separados vs desde el atlas")
+    atlas.add_argument("--repeticiones", type=int, default=20)
+    arranque = sub.add_parser("arranque", help="Precalentamiento de las cinco categorías en paralelo")
+    arranque.add_argument("--repeticiones", type=int, default=3)
+    manifiesto = sub.add_parser("manifiesto", help="Manifiesto de assets y archivos abiertos por categoría")
+    manifiesto.add_argument("--repeticiones", type=int, default=20)
+    registro = sub.add_parser("registro", help="Cambios de categoría con el registro compartido")
+    registro.add_argument("--rondas", type=int, default=3)
+    registro.add_argument("--presupuesto-mb", type=float, default=32.0)
+
+    escalado = sub.add_parser("escalado", help="Tiempo y memoria de scale_image por calidad")
+    escalado.add_argument("--repeticiones", type=int, default=20)
+    escalado.add_argument("--categoria", default="granja")
+
+    mipmaps = sub.add_parser("mipmaps", help="get_scaled_image con factores continuos")
+    mipmaps.add_argument("--cuadros", type=int, default=600)
+    mipmaps.add_argument("--imagen", default="background")
+    mipmaps.add_argument("--categoria", default="granja")
+    preguntas = sub.add_parser("preguntas", help="Búsquedas por nivel en árboles de preguntas")
+    preguntas.add_argument("--consultas", type=int, default=2000)
+    compacto = sub.add_parser("arbol_compacto", help="Árbol de punteros vs árbol compacto en arreglo")
+    compacto.add_argument("--consultas", type=int, default=20000)
+    pesos = sub.add_parser("arbol_pesos", help="Orden por peso: ArbolPesos vs reconstruir el árbol")
+    pesos.add_argument("--respuestas", type=int, default=2000)
+    repeticion = sub.add_parser("repeticion", help="Grabar, guardar y repetir partidas sin ventana")
+    repeticion.add_argument("--ticks", type=int, default=3000)
+    muestreo = sub.add_parser("muestreo", help="Sorteo de preguntas proporcional al peso")
+    muestreo.add_argument("--sorteos", type=int, default=100000)
+    muestreo.add_argument("--tamano", type=int, default=100000)
+
+    args = parser.parse_args(argv)
+    if args.comando == "simulacion":
+        _imprimir("Simulación headless", benchmark_simulacion(
+            args.ticks, args.categoria, args.semilla, args.obstaculos))
+    elif args.comando == "render":
+        _imprimir("Renderizado", benchmark_render(
+            args.cuadros, args.categoria, args.semilla, args.obstaculos))
+    elif args.comando == "blits":
+        _imprimir("Blits de obstáculos", benchmark_blits(
+            args.sprites, args.repeticiones, args.categoria))
+    elif args.comando == "carga":
+        _imprimir("Carga de assets (5 categorías)", benchmark_carga(args.repeticiones))
+    elif args.comando == "atlas":
+        _imprimir("Atlas de sprites (5 categorías)", benchmark_atlas(args.repeticiones))
+    elif args.comando == "arranque":
+        _imprimir("Precalentamiento de assets (5 categorías)", benchmark_arranque(args.repeticiones))
+    elif args.comando == "manifiesto":
+        _imprimir("Manifiesto de assets", benchmark_manifiesto(args.repeticiones))
+    elif args.comando == "registro":
+        _imprimir("Registro compartido de assets", benchmark_registro(args.rondas, args.presupuesto_mb))
+    elif args.comando == "escalado":
+        _imprimir("Escalado de imágenes", benchmark_escalado(args.repeticiones, args.categoria))
+    elif args.comando == "mipmaps":
+        _imprimir("Escalado con mipmaps", benchmark_mipmaps(args.cuadros, args.imagen, args.categoria))
+    elif args.comando == "preguntas":
+        _imprimir("Árbol de preguntas por nivel", benchmark_preguntas(consultas=args.consultas))
+    elif args.comando == "arbol_compacto":
+        _imprimir("Árbol compacto de preguntas", benchmark_arbol_compacto(consultas=args.consultas))
+    elif args.comando == "arbol_pesos":
+        _imprimir("Árbol ordenado por peso", benchmark_arbol_pesos(respuestas=args.respuestas))
+    elif args.comando == "repeticion":
+        _imprimir("Repetición de partidas", benchmark_repeticion(args.ticks))
+    elif args.comando == "muestreo":
+        _imprimir("Muestreo por peso", benchmark_muestreo(sorteos=args.sorteos, tamano=args.tamano))
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,173 @@
+import glob
+import hashlib
+import mmap
+import os
+import struct
+import tempfile
+import pygame
+from typing import Optional, Tuple
+
+
+# Cabecera de cada blob: magia, ancho, alto y canales (3 = RGB, 4 = RGBA)
+MAGIA_BLOB = b"JGAB"
+CABECERA_BLOB = struct.Struct("<4sHHB3x")
+MODOS_POR_CANALES = {3: "RGB", 4: "RGBA"}
+
+def leer_blob(ruta: str) -> pygame.Surface:
+    """
+    Carga un blob de pixeles crudos con mmap en modo copia privada.
+
+    La superficie usa directamente las páginas del archivo y conserva una
+    referencia al mapa mientras exista; escribir en ella no toca el disco.
+
+    Raises:
+        OSError: Si el archivo no se puede abrir.
+        ValueError: Si el blob está vacío o dañado.
+    """
+    with open(ruta, "rb") as f:
+        mapa = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+    try:
+        magia, ancho, alto, canales = CABECERA_BLOB.unpack_from(mapa)
+        modo = MODOS_POR_CANALES[canales]
+        fin = CABECERA_BLOB.size + ancho * alto * canales
+        if magia != MAGIA_BLOB or len(mapa) != fin:
+            raise ValueError("tamaño inválido")
+        return pygame.image.frombuffer(memoryview(mapa)[CABECERA_BLOB.size:fin], (ancho, alto), modo)
+    except (struct.error, KeyError, ValueError) as e:
+        mapa.close()
+        raise ValueError(f"Blob dañado: {ruta}") from e
+
+def escribir_blob(ruta: str, superficie: pygame.Surface):
+    """
+    Guarda los pixeles crudos de una superficie (RGBA si tiene alfa, RGB si no) como blob.
+
+    La escritura va a un archivo temporal de la misma carpeta que luego se
+    renombra, así que un proceso que lee a la vez nunca ve un blob a medias; si
+    falla, el temporal se borra.
+
+    Raises:
+        OSError: Si no se puede escribir.
+        pygame.error: Si no se pueden leer los pixeles de la superficie.
+    """
+    modo = "RGBA" if superficie.get_flags() & pygame.SRCALPHA else "RGB"
+    ancho, alto = superficie.get_size()
+    directorio = os.path.dirname(ruta)
+    os.makedirs(directorio, exist_ok=True)
+    descriptor, temporal = tempfile.mkstemp(dir=directorio, suffix=".tmp")
+    try:
+        with os.fdopen(descriptor, "wb") as f:
+            f.write(CABECERA_BLOB.pack(MAGIA_BLOB, ancho, alto, len(modo)))
+            f.write(pygame.image.tostring(superficie, modo))
+        os.replace(temporal, ruta)
+    except BaseException:
+        # No dejar el temporal si la escritura falla a mitad
+        try:
+            os.remove(temporal)
+        except OSError:
+            pass
+        raise
+
+class CacheDiscoAssets:
+    """
+    Caché persistente en disco de imágenes ya decodificadas y escaladas.
+
+    Cada entrada es un blob con los pixeles crudos (RGB o RGBA) de una imagen
+    escalada, con una cabecera mínima. La clave combina el hash del contenido del
+    PNG de origen, la caja de tamaño pedida y el modo de remuestreo, así que
+    cambiar el archivo de origen produce otra clave; al guardar la nueva entrada
+    se borran las del mismo origen con otro hash.
+
+    Los blobs se cargan con leer_blob(): la superficie usa directamente las
+    páginas del archivo, sin decodificación PNG ni remuestreo.
+
+    Atributos:
+        directorio (str): Carpeta donde se guardan los blobs.
+        activo (bool): Si la caché se consulta y se llena.
+        aciertos (int): Cargas servidas desde disco.
+        fallos (int): Cargas que tuvieron que decodificar y escalar.
+    """
+    def __init__(self, directorio: str, activo: bool = True):
+        self.directorio = directorio
+        self.activo = activo
+        self.aciertos = 0
+        self.fallos = 0
+
+    @staticmethod
+    def huella(datos: bytes) -> str:
+        """Devuelve el hash del contenido de un archivo de origen."""
+        return hashlib.blake2b(datos, digest_size=12).hexdigest()
+
+    @staticmethod
+    def prefijo(ruta_origen: str) -> str:
+        """Identifica el archivo de origen con su carpeta y nombre (p. ej. 'granja_player')."""
+        carpeta = os.path.basename(os.path.dirname(ruta_origen))
+        nombre = os.path.splitext(os.path.basename(ruta_origen))[0]
+        return f"{carpeta}_{nombre}"
+
+    def _ruta(self, prefijo: str, huella: str, caja: Tuple[int, int], remuestreo: str) -> str:
+        return os.path.join(self.directorio, f"{prefijo}-{huella}-{caja[0]}x{caja[1]}-{remuestreo}.raw")
+
+    def cargar(self, ruta_origen: str, huella: str, caja: Tuple[int, int],
+               remuestreo: str) -> Optional[pygame.Surface]:
+        """
+        Busca la imagen escalada de un archivo de origen.
+
+        Args:
+            ruta_origen (str): PNG de origen.
+            huella (str): Hash del contenido del PNG, de huella().
+            caja (Tuple[int, int]): Tamaño pedido al escalar.
+            remuestreo (str): Nombre del filtro de remuestreo.
+
+        Returns:
+            pygame.Surface, opcional: La imagen, o None si no está en caché o el
+                blob está dañado.
+        """
+        if not self.activo:
+            return None
+        ruta = self._ruta(self.prefijo(ruta_origen), huella, caja, remuestreo)
+        try:
+            superficie = leer_blob(ruta)
+        except OSError:
+            self.fallos += 1
+            return None
+        except ValueError:
+            self._borrar(ruta)
+            self.fallos += 1
+            return None
+        self.aciertos += 1
+        return superficie
+
+    def guardar(self, ruta_origen: str, huella: str, caja: Tuple[int, int],
+                remuestreo: str, superficie: pygame.Surface):
+        """
+        Guarda una imagen escalada y borra las entradas obsoletas del mismo origen.
+
+        La escritura es atómica (ver escribir_blob()); si falla, el temporal se borra.
+        """
+        if not self.activo:
+            return
+        prefijo = self.prefijo(ruta_origen)
+        ruta = self._ruta(prefijo, huella, caja, remuestreo)
+        try:
+            escribir_blob(ruta, superficie)
+        except (OSError, pygame.error) as e:
+            print(f"No se pudo guardar en la caché de assets: {e}")
+            return
+        for obsoleto in glob.glob(os.path.join(self.directorio, glob.escape(prefijo) + "-*.raw")):
+            if not os.path.basename(obsoleto).startswith(f"{prefijo}-{huella}-"):
+                self._borrar(obsoleto)
+
+    def _borrar(self, ruta: str):
+        try:
+            os.remove(ruta)
+        except OSError:
+            pass
+
+    def vaciar(self):
+        """Borra todos los blobs de la caché."""
+        for ruta in glob.glob(os.path.join(self.directorio, "*.raw")):
+            self._borrar(ruta)
+
+
+# Caché compartida por todos los AssetManager del proceso
+cache_disco = CacheDiscoAssets(os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets", ".cache"))
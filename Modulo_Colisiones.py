@@ -0,0 +1,273 @@
+import numpy as np
+import pygame
+from typing import List, Optional
+
+class HashEspacial:
+    """
+    Broadphase de colisiones basada en una rejilla uniforme (spatial hash).
+
+    Cada caja (x, y, ancho, alto) se registra con una clave entera en todas las
+    celdas que cubre. Las consultas solo revisan las cajas de las celdas que
+    toca el área consultada, por lo que el costo depende de la densidad local y
+    no del total de obstáculos.
+
+    Las cajas se guardan relativas a un desplazamiento común: cuando todas se
+    mueven lo mismo (los obstáculos caen a la misma velocidad), desplazar()
+    actualiza la rejilla completa en O(1). Las que se mueven por su cuenta se
+    actualizan con actualizar().
+
+    Las celdas infinitas del plano se reparten en una tabla fija de
+    `filas` x `columnas` cubetas (celda módulo tamaño de la tabla). Cada cubeta
+    es una lista enlazada de nodos que viven en listas preasignadas con una
+    cadena de nodos libres, las cajas viven en columnas NumPy indexadas por
+    clave y las coordenadas de celda se calculan como float. Así insertar,
+    eliminar, desplazar y colisiona no crean objetos nuevos una vez que la
+    rejilla alcanzó su tamaño. Dos celdas que caen en la misma
+    cubeta solo agregan candidatos: el test de intersección los descarta.
+
+    Las cajas son intervalos semiabiertos [x, x + ancho): su última celda es
+    ceil((x + ancho) / tam_celda) - 1, también con coordenadas fraccionarias.
+
+    Atributos:
+        tam_celda (int): Lado de cada celda en píxeles.
+        filas, columnas (int): Tamaño de la tabla de cubetas.
+        desplazamiento (List[float]): Desplazamiento común (x, y) acumulado.
+    """
+    def __init__(self, tam_celda: int = 100, capacidad: int = 16,
+                 filas: int = 32, columnas: int = 32):
+        """
+        Args:
+            tam_celda (int, opcional): Lado de cada celda en píxeles.
+            capacidad (int, opcional): Claves previstas (de 0 a capacidad - 1);
+                la rejilla crece si llega una mayor.
+            filas, columnas (int, opcional): Tamaño de la tabla de cubetas.
+        """
+        self.tam_celda = tam_celda
+        self.filas = filas
+        self.columnas = columnas
+        self.desplazamiento = [0.0, 0.0]
+        self._tam = float(tam_celda)
+        self._cubetas = [[-1] * columnas for _ in range(filas)]
+        # Cajas relativas al desplazamiento, por clave
+        self._x = self._y = self._w = self._h = np.zeros(0)
+        self._activas = bytearray()
+        self._nodo_clave: List[int] = []
+        self._nodo_siguiente: List[int] = []
+        self._nodo_libre = -1
+        self._n = 0
+        self._reservar(max(1, capacidad))
+
+    def __len__(self) -> int:
+        return self._n
+
+    def _reservar(self, capacidad: int):
+        """Agranda las columnas de cajas y duplica la reserva de nodos."""
+        faltan = capacidad - len(self._activas)
+        if faltan > 0:
+            relleno = np.zeros(faltan)
+            self._x = np.concatenate((self._x, relleno))
+            self._y = np.concatenate((self._y, relleno))
+            self._w = np.concatenate((self._w, relleno))
+            self._h = np.concatenate((self._h, relleno))
+            self._activas.extend(bytes(faltan))
+        # Cuatro nodos por clave cubren cajas de hasta una celda de lado
+        nodos = max(4 * capacidad, 2 * len(self._nodo_clave))
+        inicio = len(self._nodo_clave)
+        if nodos <= inicio:
+            return
+        self._nodo_clave.extend([-1] * (nodos - inicio))
+        self._nodo_siguiente.extend(range(inicio + 1, nodos + 1))
+        self._nodo_siguiente[-1] = self._nodo_libre
+        self._nodo_libre = inicio
+
+    def _enlazar(self, clave: int):
+        """Agrega un nodo de `clave` en la cubeta de cada celda que cubre su caja."""
+        x, y, w, h = self._x.item(clave), self._y.item(clave), self._w.item(clave), self._h.item(clave)
+        t = self._tam
+        cx0, cy1, cx1 = x // t, -(-(y + h) // t) - 1.0, -(-(x + w) // t) - 1.0
+        cy = y // t
+        while cy <= cy1:
+            fila = self._cubetas[int(cy % self.filas)]
+            cx = cx0
+            while cx <= cx1:
+                if self._nodo_libre < 0:
+                    self._reservar(len(self._activas))
+                nodo = self._nodo_libre
+                self._nodo_libre = self._nodo_siguiente[nodo]
+                columna = int(cx % self.columnas)
+                self._nodo_clave[nodo] = clave
+                self._nodo_siguiente[nodo] = fila[columna]
+                fila[columna] = nodo
+                cx += 1.0
+            cy += 1.0
+
+    def _desenlazar(self, clave: int):
+        """Quita un nodo de `clave` de la cubeta de cada celda que cubre su caja."""
+        x, y, w, h = self._x.item(clave), self._y.item(clave), self._w.item(clave), self._h.item(clave)
+        t = self._tam
+        cx0, cy1, cx1 = x // t, -(-(y + h) // t) - 1.0, -(-(x + w) // t) - 1.0
+        cy = y // t
+        while cy <= cy1:
+            fila = self._cubetas[int(cy % self.filas)]
+            cx = cx0
+            while cx <= cx1:
+                columna = int(cx % self.columnas)
+                anterior = -1
+                nodo = fila[columna]
+                while nodo >= 0 and self._nodo_clave[nodo] != clave:
+                    anterior = nodo
+                    nodo = self._nodo_siguiente[nodo]
+                if nodo >= 0:
+                    if anterior < 0:
+                        fila[columna] = self._nodo_siguiente[nodo]
+                    else:
+                        self._nodo_siguiente[anterior] = self._nodo_siguiente[nodo]
+                    self._nodo_siguiente[nodo] = self._nodo_libre
+                    self._nodo_libre = nodo
+                cx += 1.0
+            cy += 1.0
+
+    def _activa(self, clave: int) -> bool:
+        return 0 <= clave < len(self._activas) and self._activas[clave] == 1
+
+    def _guardar(self, clave: int, x: float, y: float, w: float, h: float):
+        self._x[clave] = x - self.desplazamiento[0]
+        self._y[clave] = y - self.desplazamiento[1]
+        self._w[clave] = w
+        self._h[clave] = h
+
+    def insertar(self, clave: int, x: float, y: float, w: float, h: float):
+        """
+        Registra una caja en las celdas que cubre.
+
+        Raises:
+            ValueError: Si la clave es negativa.
+        """
+        if clave < 0:
+            raise ValueError(f"La clave debe ser un entero no negativo: {clave}")
+        if clave >= len(self._activas):
+            self._reservar(2 * clave + 1)
+        if self._activas[clave]:
+            self._desenlazar(clave)
+        else:
+            self._activas[clave] = 1
+            self._n += 1
+        self._guardar(clave, x, y, w, h)
+        self._enlazar(clave)
+
+    def eliminar(self, clave: int):
+        """Quita una caja previamente registrada."""
+        if self._activa(clave):
+            self._desenlazar(clave)
+            self._activas[clave] = 0
+            self._n -= 1
+
+    def actualizar(self, clave: int, x: float, y: float, w: float, h: float):
+        """
+        Actualiza la posición de una caja que se movió por su cuenta.
+
+        Solo reubica la caja en la rejilla cuando cambia de celdas; en otro caso
+        reemplaza la caja guardada.
+        """
+        if not self._activa(clave):
+            self.insertar(clave, x, y, w, h)
+            return
+        t = self._tam
+        ax, ay = self._x.item(clave), self._y.item(clave)
+        aw, ah = self._w.item(clave), self._h.item(clave)
+        rx, ry = x - self.desplazamiento[0], y - self.desplazamiento[1]
+        if (ax // t != rx // t or ay // t != ry // t
+                or -(-(ax + aw) // t) - 1.0 != -(-(rx + w) // t) - 1.0
+                or -(-(ay + ah) // t) - 1.0 != -(-(ry + h) // t) - 1.0):
+            self._desenlazar(clave)
+            self._guardar(clave, x, y, w, h)
+            self._enlazar(clave)
+        else:
+            self._guardar(clave, x, y, w, h)
+
+    def desplazar(self, dx: float, dy: float):
+        """Indica que todas las cajas registradas se movieron (dx, dy)."""
+        self.desplazamiento[0] += dx
+        self.desplazamiento[1] += dy
+
+    def limpiar(self):
+        """Elimina todas las cajas registradas."""
+        for clave, activa in enumerate(self._activas):
+            if activa:
+                self._desenlazar(clave)
+                self._activas[clave] = 0
+        self._n = 0
+        self.desplazamiento[0] = self.desplazamiento[1] = 0.0
+
+    def candidatos(self, x: float, y: float, w: float, h: float) -> List[int]:
+        """
+        Obtiene las claves de las cajas que comparten alguna cubeta con el área dada.
+
+        Returns:
+            List[int]: Claves sin duplicados (pueden no intersectar).
+        """
+        px, py = x - self.desplazamiento[0], y - self.desplazamiento[1]
+        t = self._tam
+        encontrados = {}
+        cy, cy1 = py // t, -(-(py + h) // t) - 1.0
+        while cy <= cy1:
+            fila = self._cubetas[int(cy % self.filas)]
+            cx, cx1 = px // t, -(-(px + w) // t) - 1.0
+            while cx <= cx1:
+                nodo = fila[int(cx % self.columnas)]
+                while nodo >= 0:
+                    encontrados[self._nodo_clave[nodo]] = None
+                    nodo = self._nodo_siguiente[nodo]
+                cx += 1.0
+            cy += 1.0
+        return list(encontrados)
+
+    def colisiona(self, x: float, y: float, w: float, h: float,
+                  mascara: Optional[pygame.mask.Mask] = None,
+                  mascara_cajas: Optional[pygame.mask.Mask] = None) -> bool:
+        """
+        Indica si el área (x, y, w, h) intersecta alguna de las cajas registradas.
+
+        Si se dan las dos máscaras, cada caja que intersecta el área se
+        confirma con el solapamiento de pixeles; las que no intersectan se
+        descartan antes, sin tocar las máscaras. Una caja que aparece en varias
+        celdas del área solo se confirma en la primera celda que comparten
+        (la esquina superior izquierda de la intersección), así que no hace
+        falta un conjunto de revisadas. No crea objetos nuevos.
+
+        Args:
+            x, y, w, h (float): Área a consultar.
+            mascara (pygame.mask.Mask, opcional): Máscara del objeto que ocupa el área.
+            mascara_cajas (pygame.mask.Mask, opcional): Máscara compartida por las cajas.
+        """
+        px, py = x - self.desplazamiento[0], y - self.desplazamiento[1]
+        t = self._tam
+        qx0, qy0 = px // t, py // t
+        qx1, qy1 = -(-(px + w) // t) - 1.0, -(-(py + h) // t) - 1.0
+        por_pixel = mascara is not None and mascara_cajas is not None
+        xs, ys, ws, hs = self._x, self._y, self._w, self._h
+        claves = self._nodo_clave
+        siguientes = self._nodo_siguiente
+        cy = qy0
+        while cy <= qy1:
+            fila = self._cubetas[int(cy % self.filas)]
+            cx = qx0
+            while cx <= qx1:
+                nodo = fila[int(cx % self.columnas)]
+                while nodo >= 0:
+                    clave = claves[nodo]
+                    nodo = siguientes[nodo]
+                    ox, oy, ow, oh = xs.item(clave), ys.item(clave), ws.item(clave), hs.item(clave)
+                    if not (ox < px + w and px < ox + ow and oy < py + h and py < oy + oh):
+                        continue
+                    if not por_pixel:
+                        return True
+                    bx0, by0 = ox // t, oy // t
+                    if cx != (qx0 if qx0 > bx0 else bx0) or cy != (qy0 if qy0 > by0 else by0):
+                        continue
+                    # Misma posición entera que usa pygame.Rect al dibujar
+                    if mascara.overlap(mascara_cajas, ((ox - px + 0.5) // 1.0, (oy - py + 0.5) // 1.0)):
+                        return True
+                cx += 1.0
+            cy += 1.0
+        return False
@@ -11,7 +11,7 @@ class CategoriaPreguntas:
     nombre: str
     preguntas: List[str]
 
-PREGUNTAS_POR_CATEGORIA: Dict[str, List[str]] = {
+PREGUNTAS_POR_CATEGORIA: Dict[str, List[Pregunta]] = {
    "Granja": [
         Pregunta("¿Qué alimento da la vaca?", "Leche", 1),
         Pregunta("¿Qué animal pone huevos?", "Gallina", 1),
@@ -67,6 +67,9 @@ def obtener_pregunta_por_dificultad(nodo: Optional[NodoArbol], dificultad: int)
     """
     Obtiene una pregunta del árbol basada en el nivel de dificultad.
     
+    Usa el índice por niveles del árbol, así que no recorre los niveles
+    anteriores; devuelve el primer nodo del nivel, de izquierda a derecha.
+    
     Args:
         nodo: Nodo actual del árbol.
         dificultad: Nivel de dificultad deseado (nivel en el árbol).
@@ -74,20 +77,10 @@ def obtener_pregunta_por_dificultad(nodo: Optional[NodoArbol], dificultad: int)
     Returns:
         Pregunta correspondiente o None si no se encuentra.
     """
-    def buscar_pregunta(nodo_actual: Optional[NodoArbol], nivel_actual: int) -> Optional[Pregunta]:
-        if not nodo_actual or nivel_actual > dificultad:
-            return None
-
-        if nivel_actual == dificultad:
-            return nodo_actual.pregunta
-
-        # Intentar en ambos subárboles
-        pregunta = buscar_pregunta(nodo_actual.izquierdo, nivel_actual + 1)
-        if not pregunta:
-            pregunta = buscar_pregunta(nodo_actual.derecho, nivel_actual + 1)
-        return pregunta
-
-    return buscar_pregunta(nodo, 1)
+    if nodo is None:
+        return None
+    nodos = nodo.nodos_en_nivel(dificultad)
+    return nodos[0].pregunta if nodos else None
 
 # Otros métodos como `construir_arbol_balanceado` y `crear_preguntas_por_categoria` se encuentran en sus respectivos módulos.
 
@@ -107,8 +100,8 @@ def crear_preguntas_por_categoria(categoria: str) -> List[Pregunta]:
     if categoria not in PREGUNTAS_POR_CATEGORIA:
         raise ValueError(f"Categoría '{categoria}' no encontrada")
         
-    preguntas_texto = PREGUNTAS_POR_CATEGORIA[categoria]
-    preguntas = [Pregunta(texto=texto) for texto in preguntas_texto]
+    # Copias nuevas: los pesos de una partida no pasan a los árboles siguientes
+    preguntas = [Pregunta(p.texto, p.respuesta, p.dificultad) for p in PREGUNTAS_POR_CATEGORIA[categoria]]
     random.shuffle(preguntas)
     return preguntas
 
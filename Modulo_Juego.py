@@ -1,8 +1,14 @@
+import os
+import time
 import pygame
 import random
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
 from dataclasses import dataclass
-from Modulo_Assets import AssetManager
+from Modulo_Assets import AssetManager, PrecargaAssets, precalentar_categorias
+from Modulo_Colisiones import HashEspacial
+from Modulo_Obstaculos import AlmacenObstaculos
+from Modulo_Perfilador import PerfiladorFrames
+from Modulo_Texto import cache_texto, renderizar_texto
 from Jugador import GestorJugadores
 from Modulo_creacionDelArbol import construir_arbol_balanceado, Pregunta
 
@@ -18,7 +24,10 @@ class GameConfig:
     Atributos:
         SCREEN_WIDTH (int): Ancho de la pantalla de juego.
         SCREEN_HEIGHT (int): Altura de la pantalla de juego.
-        FPS (int): Cuadros por segundo del juego.
+        FPS (int): Cuadros por segundo máximos del dibujado.
+        TICK_RATE (int): Ticks de lógica por segundo; las velocidades están en píxeles por tick.
+        MAX_CATCHUP_STEPS (int): Máximo de ticks de lógica por cuadro al recuperar atraso.
+        INTERPOLATE (bool): Si se interpolan las posiciones entre ticks al dibujar.
         PLAYER_SPEED (int): Velocidad de movimiento del jugador.
         INITIAL_OBSTACLE_COUNT (int): Número de obstáculos al inicio del juego.
         MAX_OBSTACLE_COUNT (int): Número máximo de obstáculos permitidos.
@@ -26,10 +35,21 @@ class GameConfig:
         BASE_OBSTACLE_SPEED (int): Velocidad inicial de los obstáculos.
         SPEED_INCREMENT (float): Tasa de incremento de velocidad.
         POINTS_TO_ADVANCE (int): Puntos necesarios para avanzar de categoría.
+        PREFETCH_THRESHOLD (float): Fracción de POINTS_TO_ADVANCE a partir de la cual se
+            cargan en segundo plano los recursos de la siguiente categoría.
+        COLLISION_CELL_SIZE (int): Lado de las celdas de la rejilla de colisiones.
+        DIRTY_RECTS (bool): Si se redibujan y envían a pantalla solo las zonas que cambiaron.
+        PIXEL_COLLISIONS (bool): Si los choques se confirman con las máscaras de los
+            sprites en lugar de solo con sus rectángulos.
+        PRELOAD_ALL_CATEGORIES (bool): Si al iniciar se cargan en paralelo los recursos
+            de todas las categorías de CATEGORIA_PROGRESSION.
     """
     SCREEN_WIDTH: int = 800
     SCREEN_HEIGHT: int = 600
     FPS: int = 60
+    TICK_RATE: int = 60
+    MAX_CATCHUP_STEPS: int = 5
+    INTERPOLATE: bool = False
     PLAYER_SPEED: int = 5
     INITIAL_OBSTACLE_COUNT: int = 5
     MAX_OBSTACLE_COUNT: int = 10
@@ -37,6 +57,11 @@ class GameConfig:
     BASE_OBSTACLE_SPEED: int = 5
     SPEED_INCREMENT: float = 0.5
     POINTS_TO_ADVANCE: int = 500
+    PREFETCH_THRESHOLD: float = 0.7
+    COLLISION_CELL_SIZE: int = 100
+    DIRTY_RECTS: bool = False
+    PIXEL_COLLISIONS: bool = True
+    PRELOAD_ALL_CATEGORIES: bool = False
     
 class DificultadJuego:
     """
@@ -84,14 +109,16 @@ class SistemaPreguntas:
         preguntas_por_categoria (Dict[str, List[Dict]]): Diccionario de preguntas para cada categoría.
         arbol (Optional): Árbol de preguntas balanceado para la categoría actual.
     """
-    def __init__(self, categoria: str):
+    def __init__(self, categoria: str, rng: Optional[random.Random] = None):
         """
         Inicializa el sistema de preguntas para una categoría específica.
         
         Args:
             categoria (str): La categoría del juego para inicializar las preguntas.
+            rng (random.Random, opcional): Generador aleatorio a usar. Por defecto uno nuevo sin semilla.
         """
         self.categoria = categoria
+        self.rng = rng or random.Random()
         self.preguntas_por_categoria = self._inicializar_preguntas()
         self.arbol = self._construir_arbol_inicial()
         
@@ -147,29 +174,24 @@ class SistemaPreguntas:
             List[Dict]: Lista de preguntas seleccionadas aleatoriamente.
         """
         preguntas = self.preguntas_por_categoria.get(self.categoria.lower(), [])
-        return random.sample(preguntas, min(len(preguntas), num_preguntas))
+        return self.rng.sample(preguntas, min(len(preguntas), num_preguntas))
 
-    def mostrar_pregunta(self, screen, pregunta_dict: Dict) -> Optional[bool]:
+    def dibujar_pregunta(self, screen, pregunta_dict: Dict):
         """
-        Muestra una pregunta en pantalla y maneja la interacción del usuario.
+        Dibuja el diálogo de una pregunta y lo envía a pantalla.
         
         Args:
             screen: Superficie de Pygame donde se mostrará la pregunta.
             pregunta_dict (Dict): Diccionario con los detalles de la pregunta.
-        
-        Returns:
-            Optional[bool]: True si la respuesta es correcta, False si es incorrecta, 
-                            None si no hay respuesta aún.
         """
         # Configuración de la ventana de pregunta
         pygame.draw.rect(screen, (0, 0, 0), (100, 100, 600, 400))
         pygame.draw.rect(screen, (255, 255, 255), (110, 110, 580, 380))
         
         # Renderizado del texto
-        font = pygame.font.Font(None, 36)
-        pregunta_texto = font.render(pregunta_dict["pregunta"], True, (0, 0, 0))
-        opcion1 = font.render(f"1. {pregunta_dict['opciones'][0]}", True, (0, 0, 0))
-        opcion2 = font.render(f"2. {pregunta_dict['opciones'][1]}", True, (0, 0, 0))
+        pregunta_texto = renderizar_texto(pregunta_dict["pregunta"], (0, 0, 0))
+        opcion1 = renderizar_texto(f"1. {pregunta_dict['opciones'][0]}", (0, 0, 0))
+        opcion2 = renderizar_texto(f"2. {pregunta_dict['opciones'][1]}", (0, 0, 0))
         
         # Posicionamiento del texto
         screen.blit(pregunta_texto, (150, 150))
@@ -177,16 +199,52 @@ class SistemaPreguntas:
         screen.blit(opcion2, (150, 300))
         
         pygame.display.flip()
+
+    def mostrar_pregunta(self, screen, pregunta_dict: Dict, timeout_ms: int = 1000) -> Optional[bool]:
+        """
+        Muestra una pregunta en pantalla y espera la respuesta del usuario.
         
-        # Manejo de eventos
-        for event in pygame.event.get():
+        El diálogo se dibuja una vez y luego el hilo se bloquea en pygame.event.wait,
+        así que mientras el jugador piensa no se consume CPU. Solo se vuelve a
+        dibujar si la ventana necesita repintarse. Este es el único lugar donde se
+        leen los eventos mientras hay una pregunta en pantalla.
+        
+        Args:
+            screen: Superficie de Pygame donde se mostrará la pregunta.
+            pregunta_dict (Dict): Diccionario con los detalles de la pregunta.
+            timeout_ms (int): Máximo de milisegundos bloqueado en cada espera.
+        
+        Returns:
+            Optional[bool]: True si la respuesta es correcta, False si es incorrecta, 
+                            None si se cerró la ventana.
+        """
+        self.dibujar_pregunta(screen, pregunta_dict)
+        
+        while True:
+            event = pygame.event.wait(timeout_ms)
+            if event.type == pygame.QUIT:
+                return None
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_1:
                     return pregunta_dict['opciones'][0] == pregunta_dict['correcta']
                 elif event.key == pygame.K_2:
                     return pregunta_dict['opciones'][1] == pregunta_dict['correcta']
-        
-        return None
+            elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED):
+                self.dibujar_pregunta(screen, pregunta_dict)
+
+def responder_siempre(correcta: bool = True):
+    """
+    Crea un respondedor de preguntas que siempre acierta o siempre falla.
+
+    Args:
+        correcta (bool): Si las respuestas deben ser correctas.
+
+    Returns:
+        Callable: Función compatible con el parámetro responder de JuegoMejorado.
+    """
+    def responder(pregunta: Dict) -> bool:
+        return correcta
+    return responder
 
 class JuegoMejorado:
     """
@@ -199,35 +257,74 @@ class JuegoMejorado:
         score (int): Puntuación actual del jugador.
         lives (int): Vidas restantes del jugador.
         running (bool): Estado de ejecución del juego.
+        headless (bool): Si el juego corre sin ventana y sin límite de FPS.
+        semilla (int): Semilla del generador aleatorio de la partida.
+        rng (random.Random): Generador aleatorio propio de la partida.
+        perfilador (PerfiladorFrames, opcional): Perfilador de fases por cuadro.
+        tiempo_precalentamiento_ms (float, opcional): Lo que tardó la carga en paralelo
+            de todas las categorías, si PRELOAD_ALL_CATEGORIES está activo.
     """
-    def __init__(self, categoria: str = "granja", nombre_jugador: str = None):
+    def __init__(self, categoria: str = "granja", nombre_jugador: str = None,
+                 headless: bool = False, semilla: Optional[int] = None,
+                 entrada: Optional[Callable] = None,
+                 responder: Optional[Callable[[Dict], Optional[bool]]] = None,
+                 perfilador: Optional[PerfiladorFrames] = None,
+                 config: Optional[GameConfig] = None):
         """
         Inicializa el juego con una categoría específica y un nombre de jugador opcional.
         
         Args:
             categoria (str, opcional): Categoría inicial del juego. Por defecto "granja".
             nombre_jugador (str, opcional): Nombre del jugador para seguimiento de progreso. Por defecto None.
+            headless (bool, opcional): Usa el driver de video "dummy", no dibuja y no limita los FPS.
+            semilla (int, opcional): Semilla del generador aleatorio para partidas reproducibles.
+            entrada (Callable, opcional): Fuente de teclado con la misma interfaz que
+                pygame.key.get_pressed. Por defecto se usa el teclado real.
+            responder (Callable, opcional): Recibe el diccionario de una pregunta y devuelve
+                True/False según la respuesta, o None para terminar la partida. Por
+                defecto se muestra la pregunta en pantalla, o se acierta siempre si
+                headless es True.
+            perfilador (PerfiladorFrames, opcional): Si se indica, mide cada fase del cuadro.
+                F3 muestra u oculta el overlay y el historial se vuelca al terminar.
+            config (GameConfig, opcional): Configuración del juego. Por defecto GameConfig().
         """
-        if pygame.get_init():
-            pygame.quit()
-        pygame.init()
-        # Configuración inicial
-        self.config = GameConfig()
-        self.screen = pygame.display.set_mode((self.config.SCREEN_WIDTH, self.config.SCREEN_HEIGHT))
+        self.headless = headless
+        # SDL solo lee el driver al abrir la pantalla: se restaura enseguida para
+        # que las partidas con ventana creadas después no hereden "dummy"
+        driver_anterior = os.environ.get("SDL_VIDEODRIVER")
+        if headless:
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+        try:
+            if pygame.get_init():
+                pygame.quit()
+            pygame.init()
+            # Las fuentes de una sesión anterior de pygame ya no son válidas
+            cache_texto.limpiar()
+            # Configuración inicial
+            self.config = config or GameConfig()
+            self.screen = pygame.display.set_mode((self.config.SCREEN_WIDTH, self.config.SCREEN_HEIGHT))
+        finally:
+            if headless:
+                if driver_anterior is None:
+                    del os.environ["SDL_VIDEODRIVER"]
+                else:
+                    os.environ["SDL_VIDEODRIVER"] = driver_anterior
         self.clock = pygame.time.Clock()
+        # Sin semilla explícita se elige una, para que la partida pueda grabarse y repetirse
+        self.semilla = semilla if semilla is not None else random.randrange(2 ** 63)
+        self.rng = random.Random(self.semilla)
+        self.entrada = entrada or pygame.key.get_pressed
+        # Sin ventana no hay quien conteste el diálogo: se responde siempre bien
+        self.responder = responder or (responder_siempre(True) if headless else None)
         
         # Sistema de preguntas
-        self.sistema_preguntas = SistemaPreguntas(categoria)
+        self.sistema_preguntas = SistemaPreguntas(categoria, self.rng)
         self.nivel_actual = 0
         self.dificultad = DificultadJuego.MUY_BAJO
         self.preguntas_respondidas = 0
         
         # Estado del juego
         self.running = True
-        self.clock = pygame.time.Clock()
-        
-        # Configuración de pantalla
-        self.screen = pygame.display.set_mode((self.config.SCREEN_WIDTH, self.config.SCREEN_HEIGHT))
         
         # Jugador y estadísticas del juego
         self.categoria = categoria.lower()
@@ -242,11 +339,28 @@ class JuegoMejorado:
         pygame.display.set_caption(f"Dodge Obstacles - {self.categoria}")
         
         # Gestión de obstáculos
-        self.obstacles = []
+        # Pool de capacidad fija: aparecer obstáculos reutiliza ranuras libres.
+        # Al inicio y al cambiar de categoría aparecen INITIAL_OBSTACLE_COUNT, que
+        # puede superar a MAX_OBSTACLE_COUNT
+        self.obstacles = AlmacenObstaculos(max(self.config.INITIAL_OBSTACLE_COUNT,
+                                               self.config.MAX_OBSTACLE_COUNT))
+        self.rejilla = HashEspacial(self.config.COLLISION_CELL_SIZE, self.obstacles.capacidad)
         self.spawn_delay_counter = 0
         self.current_obstacle_count = self.config.INITIAL_OBSTACLE_COUNT
         self.current_speed = self.config.BASE_OBSTACLE_SPEED
         
+        # Estado del renderizado
+        self.fondo = None
+        self._rects_previos: List[pygame.Rect] = []
+        self._redibujar_todo = True
+        
+        # Bucle de paso fijo
+        self._acumulado = 0.0
+        self._tiempo_anterior = time.perf_counter()
+        # Posición del tick anterior, copiada en el lugar para no crear listas por tick
+        self._player_pos_previo = [0.0, 0.0]
+        self._interpolar_jugador = False
+        
         # Sistema de gestión de jugadores
         if nombre_jugador:
             self.gestor_jugadores = GestorJugadores()
@@ -256,22 +370,19 @@ class JuegoMejorado:
                 self.score = ultimo_progreso.puntos
         
         # Carga de recursos
+        self.precarga = PrecargaAssets()
+        self.tiempo_precalentamiento_ms = None
+        if self.config.PRELOAD_ALL_CATEGORIES:
+            self.tiempo_precalentamiento_ms = precalentar_categorias(CATEGORIA_PROGRESSION) * 1e3
+            print(f"Recursos de {len(CATEGORIA_PROGRESSION)} categorías cargados en "
+                  f"{self.tiempo_precalentamiento_ms:.1f} ms")
         try:
             self.assets = AssetManager(self.categoria)
+            self._preparar_fondo()
+            self._cachear_dimensiones()
             
             # Posición inicial del jugador
-            player_img = self.assets.images.get("player")
-            if player_img:
-                player_height = player_img.get_height()
-                self.player_pos = [
-                    self.config.SCREEN_WIDTH // 2,
-                    self.config.SCREEN_HEIGHT - player_height - 10
-                ]
-            else:
-                self.player_pos = [
-                    self.config.SCREEN_WIDTH // 2,
-                    self.config.SCREEN_HEIGHT - 100
-                ]
+            self.player_pos = list(self._posicion_inicial)
             
             # Generación inicial de obstáculos
             for _ in range(self.current_obstacle_count):
@@ -280,6 +391,11 @@ class JuegoMejorado:
         except Exception as e:
             print(f"Error loading assets: {e}")
             self.running = False
+        
+        # Sin perfilador no se envuelve ningún método, así que no hay costo
+        self.perfilador = perfilador
+        if perfilador:
+            perfilador.instrumentar(self)
 
     def manejar_preguntas_inicio_categoria(self) -> bool:
         """
@@ -294,73 +410,88 @@ class JuegoMejorado:
         preguntas = self.sistema_preguntas.obtener_preguntas_categoria(num_preguntas)
         
         for pregunta in preguntas:
-            respondido = False
-            while not respondido and self.running:
+            if not self.running:
+                return False
+            if self.responder:
+                respuesta = self.responder(pregunta)
+            else:
                 respuesta = self.sistema_preguntas.mostrar_pregunta(self.screen, pregunta)
-                if respuesta is not None:
-                    respondido = True
-                    if respuesta:
-                        self.dificultad = max(DificultadJuego.MUY_BAJO, self.dificultad - 1)
-                    else:
-                        self.dificultad = min(DificultadJuego.DIFICIL, self.dificultad + 1)
-
-                    # Actualizar velocidad de los obstáculos basado en la dificultad
-                    self.current_speed = DificultadJuego.obtener_velocidad_base(self.dificultad)
-                
-                # Manejar eventos de cierre de ventana
-                for event in pygame.event.get():
-                    if event.type == pygame.QUIT:
-                        self.running = False
-                        return False
-                
-                self.clock.tick(self.config.FPS)
-                
+            
+            # Se cerró la ventana mientras se mostraba la pregunta
+            if respuesta is None:
+                self.running = False
+                return False
+            
+            if respuesta:
+                self.dificultad = max(DificultadJuego.MUY_BAJO, self.dificultad - 1)
+            else:
+                self.dificultad = min(DificultadJuego.DIFICIL, self.dificultad + 1)
+
+            # Actualizar velocidad de los obstáculos basado en la dificultad
+            self.current_speed = DificultadJuego.obtener_velocidad_base(self.dificultad)
+        
+        # El diálogo tapó la escena: el próximo cuadro se redibuja completo
+        self._redibujar_todo = True
+        # El tiempo que el jugador pasó respondiendo no cuenta como atraso de la lógica
+        self._reiniciar_reloj()
         return True
+
     def handle_events(self):
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.running = False
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3 and self.perfilador:
+                self.perfilador.alternar_overlay()
         return self.running
 
     def handle_player_movement(self):
-        keys = pygame.key.get_pressed()
+        keys = self.entrada()
         if keys[pygame.K_LEFT] and self.player_pos[0] > 0:
-            self.player_pos[0] -= self.config.PLAYER_SPEED
-        if keys[pygame.K_RIGHT] and self.player_pos[0] < self.config.SCREEN_WIDTH - 50:
-            self.player_pos[0] += self.config.PLAYER_SPEED
+            self.player_pos[0] -= self._velocidad_jugador
+        if keys[pygame.K_RIGHT] and self.player_pos[0] < self._limite_jugador_x:
+            self.player_pos[0] += self._velocidad_jugador
         if keys[pygame.K_UP] and self.player_pos[1] > 0:
-            self.player_pos[1] -= self.config.PLAYER_SPEED
-        if keys[pygame.K_DOWN] and self.player_pos[1] < self.config.SCREEN_HEIGHT - 50:
-            self.player_pos[1] += self.config.PLAYER_SPEED
+            self.player_pos[1] -= self._velocidad_jugador
+        if keys[pygame.K_DOWN] and self.player_pos[1] < self._limite_jugador_y:
+            self.player_pos[1] += self._velocidad_jugador
     
     def spawn_obstacle(self, random_position=False):
-        obstacle_img = self.assets.images.get("obstacle")
-        if obstacle_img:
-            obstacle_width = obstacle_img.get_width()
-            obstacle_height = obstacle_img.get_height()
-        else:
-            obstacle_width = 30
-            obstacle_height = 30
+        obstacle_width, obstacle_height = self._tam_obstaculo
         
         if random_position:
-            y_pos = random.randint(-200, 0)
+            y_pos = self.rng.randint(-200, 0)
         else:
-            y_pos = -obstacle_height
-            
-        obstacle = pygame.Rect(
-            random.randint(0, self.config.SCREEN_WIDTH - obstacle_width),
-            y_pos,
-            obstacle_width,
-            obstacle_height
-        )
-        self.obstacles.append(obstacle)
+            y_pos = self._y_aparicion
+        
+        # Entero uniforme en [0, ancho de pantalla - ancho] calculado como float:
+        # randint() crearía enteros nuevos en cada aparición
+        x_pos = (self.rng.random() * self._rango_aparicion_x) // 1.0
+        clave = self.obstacles.agregar(x_pos, y_pos, obstacle_width, obstacle_height, self.current_speed)
+        self.rejilla.insertar(clave, x_pos, y_pos, obstacle_width, obstacle_height)
+
+    @property
+    def current_speed(self) -> float:
+        """Velocidad de caída de los obstáculos; al cambiarla se aplica a todos los activos."""
+        return self._current_speed
+
+    @current_speed.setter
+    def current_speed(self, valor: float):
+        self._current_speed = valor
+        self.obstacles.fijar_velocidad(valor)
 
     def update_obstacles(self):
-        for obstacle in self.obstacles[:]:
-            obstacle.y += self.current_speed
-            if obstacle.y > self.config.SCREEN_HEIGHT:
-                self.obstacles.remove(obstacle)
-                self.score += 10
+        # Todos los obstáculos caen igual: se desplaza la rejilla completa en O(1)
+        self.obstacles.mover()
+        self.rejilla.desplazar(0, self.current_speed)
+        
+        esquivados = self.obstacles.descartar_fuera(self.config.SCREEN_HEIGHT)
+        if esquivados:
+            self.score += 10 * esquivados
+            eliminados = self.obstacles.eliminados
+            i = 0
+            while i < esquivados:
+                self.rejilla.eliminar(eliminados.item(i))
+                i += 1
         
         # Spawn new obstacles
         if len(self.obstacles) < self.current_obstacle_count:
@@ -370,16 +501,26 @@ class JuegoMejorado:
                 self.spawn_delay_counter = 0
 
     def check_collisions(self):
-        player_rect = pygame.Rect(self.player_pos[0], self.player_pos[1], 50, 50)
-        return any(obstacle.colliderect(player_rect) for obstacle in self.obstacles)
+        x, y = self.player_pos
+        ancho, alto = self._tam_jugador
+        if self.config.PIXEL_COLLISIONS:
+            # Prefiltro por rectángulos; las máscaras solo se comparan con los candidatos
+            mascaras = self.assets.mascaras
+            return self.rejilla.colisiona(x, y, ancho, alto, mascaras.get("player"), mascaras.get("obstacle"))
+        return self.rejilla.colisiona(x, y, ancho, alto)
     
     def check_category_progression(self):
         """
         Check if player has reached points threshold to advance to next category
         """
-        if (self.score >= self.config.POINTS_TO_ADVANCE and 
-            self.current_categoria_index < len(CATEGORIA_PROGRESSION) - 1):
-            
+        if self.current_categoria_index >= len(CATEGORIA_PROGRESSION) - 1:
+            return False
+        
+        # Precargar la siguiente categoría en segundo plano al acercarse al umbral
+        if self.score >= self.config.POINTS_TO_ADVANCE * self.config.PREFETCH_THRESHOLD:
+            self.precarga.solicitar(CATEGORIA_PROGRESSION[self.current_categoria_index + 1])
+        
+        if self.score >= self.config.POINTS_TO_ADVANCE:
             # Advance to next category
             self.current_categoria_index += 1
             new_categoria = CATEGORIA_PROGRESSION[self.current_categoria_index]
@@ -392,73 +533,143 @@ class JuegoMejorado:
             self.current_speed = self.config.BASE_OBSTACLE_SPEED
             self.current_obstacle_count = self.config.INITIAL_OBSTACLE_COUNT
             
-            # Reload assets for new category
-            self.assets = AssetManager(new_categoria)
+            # Swap in the assets prefetched for the new category
+            self.assets.liberar()
+            self.assets = self.precarga.obtener(new_categoria)
+            self._preparar_fondo()
+            self._cachear_dimensiones()
             
             # Update display caption
             pygame.display.set_caption(f"Dodge Obstacles - {new_categoria}")
             
             # Reset player position
-            player_img = self.assets.images.get("player")
-            if player_img:
-                player_height = player_img.get_height()
-                self.player_pos = [
-                    self.config.SCREEN_WIDTH // 2,
-                    self.config.SCREEN_HEIGHT - player_height - 10
-                ]
-            else:
-                self.player_pos = [
-                    self.config.SCREEN_WIDTH // 2,
-                    self.config.SCREEN_HEIGHT - 100
-                ]
+            self.player_pos[0], self.player_pos[1] = self._posicion_inicial
             
             # Clear existing obstacles and spawn new ones
-            self.obstacles.clear()
+            self.obstacles.limpiar()
+            self.rejilla.limpiar()
             for _ in range(self.current_obstacle_count):
                 self.spawn_obstacle(random_position=True)
             
             return True
         return False
 
-    def draw(self):
-        # Draw background
+    def _cachear_dimensiones(self):
+        """
+        Guarda el tamaño de los sprites de la categoría actual.
+        
+        Se llama una vez por categoría para que aparecer obstáculos y ubicar al
+        jugador no consulten las imágenes en cada tick. Los valores que usa cada
+        tick se guardan como float: las operaciones entre enteros grandes crean
+        objetos nuevos y las de float reutilizan los liberados.
+        """
+        ancho_pantalla, alto_pantalla = self.config.SCREEN_WIDTH, self.config.SCREEN_HEIGHT
+        obstacle_img = self.assets.images.get("obstacle")
+        self._tam_obstaculo = obstacle_img.get_size() if obstacle_img else (30, 30)
+        self._y_aparicion = float(-self._tam_obstaculo[1])
+        self._rango_aparicion_x = float(ancho_pantalla - self._tam_obstaculo[0] + 1)
+        player_img = self.assets.images.get("player")
+        self._tam_jugador = player_img.get_size() if player_img else (50, 50)
+        alto_inicial = self._tam_jugador[1] + 10 if player_img else 100
+        self._posicion_inicial = (float(ancho_pantalla // 2), float(alto_pantalla - alto_inicial))
+        self._posicion_reinicio = (float(ancho_pantalla // 2), float(alto_pantalla - 100))
+        self._velocidad_jugador = float(self.config.PLAYER_SPEED)
+        self._limite_jugador_x = float(ancho_pantalla - 50)
+        self._limite_jugador_y = float(alto_pantalla - 50)
+
+    def _preparar_fondo(self):
+        """
+        Escala y convierte el fondo de la categoría actual al formato de la pantalla.
+        
+        Se llama una vez por categoría, en lugar de escalar el fondo en cada cuadro.
+        """
+        size = (self.config.SCREEN_WIDTH, self.config.SCREEN_HEIGHT)
         background = self.assets.images.get("background")
         if background:
-            scaled_background = pygame.transform.scale(background, 
-                (self.config.SCREEN_WIDTH, self.config.SCREEN_HEIGHT))
-            self.screen.blit(scaled_background, (0, 0))
+            self.fondo = pygame.transform.scale(background, size).convert()
         else:
-            self.screen.fill((100, 100, 255))
+            self.fondo = pygame.Surface(size).convert()
+            self.fondo.fill((100, 100, 255))
+        self._redibujar_todo = True
+
+    def _draw_elements(self, alpha: float = 1.0) -> List[pygame.Rect]:
+        """
+        Dibuja obstáculos, jugador y HUD sobre la pantalla.
+        
+        Args:
+            alpha (float): Fracción del tick actual ya transcurrida. Con 1.0 se dibuja
+                el estado del último tick; con valores menores se interpola entre el
+                tick anterior y el actual.
+        
+        Returns:
+            List[pygame.Rect]: Zonas de la pantalla que se pintaron.
+        """
+        rects = []
+        obstaculos = self.obstacles.rects(-(1.0 - alpha) * self.current_speed) if alpha < 1.0 else self.obstacles
+        player_pos = self.player_pos
+        if alpha < 1.0 and self._interpolar_jugador:
+            player_pos = [previo + (actual - previo) * alpha
+                          for previo, actual in zip(self._player_pos_previo, self.player_pos)]
         
         # Draw obstacles
         obstacle_img = self.assets.images.get("obstacle")
         if obstacle_img:
-            for obs in self.obstacles:
-                self.screen.blit(obstacle_img, obs)
+            rects.extend(self.screen.blits([(obstacle_img, obs) for obs in obstaculos]))
         else:
-            for obs in self.obstacles:
-                pygame.draw.rect(self.screen, (255, 0, 0), obs)
+            for obs in obstaculos:
+                rects.append(pygame.draw.rect(self.screen, (255, 0, 0), obs))
         
         # Draw player
         player_img = self.assets.images.get("player")
         if player_img:
-            self.screen.blit(player_img, self.player_pos)
+            rects.append(self.screen.blit(player_img, player_pos))
         else:
-            pygame.draw.rect(self.screen, (0, 255, 0), 
-                        pygame.Rect(self.player_pos[0], self.player_pos[1], 50, 50))
+            rects.append(pygame.draw.rect(self.screen, (0, 255, 0), 
+                        pygame.Rect(player_pos[0], player_pos[1], 50, 50)))
         
         # HUD
-        font = pygame.font.Font(None, 36)
-        score_text = font.render(f"Puntos: {self.score}", True, (255, 255, 255))
-        lives_text = font.render(f"Vidas: {self.lives}", True, (255, 255, 255))
-        category_text = font.render(f"Categoría: {self.categoria}", True, (255, 255, 255))
+        score_text = renderizar_texto(f"Puntos: {self.score}")
+        lives_text = renderizar_texto(f"Vidas: {self.lives}")
+        category_text = renderizar_texto(f"Categoría: {self.categoria}")
         
-        self.screen.blit(score_text, (10, 10))
-        self.screen.blit(lives_text, (10, 50))
-        self.screen.blit(category_text, (10, 90))
+        rects.append(self.screen.blit(score_text, (10, 10)))
+        rects.append(self.screen.blit(lives_text, (10, 50)))
+        rects.append(self.screen.blit(category_text, (10, 90)))
+        
+        if self.perfilador and self.perfilador.overlay_visible:
+            rects.extend(self.perfilador.dibujar_overlay(self.screen))
+        return rects
+
+    def draw(self, alpha: float = 1.0):
+        # Si cambió el modo de video, las imágenes y el fondo se convierten de nuevo
+        if self.assets.asegurar_formato_pantalla():
+            self._preparar_fondo()
+        
+        if self.config.DIRTY_RECTS and not self._redibujar_todo:
+            self._draw_dirty(alpha)
+            return
+        
+        # Draw background
+        self.screen.blit(self.fondo, (0, 0))
+        self._rects_previos = self._draw_elements(alpha)
+        self._redibujar_todo = False
         
         pygame.display.flip()
 
+    def _draw_dirty(self, alpha: float = 1.0):
+        """
+        Redibuja solo las zonas que cambiaron desde el cuadro anterior.
+        
+        Borra lo pintado en el cuadro previo restaurando el fondo en esas zonas,
+        dibuja la escena actual y envía a pantalla la unión de ambas listas.
+        """
+        for rect in self._rects_previos:
+            self.screen.blit(self.fondo, rect, rect)
+        
+        rects = self._draw_elements(alpha)
+        pygame.display.update(self._rects_previos + rects)
+        self._rects_previos = rects
+
     def guardar_progreso(self):
         if self.nombre_jugador:
             try:
@@ -474,36 +685,102 @@ class JuegoMejorado:
     def cleanup(self):
         self.guardar_progreso()
         if hasattr(self, 'assets'):
-            self.assets.images.clear()
+            # Las imágenes quedan en el registro compartido para la próxima partida
+            self.assets.liberar()
+        if self.perfilador:
+            self.perfilador.guardar()
+        self.precarga.cerrar()
+        cache_texto.limpiar()
         pygame.quit()
 
+    def _reiniciar_reloj(self):
+        """Descarta el tiempo acumulado del bucle de paso fijo."""
+        self._acumulado = 0.0
+        self._tiempo_anterior = time.perf_counter()
+
     def run(self):
         # Iniciar con preguntas de la primera categoría
         if not self.manejar_preguntas_inicio_categoria():
             self.cleanup()
             return
 
+        if self.headless:
+            while self.running and self.lives > 0:
+                self.handle_events()
+                if not self.update():
+                    break
+                if self.perfilador:
+                    self.perfilador.cerrar_frame()
+        else:
+            self._run_fixed_timestep()
+        
+        self.cleanup()
+
+    def _run_fixed_timestep(self):
+        """
+        Bucle principal de paso fijo.
+        
+        La lógica avanza en ticks de 1/TICK_RATE segundos según el tiempo real
+        acumulado, y se dibuja una vez por vuelta a la tasa que permita la máquina
+        (como máximo FPS). Si un cuadro se atrasa, se ejecutan hasta
+        MAX_CATCHUP_STEPS ticks para ponerse al día y el resto del atraso se
+        descarta, de modo que un cuadro lento no provoca una espiral de atraso.
+        """
+        dt = 1.0 / self.config.TICK_RATE
+        self._reiniciar_reloj()
+        
         while self.running and self.lives > 0:
-            self.handle_events()
-            self.handle_player_movement()
-            self.update_obstacles()
+            ahora = time.perf_counter()
+            self._acumulado += ahora - self._tiempo_anterior
+            self._tiempo_anterior = ahora
             
-            if self.check_collisions():
-                self.lives -= 1
-                if self.lives <= 0:
-                    break
-                self.player_pos = [self.config.SCREEN_WIDTH // 2, self.config.SCREEN_HEIGHT - 100]
+            self.handle_events()
             
-            # Verificar progresión de categoría
-            if self.check_category_progression():
-                self.nivel_actual += 1
-                if not self.manejar_preguntas_inicio_categoria():
-                    break
+            pasos = 0
+            while self._acumulado >= dt and pasos < self.config.MAX_CATCHUP_STEPS:
+                # Se descuenta antes de update(): si abre el diálogo de preguntas,
+                # _reiniciar_reloj() deja el acumulado en 0 y no debe quedar negativo
+                self._acumulado -= dt
+                if not self.update():
+                    return
+                pasos += 1
+            if self._acumulado >= dt:
+                self._acumulado = 0.0
             
-            self.draw()
+            self.draw(self._acumulado / dt if self.config.INTERPOLATE else 1.0)
+            if self.perfilador:
+                self.perfilador.cerrar_frame()
             self.clock.tick(self.config.FPS)
+
+    def update(self) -> bool:
+        """
+        Avanza un tick de lógica: movimiento, obstáculos, colisiones y progresión.
         
-        self.cleanup()
+        No dibuja ni espera al reloj, por lo que puede llamarse en bucle tan rápido
+        como permita la CPU (modo headless y benchmarks).
+        
+        Returns:
+            bool: False si la partida terminó durante este tick, True en otro caso.
+        """
+        self._player_pos_previo[0], self._player_pos_previo[1] = self.player_pos
+        self._interpolar_jugador = True
+        self.handle_player_movement()
+        self.update_obstacles()
+        
+        if self.check_collisions():
+            self.lives -= 1
+            if self.lives <= 0:
+                return False
+            self.player_pos[0], self.player_pos[1] = self._posicion_reinicio
+            self._interpolar_jugador = False
+        
+        # Verificar progresión de categoría
+        if self.check_category_progression():
+            self._interpolar_jugador = False
+            self.nivel_actual += 1
+            if not self.manejar_preguntas_inicio_categoria():
+                return False
+        return True
 
 def inicio(categoria: str = "granja", nombre_jugador: str = None):
     """Game initialization function"""
@@ -0,0 +1,270 @@
+import argparse
+import io
+import json
+import os
+import threading
+from dataclasses import asdict, dataclass
+from PIL import Image
+from typing import Dict, List, Optional
+from Modulo_CacheAssets import CacheDiscoAssets
+
+
+BASE_PATH = os.path.dirname(os.path.abspath(__file__))
+ASSETS_PATH = os.path.join(BASE_PATH, "assets")
+RUTA_MANIFIESTO = os.path.join(ASSETS_PATH, ".cache", "manifiesto.json")
+VERSION_MANIFIESTO = 1
+
+CATEGORIAS = ["granja", "bosque", "ciudad", "espacio", "marte"]
+# Categoría del manifiesto para las imágenes sueltas de assets/*.png
+PREFIJO_COMUN = "comun"
+# Imágenes que se crean de un color si faltan en una categoría nueva
+IMAGENES_POR_DEFECTO = [
+    ("player", (50, 50), (0, 255, 0)),      # Verde
+    ("obstacle", (50, 30), (255, 0, 0)),    # Rojo
+    ("background", (800, 600), (100, 100, 255))  # Azul claro
+]
+
+@dataclass
+class EntradaAsset:
+    """
+    Descripción de un archivo de imagen del manifiesto.
+
+    Atributos:
+        ruta (str): Ruta relativa a la carpeta assets.
+        ancho (int): Ancho de la imagen en el archivo.
+        alto (int): Alto de la imagen en el archivo.
+        modo (str): Modo PIL de la imagen ("RGB", "RGBA", "P", ...).
+        huella (str): Hash del contenido, el mismo que usa la caché en disco.
+        firma (List[int]): Fecha de modificación (ns) y tamaño del archivo.
+    """
+    ruta: str
+    ancho: int
+    alto: int
+    modo: str
+    huella: str
+    firma: List[int]
+
+def _firma(ruta: str) -> List[int]:
+    info = os.stat(ruta)
+    return [info.st_mtime_ns, info.st_size]
+
+def describir(assets_path: str, relativa: str) -> EntradaAsset:
+    """
+    Lee un archivo de imagen y arma su entrada del manifiesto.
+
+    Solo se decodifica la cabecera del PNG para conocer tamaño y modo.
+
+    Raises:
+        OSError: Si el archivo no existe o no es una imagen.
+    """
+    ruta = os.path.join(assets_path, relativa)
+    with open(ruta, "rb") as f:
+        datos = f.read()
+    with Image.open(io.BytesIO(datos)) as imagen:
+        ancho, alto = imagen.size
+        modo = imagen.mode
+    return EntradaAsset(relativa.replace(os.sep, "/"), ancho, alto, modo,
+                        CacheDiscoAssets.huella(datos), _firma(ruta))
+
+def crear_estructura(assets_path: str = ASSETS_PATH):
+    """
+    Crea la estructura de carpetas necesaria para los recursos.
+
+    Genera el directorio de cada categoría si no existe, con imágenes de
+    player, obstacle y background de colores predeterminados.
+    """
+    os.makedirs(assets_path, exist_ok=True)
+    for categoria in CATEGORIAS:
+        categoria_path = os.path.join(assets_path, categoria)
+        if os.path.exists(categoria_path):
+            continue
+        os.makedirs(categoria_path)
+        print(f"Creando imágenes por defecto en: {categoria_path}")
+        for name, size, color in IMAGENES_POR_DEFECTO:
+            try:
+                image_path = os.path.join(categoria_path, f"{name}.png")
+                Image.new('RGB', size, color).save(image_path)
+                print(f"Creada imagen: {image_path}")
+            except Exception as e:
+                print(f"Error creando imagen {name}: {e}")
+
+def _archivos_png(assets_path: str) -> Dict[str, List[str]]:
+    """Rutas relativas de los PNG de cada categoría y de los sueltos en assets/."""
+    archivos = {}
+    for categoria in CATEGORIAS + [PREFIJO_COMUN]:
+        carpeta = assets_path if categoria == PREFIJO_COMUN else os.path.join(assets_path, categoria)
+        try:
+            nombres = sorted(n for n in os.listdir(carpeta) if n.lower().endswith(".png"))
+        except OSError:
+            nombres = []
+        prefijo = "" if categoria == PREFIJO_COMUN else f"{categoria}/"
+        archivos[categoria] = [prefijo + nombre for nombre in nombres]
+    return archivos
+
+class ManifiestoAssets:
+    """
+    Índice de los archivos de imagen del juego: categoría → archivo → entrada.
+
+    Reemplaza el sondeo del sistema de archivos en cada AssetManager: el
+    manifiesto se lee una vez por proceso y las cargas toman de él la ruta y
+    el hash del contenido, con el que la caché en disco se consulta sin leer
+    el PNG. Los archivos nuevos o borrados se incorporan con reconstruir
+    (`python Modulo_Manifiesto.py reconstruir`).
+
+    Atributos:
+        assets_path (str): Carpeta assets a la que se refieren las rutas.
+        categorias (Dict[str, Dict[str, EntradaAsset]]): Entradas por categoría y
+            nombre de archivo ("player.png").
+    """
+    def __init__(self, assets_path: str, categorias: Dict[str, Dict[str, EntradaAsset]]):
+        self.assets_path = assets_path
+        self.categorias = categorias
+
+    def entrada(self, categoria: str, archivo: str) -> Optional[EntradaAsset]:
+        """Entrada de un archivo de una categoría, o None si no está en el manifiesto."""
+        return self.categorias.get(categoria, {}).get(archivo)
+
+    def ruta(self, entrada: EntradaAsset) -> str:
+        """Ruta absoluta del archivo de una entrada."""
+        return os.path.join(self.assets_path, entrada.ruta)
+
+    @classmethod
+    def construir(cls, assets_path: str = ASSETS_PATH) -> "ManifiestoAssets":
+        """Crea las carpetas que falten y describe todos los PNG de assets."""
+        crear_estructura(assets_path)
+        categorias = {}
+        for categoria, rutas in _archivos_png(assets_path).items():
+            categorias[categoria] = {}
+            for relativa in rutas:
+                try:
+                    categorias[categoria][os.path.basename(relativa)] = describir(assets_path, relativa)
+                except OSError as e:
+                    print(f"Ignorando {relativa}: {e}")
+        return cls(assets_path, categorias)
+
+    @classmethod
+    def leer(cls, ruta: str = RUTA_MANIFIESTO, assets_path: str = ASSETS_PATH) -> Optional["ManifiestoAssets"]:
+        """Lee un manifiesto guardado; devuelve None si falta o está dañado."""
+        try:
+            with open(ruta) as f:
+                datos = json.load(f)
+            if datos.get("version") != VERSION_MANIFIESTO:
+                return None
+            categorias = {
+                categoria: {archivo: EntradaAsset(**entrada) for archivo, entrada in entradas.items()}
+                for categoria, entradas in datos["categorias"].items()
+            }
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        return cls(assets_path, categorias)
+
+    def guardar(self, ruta: str = RUTA_MANIFIESTO):
+        """Escribe el manifiesto como JSON, reemplazando el anterior de forma atómica."""
+        datos = {
+            "version": VERSION_MANIFIESTO,
+            "categorias": {
+                categoria: {archivo: asdict(entrada) for archivo, entrada in sorted(entradas.items())}
+                for categoria, entradas in sorted(self.categorias.items())
+            },
+        }
+        os.makedirs(os.path.dirname(ruta), exist_ok=True)
+        temporal = ruta + ".tmp"
+        with open(temporal, "w") as f:
+            json.dump(datos, f, indent=2)
+        os.replace(temporal, ruta)
+
+    def actualizar(self) -> int:
+        """
+        Vuelve a describir las entradas cuyo archivo cambió de fecha o tamaño.
+
+        Solo consulta la fecha y el tamaño de los archivos ya indexados; las
+        entradas de archivos borrados se quitan.
+
+        Returns:
+            int: Entradas actualizadas o quitadas.
+        """
+        cambios = 0
+        for entradas in self.categorias.values():
+            for archivo, entrada in list(entradas.items()):
+                try:
+                    if _firma(self.ruta(entrada)) == entrada.firma:
+                        continue
+                    entradas[archivo] = describir(self.assets_path, entrada.ruta)
+                except OSError:
+                    del entradas[archivo]
+                cambios += 1
+        return cambios
+
+    def validar(self) -> List[str]:
+        """
+        Compara el manifiesto con el contenido real de la carpeta assets.
+
+        A diferencia de actualizar(), vuelve a leer y a calcular el hash de cada
+        archivo y busca PNG que no estén indexados.
+
+        Returns:
+            List[str]: Descripción de cada diferencia; vacía si el manifiesto está al día.
+        """
+        problemas = []
+        for categoria, rutas in _archivos_png(self.assets_path).items():
+            entradas = self.categorias.get(categoria, {})
+            for relativa in rutas:
+                if os.path.basename(relativa) not in entradas:
+                    problemas.append(f"{relativa}: no está en el manifiesto")
+        for entradas in self.categorias.values():
+            for entrada in entradas.values():
+                try:
+                    actual = describir(self.assets_path, entrada.ruta)
+                except OSError:
+                    problemas.append(f"{entrada.ruta}: no existe o no es una imagen")
+                    continue
+                if actual.huella != entrada.huella:
+                    problemas.append(f"{entrada.ruta}: el contenido cambió")
+                elif (actual.ancho, actual.alto, actual.modo) != (entrada.ancho, entrada.alto, entrada.modo):
+                    problemas.append(f"{entrada.ruta}: tamaño o modo distinto")
+        return problemas
+
+_manifiesto: Optional[ManifiestoAssets] = None
+_candado = threading.Lock()
+
+def manifiesto_compartido() -> ManifiestoAssets:
+    """
+    Devuelve el manifiesto del proceso, leyéndolo una sola vez.
+
+    La primera vez también actualiza las entradas de archivos modificados y,
+    si no hay manifiesto guardado, lo construye y lo guarda.
+    """
+    global _manifiesto
+    with _candado:
+        if _manifiesto is None:
+            manifiesto = ManifiestoAssets.leer()
+            if manifiesto is None:
+                manifiesto = ManifiestoAssets.construir()
+                manifiesto.guardar()
+            elif manifiesto.actualizar():
+                manifiesto.guardar()
+            _manifiesto = manifiesto
+        return _manifiesto
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Manifiesto de los archivos de assets")
+    parser.add_argument("comando", choices=["reconstruir", "validar"])
+    args = parser.parse_args(argv)
+    if args.comando == "reconstruir":
+        manifiesto = ManifiestoAssets.construir()
+        manifiesto.guardar()
+        total = sum(len(entradas) for entradas in manifiesto.categorias.values())
+        print(f"Manifiesto con {total} imágenes en {RUTA_MANIFIESTO}")
+        return 0
+    manifiesto = ManifiestoAssets.leer()
+    if manifiesto is None:
+        print("No hay manifiesto; ejecute 'reconstruir'")
+        return 1
+    problemas = manifiesto.validar()
+    for problema in problemas:
+        print(problema)
+    print("Manifiesto al día" if not problemas else f"{len(problemas)} diferencias")
+    return 1 if problemas else 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
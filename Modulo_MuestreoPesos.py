@@ -0,0 +1,207 @@
+import random
+from typing import Callable, Dict, Iterable, List, Optional
+
+from Modulo_creacionDelArbol import Pregunta
+
+def peso_de_muestreo(peso: int) -> float:
+    """Peso de muestreo por defecto: proporcional a peso + 1, para que ninguna pregunta quede fuera."""
+    return peso + 1.0
+
+class MuestreadorPesos:
+    """
+    Elige preguntas al azar con probabilidad proporcional a una función de su peso.
+
+    Los pesos de muestreo se guardan en un árbol de Fenwick (árbol binario
+    indexado) de sumas parciales: sortear una pregunta es descender por el
+    árbol en O(log n) y actualizar un peso también es O(log n). El
+    muestreador observa el peso de cada Pregunta, así que registrar_respuesta
+    se refleja en el siguiente sorteo sin reconstruir nada.
+
+    A diferencia de obtener_pregunta_aleatoria, la probabilidad de cada
+    pregunta depende solo de su peso y no de la forma de ningún árbol.
+
+    Atributos:
+        funcion_peso (Callable[[int], float]): Convierte el peso de una pregunta
+            en su peso de muestreo (no negativo).
+    """
+    def __init__(self, preguntas: Iterable[Pregunta] = (),
+                 funcion_peso: Callable[[int], float] = peso_de_muestreo):
+        """
+        Args:
+            preguntas (Iterable[Pregunta]): Preguntas iniciales.
+            funcion_peso (Callable[[int], float], opcional): Peso de muestreo de
+                cada pregunta a partir de su peso. Por defecto peso + 1.
+        """
+        self.funcion_peso = funcion_peso
+        self._preguntas: List[Optional[Pregunta]] = []
+        self._indices: Dict[Pregunta, int] = {}
+        self._pesos: List[float] = []
+        # _arbol[i] (desde 1) suma los pesos de las posiciones (i - lowbit(i), i]
+        self._arbol: List[float] = [0.0]
+        for pregunta in preguntas:
+            self.agregar(pregunta)
+
+    def __len__(self) -> int:
+        return len(self._indices)
+
+    def __contains__(self, pregunta: Pregunta) -> bool:
+        return pregunta in self._indices
+
+    @property
+    def total(self) -> float:
+        """Suma de los pesos de muestreo."""
+        return self._prefijo(len(self._pesos))
+
+    def _prefijo(self, n: int) -> float:
+        """Suma de los pesos de las primeras n posiciones."""
+        suma = 0.0
+        while n > 0:
+            suma += self._arbol[n]
+            n &= n - 1
+        return suma
+
+    def _sumar(self, indice: int, delta: float) -> None:
+        i = indice + 1
+        while i < len(self._arbol):
+            self._arbol[i] += delta
+            i += i & -i
+
+    def _fijar(self, indice: int, peso: float) -> None:
+        delta = peso - self._pesos[indice]
+        if delta:
+            self._pesos[indice] = peso
+            self._sumar(indice, delta)
+
+    def agregar(self, pregunta: Pregunta) -> None:
+        """
+        Agrega una pregunta en O(log n) y empieza a observar su peso.
+
+        Raises:
+            ValueError: Si la pregunta ya está o su peso de muestreo es negativo.
+        """
+        if pregunta in self._indices:
+            raise ValueError(f"{pregunta!r} ya está en el muestreador")
+        peso = self.funcion_peso(pregunta.peso)
+        if peso < 0:
+            raise ValueError(f"Peso de muestreo negativo para {pregunta!r}: {peso}")
+        indice = len(self._pesos)
+        self._preguntas.append(pregunta)
+        self._pesos.append(peso)
+        self._indices[pregunta] = indice
+        # El nodo nuevo cubre (i - lowbit(i), i]: su propio peso más las posiciones anteriores del rango
+        i = indice + 1
+        self._arbol.append(peso + self._prefijo(i - 1) - self._prefijo(i - (i & -i)))
+        if hasattr(pregunta, "observar_peso"):
+            pregunta.observar_peso(self._al_cambiar_peso)
+
+    def quitar(self, pregunta: Pregunta) -> None:
+        """
+        Quita una pregunta en O(log n); su posición queda con peso 0.
+
+        Raises:
+            KeyError: Si la pregunta no está en el muestreador.
+        """
+        indice = self._indices.pop(pregunta)
+        self._fijar(indice, 0.0)
+        self._preguntas[indice] = None
+        if hasattr(pregunta, "dejar_de_observar_peso"):
+            pregunta.dejar_de_observar_peso(self._al_cambiar_peso)
+
+    def actualizar(self, pregunta: Pregunta) -> None:
+        """
+        Vuelve a leer el peso de una pregunta en O(log n).
+
+        Solo hace falta para preguntas sin observar_peso.
+        """
+        self._fijar(self._indices[pregunta], self.funcion_peso(pregunta.peso))
+
+    def _al_cambiar_peso(self, pregunta: Pregunta, anterior: int) -> None:
+        self.actualizar(pregunta)
+
+    def reconstruir(self) -> None:
+        """Recalcula las sumas parciales en O(n), descartando el error de redondeo acumulado."""
+        self._arbol = [0.0] + list(self._pesos)
+        for i in range(1, len(self._arbol)):
+            padre = i + (i & -i)
+            if padre < len(self._arbol):
+                self._arbol[padre] += self._arbol[i]
+
+    def _buscar(self, objetivo: float) -> int:
+        """Posición cuya suma acumulada es la primera en superar `objetivo`."""
+        posicion = 0
+        paso = 1 << (len(self._pesos).bit_length() - 1) if self._pesos else 0
+        while paso:
+            siguiente = posicion + paso
+            if siguiente < len(self._arbol) and self._arbol[siguiente] <= objetivo:
+                posicion = siguiente
+                objetivo -= self._arbol[siguiente]
+            paso >>= 1
+        # Con redondeo el objetivo puede quedar al final o en un peso 0: se toma el último peso positivo
+        if posicion >= len(self._pesos) or self._pesos[posicion] <= 0:
+            posicion = min(posicion, len(self._pesos) - 1)
+            while posicion > 0 and self._pesos[posicion] <= 0:
+                posicion -= 1
+        return posicion
+
+    def muestrear(self, rng: Optional[random.Random] = None) -> Optional[Pregunta]:
+        """
+        Sortea una pregunta con probabilidad proporcional a su peso de muestreo, en O(log n).
+
+        Args:
+            rng (random.Random, opcional): Generador a usar. Por defecto el módulo random.
+
+        Returns:
+            Pregunta, opcional: La pregunta sorteada, o None si todos los pesos son 0.
+        """
+        total = self.total
+        if total <= 0:
+            return None
+        return self._preguntas[self._buscar((rng or random).random() * total)]
+
+    def muestrear_varias(self, k: int, rng: Optional[random.Random] = None,
+                         excluir: Iterable[Pregunta] = ()) -> List[Pregunta]:
+        """
+        Sortea k preguntas distintas, cada una proporcional a su peso entre las que quedan.
+
+        Las excluidas y cada pregunta sorteada se sacan con peso 0 y al terminar
+        se restauran los pesos: O((k + e) log n), con e la cantidad de excluidas.
+
+        Args:
+            k (int): Cantidad de preguntas.
+            rng (random.Random, opcional): Generador a usar. Por defecto el módulo random.
+            excluir (Iterable[Pregunta], opcional): Preguntas que no pueden salir.
+                Las que no están en el muestreador se ignoran.
+
+        Returns:
+            List[Pregunta]: Hasta k preguntas, menos si no hay tantas con peso positivo.
+        """
+        elegidas = []
+        sacados = []
+        try:
+            for pregunta in excluir:
+                indice = self._indices.get(pregunta)
+                if indice is not None:
+                    sacados.append((indice, self._pesos[indice]))
+                    self._fijar(indice, 0.0)
+            while len(elegidas) < k:
+                pregunta = self.muestrear(rng)
+                if pregunta is None:
+                    break
+                indice = self._indices[pregunta]
+                sacados.append((indice, self._pesos[indice]))
+                self._fijar(indice, 0.0)
+                elegidas.append(pregunta)
+        finally:
+            for indice, peso in reversed(sacados):
+                self._fijar(indice, peso)
+        return elegidas
+
+    def vaciar(self) -> None:
+        """Quita todas las preguntas y deja de observarlas."""
+        for pregunta in list(self._indices):
+            if hasattr(pregunta, "dejar_de_observar_peso"):
+                pregunta.dejar_de_observar_peso(self._al_cambiar_peso)
+        self._preguntas.clear()
+        self._indices.clear()
+        self._pesos.clear()
+        self._arbol = [0.0]
@@ -0,0 +1,190 @@
+import numpy as np
+import pygame
+from typing import Iterator, List, Optional
+
+
+class AlmacenObstaculos:
+    """
+    Almacena los obstáculos como estructura de arreglos (columnas NumPy).
+
+    Los obstáculos activos ocupan siempre las primeras `n` filas, de modo que el
+    movimiento y el descarte de los que salen de pantalla son operaciones
+    vectorizadas sobre rebanadas contiguas.
+
+    Funciona como un pool de capacidad fija: las columnas se reservan una sola
+    vez y los identificadores de los obstáculos descartados vuelven a una pila
+    de libres para reutilizarse. Mover, aparecer y descartar obstáculos no
+    asigna memoria: las vistas de las primeras `k` filas se crean una vez por
+    cada `k` y el descarte compacta las columnas en el lugar. Para cambiar la
+    capacidad hay que llamar a reservar().
+
+    Para el código que espera una lista de pygame.Rect (dibujo, depuración) el
+    almacén se puede iterar y devuelve rectángulos construidos al vuelo.
+
+    Atributos:
+        x, y (np.ndarray): Esquina superior izquierda de cada obstáculo.
+        w, h (np.ndarray): Ancho y alto de cada obstáculo.
+        vel (np.ndarray): Velocidad vertical de cada obstáculo en píxeles por tick.
+        ids (np.ndarray): Identificador de cada obstáculo, estable mientras está
+            activo; va de 0 a capacidad - 1 y se reutiliza al descartarlo.
+        eliminados (np.ndarray): Identificadores descartados por el último
+            descartar_fuera(); son válidos tantos como la cantidad que devolvió.
+        n (int): Cantidad de obstáculos activos.
+        capacidad (int): Máximo de obstáculos activos.
+    """
+    def __init__(self, capacidad: int = 16):
+        self.n = 0
+        self.capacidad = 0
+        self._libres: List[int] = []
+        self._n_libres = 0
+        self.reservar(max(1, capacidad))
+
+    def reservar(self, capacidad: int):
+        """
+        Crea o agranda las columnas conservando las filas activas.
+
+        Args:
+            capacidad (int): Nueva capacidad; si no supera la actual no hace nada.
+        """
+        if capacidad <= self.capacidad:
+            return
+        columnas = {
+            "x": np.float64, "y": np.float64, "w": np.float64,
+            "h": np.float64, "vel": np.float64, "ids": np.int64,
+        }
+        for nombre, tipo in columnas.items():
+            nueva = np.zeros(capacidad, dtype=tipo)
+            if self.n:
+                nueva[:self.n] = getattr(self, nombre)[:self.n]
+            setattr(self, nombre, nueva)
+        # Buffers del descarte. La máscara comparte memoria con un bytearray
+        # cuyo find() recorre las filas fuera sin crear objetos
+        self._mascara = bytearray(capacidad)
+        self._fuera = np.frombuffer(self._mascara, dtype=bool)
+        self._limites = np.zeros(capacidad)
+        self._limite = None
+        self.eliminados = np.zeros(capacidad, dtype=np.int64)
+        self._vistas: List[Optional[tuple]] = [None] * (capacidad + 1)
+        # Pila de tamaño fijo: se sacan desde el final, así que los
+        # identificadores bajos se usan primero
+        nuevos = list(range(capacidad - 1, self.capacidad - 1, -1))
+        self._libres = nuevos + self._libres[:self._n_libres] + [0] * (capacidad - len(nuevos) - self._n_libres)
+        self._n_libres += len(nuevos)
+        self.capacidad = capacidad
+
+    def _filas(self, k: int) -> tuple:
+        """Vistas (y, vel, fuera, límites) de las primeras `k` filas, creadas una vez por cada `k`."""
+        vistas = self._vistas[k]
+        if vistas is None:
+            vistas = self._vistas[k] = (self.y[:k], self.vel[:k], self._fuera[:k], self._limites[:k])
+        return vistas
+
+    def __len__(self) -> int:
+        return self.n
+
+    def __iter__(self) -> Iterator[pygame.Rect]:
+        return iter(self.rects())
+
+    def agregar(self, x: float, y: float, w: float, h: float, vel: float) -> int:
+        """
+        Agrega un obstáculo al final de las filas activas usando una ranura libre.
+
+        Returns:
+            int: Identificador del obstáculo.
+
+        Raises:
+            IndexError: Si el almacén ya tiene `capacidad` obstáculos activos.
+        """
+        if self.n == self.capacidad:
+            raise IndexError(f"El almacén de obstáculos está lleno ({self.capacidad})")
+        i = self.n
+        self._n_libres -= 1
+        clave = self._libres[self._n_libres]
+        self.x[i], self.y[i], self.w[i], self.h[i], self.vel[i] = x, y, w, h, vel
+        self.ids[i] = clave
+        self.n += 1
+        return clave
+
+    def mover(self):
+        """Avanza todos los obstáculos activos según su velocidad."""
+        y, vel, _, _ = self._filas(self.n)
+        np.add(y, vel, out=y)
+
+    def fijar_velocidad(self, vel: float):
+        """Asigna la misma velocidad a todos los obstáculos activos."""
+        self.vel[:self.n] = vel
+
+    def descartar_fuera(self, limite: float) -> int:
+        """
+        Elimina los obstáculos cuyo borde superior pasó el límite.
+
+        La comparación es vectorizada sobre una máscara preasignada; cada
+        obstáculo eliminado se reemplaza por el último activo, así que el costo
+        en Python es proporcional a los eliminados y no a `n`, y no se asigna
+        memoria. El orden de las filas que quedan puede cambiar. Los
+        identificadores eliminados se copian a `eliminados` y quedan libres para
+        los próximos obstáculos.
+
+        Args:
+            limite (float): Coordenada y a partir de la cual el obstáculo salió de pantalla.
+
+        Returns:
+            int: Cantidad de obstáculos esquivados en este tick; sus
+                identificadores son los primeros de `eliminados`.
+        """
+        n = self.n
+        y, _, fuera, limites = self._filas(n)
+        if limite != self._limite:
+            # Comparar con un arreglo de la misma forma evita convertir el escalar en cada llamada
+            self._limites.fill(limite)
+            self._limite = limite
+        np.greater(y, limites, out=fuera)
+        mascara = self._mascara
+        i = mascara.find(1, 0, n)
+        if i < 0:
+            return 0
+        # np.compress(..., out=) también crea temporales internos: se compacta a mano
+        x, y, w, h, vel, ids = self.x, self.y, self.w, self.h, self.vel, self.ids
+        cantidad = 0
+        while i >= 0:
+            clave = ids.item(i)
+            self.eliminados[cantidad] = clave
+            cantidad += 1
+            self._libres[self._n_libres] = clave
+            self._n_libres += 1
+            n -= 1
+            if i < n:
+                x[i] = x.item(n)
+                y[i] = y.item(n)
+                w[i] = w.item(n)
+                h[i] = h.item(n)
+                vel[i] = vel.item(n)
+                ids[i] = ids.item(n)
+                # La fila traída desde el final puede estar fuera también: se revisa i de nuevo
+                mascara[i] = mascara[n]
+            i = mascara.find(1, i, n)
+        self.n = n
+        return cantidad
+
+    def limpiar(self):
+        """Elimina todos los obstáculos."""
+        for clave in self.ids[:self.n].tolist():
+            self._libres[self._n_libres] = clave
+            self._n_libres += 1
+        self.n = 0
+
+    def rects(self, desfase_y: float = 0.0) -> List[pygame.Rect]:
+        """
+        Vista de compatibilidad con la antigua lista de pygame.Rect.
+
+        Los rectángulos son copias: modificarlos no cambia el almacén.
+
+        Args:
+            desfase_y (float): Desplazamiento vertical a sumar, por ejemplo para
+                dibujar posiciones interpoladas entre ticks.
+        """
+        n = self.n
+        ys = self.y[:n] + desfase_y if desfase_y else self.y[:n]
+        return [pygame.Rect(x, y, w, h) for x, y, w, h in zip(
+            self.x[:n].tolist(), ys.tolist(),
+            self.w[:n].tolist(), self.h[:n].tolist())]
@@ -0,0 +1,168 @@
+import csv
+import functools
+import json
+import time
+import numpy as np
+import pygame
+from typing import Dict, List, Optional
+from Modulo_Texto import renderizar_texto
+
+
+FASES_FRAME = [
+    "handle_events",
+    "handle_player_movement",
+    "update_obstacles",
+    "check_collisions",
+    "check_category_progression",
+    "draw",
+]
+
+class PerfiladorFrames:
+    """
+    Mide el tiempo de cada fase del cuadro y guarda un historial en un buffer circular.
+
+    instrumentar() reemplaza los métodos de las fases en la instancia del juego por
+    versiones cronometradas; si el juego no tiene perfilador no se envuelve nada y
+    el costo es cero. Cada cuadro suma el tiempo de todas las llamadas a cada fase
+    (con paso fijo, la lógica puede correr varias veces por cuadro) y
+    cerrar_frame() lo guarda como una fila del buffer.
+
+    Atributos:
+        fases (List[str]): Nombres de las fases medidas.
+        capacidad (int): Cantidad de cuadros que guarda el historial.
+        historial (np.ndarray): Segundos por fase y por cuadro; la última columna
+            es la duración total del cuadro.
+        overlay_visible (bool): Si se dibuja el overlay con las estadísticas.
+        ruta_traza (str, opcional): Archivo .csv o .json donde volcar el historial al terminar.
+    """
+    def __init__(self, capacidad: int = 600, fases: Optional[List[str]] = None,
+                 ruta_traza: Optional[str] = None, overlay_visible: bool = True):
+        self.fases = list(fases or FASES_FRAME)
+        self.capacidad = capacidad
+        self.historial = np.zeros((capacidad, len(self.fases) + 1))
+        self.overlay_visible = overlay_visible
+        self.ruta_traza = ruta_traza
+        self.frames = 0
+        self._actual = [0.0] * len(self.fases)
+        self._inicio_frame = None
+        self._lineas_overlay: List[str] = []
+
+    def instrumentar(self, juego):
+        """Envuelve los métodos de las fases del juego con cronómetros."""
+        for indice, fase in enumerate(self.fases):
+            setattr(juego, fase, self._cronometrar(getattr(juego, fase), indice))
+
+    def _cronometrar(self, metodo, indice: int):
+        actual = self._actual
+        reloj = time.perf_counter
+
+        @functools.wraps(metodo)
+        def envoltura(*args, **kwargs):
+            inicio = reloj()
+            try:
+                return metodo(*args, **kwargs)
+            finally:
+                actual[indice] += reloj() - inicio
+        return envoltura
+
+    def cerrar_frame(self):
+        """Guarda los tiempos del cuadro actual en el historial y empieza uno nuevo."""
+        ahora = time.perf_counter()
+        fila = self.historial[self.frames % self.capacidad]
+        fila[:-1] = self._actual
+        fila[-1] = ahora - self._inicio_frame if self._inicio_frame is not None else 0.0
+        self._inicio_frame = ahora
+        for i in range(len(self._actual)):
+            self._actual[i] = 0.0
+        self.frames += 1
+        if self.overlay_visible and self.frames % 30 == 0:
+            self._lineas_overlay = self._formatear_estadisticas()
+
+    def _ordenado(self) -> np.ndarray:
+        """Devuelve las filas válidas del historial en orden cronológico."""
+        if self.frames <= self.capacidad:
+            return self.historial[:self.frames]
+        inicio = self.frames % self.capacidad
+        return np.concatenate((self.historial[inicio:], self.historial[:inicio]))
+
+    def estadisticas(self) -> Dict[str, Dict[str, float]]:
+        """
+        Calcula p50 y p99 por fase, en milisegundos, y los FPS promedio.
+
+        Returns:
+            Dict[str, Dict[str, float]]: {"fps": {"valor": ...}, fase: {"p50": ..., "p99": ...}}.
+        """
+        datos = self._ordenado()
+        # El primer cuadro registrado no tiene uno anterior y su duración quedó en 0
+        if self.frames <= self.capacidad:
+            datos = datos[1:]
+        if not len(datos):
+            return {}
+        ms = datos * 1e3
+        resultado = {}
+        duraciones = datos[:, -1]
+        resultado["fps"] = {"valor": float(1.0 / duraciones.mean()) if duraciones.mean() > 0 else 0.0}
+        p50, p99 = np.percentile(ms, [50, 99], axis=0)
+        for i, fase in enumerate(self.fases + ["frame"]):
+            resultado[fase] = {"p50": float(p50[i]), "p99": float(p99[i])}
+        return resultado
+
+    def _formatear_estadisticas(self) -> List[str]:
+        stats = self.estadisticas()
+        if not stats:
+            return []
+        lineas = [f"FPS {stats['fps']['valor']:.1f}   (ms p50 / p99)"]
+        for fase in self.fases + ["frame"]:
+            lineas.append(f"{fase}: {stats[fase]['p50']:.2f} / {stats[fase]['p99']:.2f}")
+        return lineas
+
+    def alternar_overlay(self):
+        """Muestra u oculta el overlay."""
+        self.overlay_visible = not self.overlay_visible
+        if self.overlay_visible:
+            self._lineas_overlay = self._formatear_estadisticas()
+
+    def dibujar_overlay(self, screen: pygame.Surface) -> List[pygame.Rect]:
+        """
+        Dibuja las últimas estadísticas en la esquina superior derecha.
+
+        Las líneas se recalculan cada 30 cuadros para que el texto sea legible y
+        la caché de texto no se llene con valores que cambian en cada cuadro.
+
+        Returns:
+            List[pygame.Rect]: Zonas de la pantalla que se pintaron.
+        """
+        rects = []
+        y = 10
+        for linea in self._lineas_overlay:
+            superficie = renderizar_texto(linea, (255, 255, 0), 20)
+            x = screen.get_width() - superficie.get_width() - 10
+            rects.append(screen.blit(superficie, (x, y)))
+            y += superficie.get_height() + 2
+        return rects
+
+    def guardar(self, ruta: Optional[str] = None):
+        """
+        Vuelca el historial a un archivo CSV o JSON según la extensión.
+
+        Args:
+            ruta (str, opcional): Archivo destino. Por defecto ruta_traza.
+        """
+        ruta = ruta or self.ruta_traza
+        if not ruta:
+            return
+        columnas = self.fases + ["frame"]
+        filas = (self._ordenado() * 1e3).round(4).tolist()
+        if ruta.lower().endswith(".json"):
+            with open(ruta, "w") as f:
+                json.dump({
+                    "unidad": "ms",
+                    "columnas": columnas,
+                    "frames": filas,
+                    "estadisticas": self.estadisticas(),
+                }, f, indent=2)
+        else:
+            with open(ruta, "w", newline="") as f:
+                escritor = csv.writer(f)
+                escritor.writerow(columnas)
+                escritor.writerows(filas)
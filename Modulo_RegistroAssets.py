@@ -0,0 +1,123 @@
+import threading
+import pygame
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Tuple
+
+
+class RegistroAssets:
+    """
+    Registro de imágenes compartido por todo el proceso.
+
+    Guarda las imágenes ya decodificadas y escaladas con la clave
+    (categoría, asset, tamaño) y cuenta cuántos gestores usan cada una. Las
+    imágenes sin referencias no se descartan enseguida: quedan en orden LRU y
+    solo se expulsan cuando el total supera el presupuesto de memoria. Así,
+    volver a una categoría, reiniciar la partida o crear un gestor desde el
+    menú reutiliza las imágenes en lugar de decodificarlas de nuevo.
+
+    Las imágenes en uso nunca se expulsan, aunque superen el presupuesto. Es
+    seguro usarlo desde el hilo de precarga.
+
+    Atributos:
+        presupuesto_bytes (int): Memoria máxima de las imágenes guardadas.
+        bytes_usados (int): Memoria de las imágenes guardadas.
+        aciertos (int): Pedidos servidos desde el registro.
+        fallos (int): Pedidos que tuvieron que cargar la imagen.
+        expulsiones (int): Imágenes descartadas para respetar el presupuesto.
+    """
+    def __init__(self, presupuesto_bytes: int = 32 * 1024 * 1024):
+        self.presupuesto_bytes = presupuesto_bytes
+        self.bytes_usados = 0
+        self.aciertos = 0
+        self.fallos = 0
+        self.expulsiones = 0
+        self._entradas: "OrderedDict[Hashable, pygame.Surface]" = OrderedDict()
+        self._referencias: Dict[Hashable, int] = {}
+        self._candado = threading.Lock()
+
+    @staticmethod
+    def tam_bytes(superficie: pygame.Surface) -> int:
+        """Memoria de los pixeles de una superficie."""
+        return superficie.get_pitch() * superficie.get_height()
+
+    def obtener(self, clave: Tuple, cargar: Callable[[], pygame.Surface]) -> pygame.Surface:
+        """
+        Devuelve la imagen de una clave y registra una referencia a ella.
+
+        Si no está guardada se carga con `cargar`, fuera del candado para no
+        bloquear a otros hilos. Cada llamada debe equilibrarse con liberar().
+
+        Args:
+            clave (Tuple): (categoría, asset, tamaño).
+            cargar (Callable[[], pygame.Surface]): Carga la imagen si no está en el registro.
+
+        Returns:
+            pygame.Surface: Imagen compartida; no debe modificarse.
+        """
+        with self._candado:
+            superficie = self._entradas.get(clave)
+            if superficie is not None:
+                self._entradas.move_to_end(clave)
+                self._referencias[clave] = self._referencias.get(clave, 0) + 1
+                self.aciertos += 1
+                return superficie
+            self.fallos += 1
+
+        cargada = cargar()
+
+        with self._candado:
+            # Otro hilo pudo cargarla mientras tanto: se conserva la primera
+            superficie = self._entradas.get(clave)
+            if superficie is None:
+                superficie = cargada
+                self._entradas[clave] = superficie
+                self.bytes_usados += self.tam_bytes(superficie)
+            self._entradas.move_to_end(clave)
+            self._referencias[clave] = self._referencias.get(clave, 0) + 1
+            self._expulsar()
+        return superficie
+
+    def liberar(self, clave: Tuple):
+        """Quita una referencia; la imagen queda guardada hasta que haga falta espacio."""
+        with self._candado:
+            cuenta = self._referencias.get(clave, 0) - 1
+            if cuenta > 0:
+                self._referencias[clave] = cuenta
+            else:
+                self._referencias.pop(clave, None)
+            self._expulsar()
+
+    def _expulsar(self):
+        """Descarta imágenes sin referencias, de la menos a la más reciente, hasta entrar en el presupuesto."""
+        if self.bytes_usados <= self.presupuesto_bytes:
+            return
+        for clave in list(self._entradas):
+            if self.bytes_usados <= self.presupuesto_bytes:
+                break
+            if clave not in self._referencias:
+                self.bytes_usados -= self.tam_bytes(self._entradas.pop(clave))
+                self.expulsiones += 1
+
+    def estadisticas(self) -> Dict[str, int]:
+        """Contadores del registro."""
+        with self._candado:
+            return {
+                "entradas": len(self._entradas),
+                "en_uso": len(self._referencias),
+                "bytes_usados": self.bytes_usados,
+                "presupuesto_bytes": self.presupuesto_bytes,
+                "aciertos": self.aciertos,
+                "fallos": self.fallos,
+                "expulsiones": self.expulsiones,
+            }
+
+    def vaciar(self):
+        """Descarta las imágenes sin referencias y reinicia los contadores."""
+        with self._candado:
+            for clave in [c for c in self._entradas if c not in self._referencias]:
+                self.bytes_usados -= self.tam_bytes(self._entradas.pop(clave))
+            self.aciertos = self.fallos = self.expulsiones = 0
+
+
+# Registro compartido por todos los AssetManager del proceso
+registro_assets = RegistroAssets()
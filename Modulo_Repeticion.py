@@ -0,0 +1,234 @@
+import argparse
+import json
+import struct
+import zlib
+from dataclasses import asdict, dataclass, field
+from typing import Dict, Optional
+from Modulo_Juego import JuegoMejorado, GameConfig, CATEGORIA_PROGRESSION
+from Modulo_Simulacion import EstadoTeclas, TECLAS_MOVIMIENTO
+
+
+# Formato del archivo: cabecera, cuerpo comprimido con zlib y huella del estado final
+MAGIA = b"JGRP"
+# 2: la x de aparición de los obstáculos se sortea con random() en lugar de randint()
+VERSION = 2
+CABECERA = struct.Struct("<4sBqBiIII")  # magia, versión, semilla, categoría, puntaje inicial, ticks, respuestas, config
+HUELLA = struct.Struct("<ibBI")         # puntaje, vidas, categoría, crc32 de jugador y obstáculos
+
+# Códigos de respuesta a las preguntas
+RESPUESTA_INCORRECTA = 0
+RESPUESTA_CORRECTA = 1
+RESPUESTA_SALIR = 2
+
+@dataclass
+class RegistroPartida:
+    """
+    Grabación de una partida: todo lo necesario para repetirla tick por tick.
+
+    Atributos:
+        semilla (int): Semilla del generador aleatorio de la partida.
+        categoria (str): Categoría inicial.
+        puntaje_inicial (int): Puntaje con el que empezó (progreso guardado del jugador).
+        teclas (bytearray): Un byte por tick con las teclas de TECLAS_MOVIMIENTO como bits.
+        respuestas (bytearray): Un código por pregunta respondida.
+        config (Dict): Valores de GameConfig con los que se jugó.
+        huella (tuple, opcional): Estado final (puntaje, vidas, categoría, crc) para verificar.
+    """
+    semilla: int
+    categoria: str
+    puntaje_inicial: int = 0
+    teclas: bytearray = field(default_factory=bytearray)
+    respuestas: bytearray = field(default_factory=bytearray)
+    config: Dict = field(default_factory=lambda: asdict(GameConfig()))
+    huella: Optional[tuple] = None
+
+    def guardar(self, ruta: str):
+        """
+        Escribe la grabación en formato binario.
+
+        Los estados de teclado se empaquetan de a dos por byte y el cuerpo se
+        comprime, así que una tecla mantenida varios segundos ocupa pocos bytes.
+
+        Raises:
+            ValueError: Si la semilla no entra en un entero de 64 bits con signo.
+        """
+        if not -2 ** 63 <= self.semilla < 2 ** 63:
+            raise ValueError(f"La semilla {self.semilla} no entra en 64 bits con signo")
+        empaquetadas = bytearray((len(self.teclas) + 1) // 2)
+        for i, mascara in enumerate(self.teclas):
+            empaquetadas[i // 2] |= mascara << (4 * (i % 2))
+        config = json.dumps(self.config, sort_keys=True).encode("utf-8")
+        cuerpo = zlib.compress(bytes(empaquetadas) + bytes(self.respuestas) + config, 9)
+        with open(ruta, "wb") as f:
+            f.write(CABECERA.pack(
+                MAGIA, VERSION, self.semilla, CATEGORIA_PROGRESSION.index(self.categoria),
+                self.puntaje_inicial, len(self.teclas), len(self.respuestas), len(config)))
+            f.write(struct.pack("<I", len(cuerpo)))
+            f.write(cuerpo)
+            f.write(HUELLA.pack(*(self.huella or (0, 0, 0, 0))))
+
+    @classmethod
+    def cargar(cls, ruta: str) -> "RegistroPartida":
+        """
+        Lee una grabación escrita con guardar().
+
+        Raises:
+            ValueError: Si el archivo no es una grabación válida.
+        """
+        with open(ruta, "rb") as f:
+            datos = f.read()
+        magia, version, semilla, categoria, puntaje, n_ticks, n_respuestas, n_config = CABECERA.unpack_from(datos)
+        if magia != MAGIA or version != VERSION:
+            raise ValueError(f"'{ruta}' no es una grabación de partida compatible")
+        desplazamiento = CABECERA.size
+        (largo,) = struct.unpack_from("<I", datos, desplazamiento)
+        desplazamiento += 4
+        cuerpo = zlib.decompress(datos[desplazamiento:desplazamiento + largo])
+        huella = HUELLA.unpack_from(datos, desplazamiento + largo)
+
+        n_bytes = (n_ticks + 1) // 2
+        teclas = bytearray(n_ticks)
+        for i in range(n_ticks):
+            teclas[i] = (cuerpo[i // 2] >> (4 * (i % 2))) & 0xF
+        respuestas = bytearray(cuerpo[n_bytes:n_bytes + n_respuestas])
+        config = json.loads(cuerpo[n_bytes + n_respuestas:n_bytes + n_respuestas + n_config])
+        return cls(semilla, CATEGORIA_PROGRESSION[categoria], puntaje, teclas, respuestas, config, huella)
+
+def huella_estado(juego: JuegoMejorado) -> tuple:
+    """
+    Resume el estado de la partida para comparar una grabación con su repetición.
+
+    Returns:
+        tuple: (puntaje, vidas, índice de categoría, crc32 de jugador y obstáculos).
+    """
+    obstaculos = juego.obstacles
+    crc = zlib.crc32(struct.pack("<2d", *juego.player_pos))
+    crc = zlib.crc32(obstaculos.x[:obstaculos.n].tobytes(), crc)
+    crc = zlib.crc32(obstaculos.y[:obstaculos.n].tobytes(), crc)
+    return (juego.score, max(-128, min(127, juego.lives)), juego.current_categoria_index, crc)
+
+class GrabadorPartida:
+    """
+    Graba la entrada de teclado y las respuestas de una partida en curso.
+
+    Se engancha a un JuegoMejorado ya creado reemplazando su fuente de entrada y
+    su respondedor por envolturas que anotan cada valor antes de devolverlo.
+
+    Atributos:
+        juego (JuegoMejorado): Partida que se graba.
+        registro (RegistroPartida): Grabación en construcción.
+    """
+    def __init__(self, juego: JuegoMejorado):
+        self.juego = juego
+        self.registro = RegistroPartida(juego.semilla, juego.categoria, juego.score,
+                                        config=asdict(juego.config))
+        self._entrada = juego.entrada
+        self._responder = juego.responder
+        juego.entrada = self._grabar_entrada
+        juego.responder = self._grabar_respuesta
+
+    def _grabar_entrada(self):
+        teclas = self._entrada()
+        mascara = 0
+        for bit, tecla in enumerate(TECLAS_MOVIMIENTO):
+            if teclas[tecla]:
+                mascara |= 1 << bit
+        self.registro.teclas.append(mascara)
+        return teclas
+
+    def _grabar_respuesta(self, pregunta: Dict) -> Optional[bool]:
+        if self._responder:
+            respuesta = self._responder(pregunta)
+        else:
+            respuesta = self.juego.sistema_preguntas.mostrar_pregunta(self.juego.screen, pregunta)
+        if respuesta is None:
+            self.registro.respuestas.append(RESPUESTA_SALIR)
+        else:
+            self.registro.respuestas.append(RESPUESTA_CORRECTA if respuesta else RESPUESTA_INCORRECTA)
+        return respuesta
+
+    def terminar(self, ruta: Optional[str] = None) -> RegistroPartida:
+        """Cierra la grabación con la huella del estado final y opcionalmente la guarda."""
+        self.registro.huella = huella_estado(self.juego)
+        if ruta:
+            self.registro.guardar(ruta)
+        return self.registro
+
+class _Reproductor:
+    """Entrega en orden los estados de teclado y las respuestas de una grabación."""
+    def __init__(self, registro: RegistroPartida):
+        self._estados = [EstadoTeclas(t for bit, t in enumerate(TECLAS_MOVIMIENTO) if mascara >> bit & 1)
+                         for mascara in range(16)]
+        self._teclas = iter(registro.teclas)
+        self._respuestas = iter(registro.respuestas)
+
+    def entrada(self) -> EstadoTeclas:
+        return self._estados[next(self._teclas, 0)]
+
+    def responder(self, pregunta: Dict) -> Optional[bool]:
+        codigo = next(self._respuestas, RESPUESTA_SALIR)
+        if codigo == RESPUESTA_SALIR:
+            return None
+        return codigo == RESPUESTA_CORRECTA
+
+def reproducir(registro: RegistroPartida) -> JuegoMejorado:
+    """
+    Repite una grabación sin ventana, tick por tick.
+
+    Ejecuta la misma secuencia que run(): las preguntas iniciales y luego un
+    update() por cada tick grabado. Los eventos de ventana no afectan la lógica,
+    así que no se reproducen.
+
+    Args:
+        registro (RegistroPartida): Grabación a repetir.
+
+    Returns:
+        JuegoMejorado: La partida en su estado final (ya se llamó a cleanup()).
+    """
+    reproductor = _Reproductor(registro)
+    juego = JuegoMejorado(registro.categoria, headless=True, semilla=registro.semilla,
+                          entrada=reproductor.entrada, responder=reproductor.responder,
+                          config=GameConfig(**registro.config))
+    juego.score = registro.puntaje_inicial
+    if juego.manejar_preguntas_inicio_categoria():
+        for _ in range(len(registro.teclas)):
+            if not juego.update():
+                break
+    juego.cleanup()
+    return juego
+
+def verificar(registro: RegistroPartida) -> bool:
+    """Indica si la repetición de la grabación termina en el mismo estado que la original."""
+    return huella_estado(reproducir(registro)) == tuple(registro.huella)
+
+def jugar_grabando(ruta: str, categoria: str = "granja", nombre_jugador: str = None):
+    """Juega una partida normal y guarda su grabación en la ruta indicada."""
+    juego = JuegoMejorado(categoria, nombre_jugador)
+    grabador = GrabadorPartida(juego)
+    juego.run()
+    grabador.terminar(ruta)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Grabación y repetición de partidas")
+    sub = parser.add_subparsers(dest="comando", required=True)
+    grabar = sub.add_parser("grabar", help="Jugar y grabar la partida")
+    grabar.add_argument("ruta")
+    grabar.add_argument("--categoria", default="granja")
+    grabar.add_argument("--jugador", default=None)
+    repetir = sub.add_parser("reproducir", help="Repetir una grabación y verificar el resultado")
+    repetir.add_argument("ruta")
+
+    args = parser.parse_args(argv)
+    if args.comando == "grabar":
+        jugar_grabando(args.ruta, args.categoria, args.jugador)
+    else:
+        registro = RegistroPartida.cargar(args.ruta)
+        juego = reproducir(registro)
+        coincide = huella_estado(juego) == tuple(registro.huella)
+        print(f"Ticks: {len(registro.teclas)}  Puntaje: {juego.score}  Vidas: {juego.lives}  "
+              f"Categoría: {juego.categoria}")
+        print("Repetición idéntica" if coincide else "La repetición NO coincide con la grabación")
+        return 0 if coincide else 1
+
+if __name__ == "__main__":
+    raise SystemExit(main())
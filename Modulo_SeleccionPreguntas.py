@@ -1,7 +1,10 @@
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple, Union
 from dataclasses import dataclass
 import random
-from Modulo_EstructuraArbol import generar_arbol_por_categoria, Pregunta, NodoArbol
+from Modulo_EstructuraArbol import (generar_arbol_por_categoria, crear_preguntas_por_categoria,
+                                    Pregunta, NodoArbol)
+from Modulo_ArbolPesos import ArbolPesos, construir_arbol_pesos
+from Modulo_MuestreoPesos import MuestreadorPesos
 
 @dataclass
 class ConfiguracionPartida:
@@ -10,22 +13,46 @@ class ConfiguracionPartida:
     niveles_max: int = 5
     balanceo_dificultad: bool = True
     permitir_repeticion: bool = False
+    # Ordena por peso con un ArbolPesos, que reubica cada pregunta al cambiar
+    # su peso; si no, el árbol queda con la forma que tuvo al construirse
+    seguir_pesos: bool = False
 
 class SelectorPreguntas:
-    """Clase para manejar la selección de preguntas en una partida."""
+    """
+    Clase para manejar la selección de preguntas en una partida.
+    
+    Con config.seguir_pesos las preguntas viven en `arbol_pesos` y los niveles
+    se piden a su raíz actual, así que registrar_respuesta cambia el nivel en
+    el que aparece cada pregunta; `arbol` queda en None.
+    """
     
     def __init__(self, categoria: str, config: Optional[ConfiguracionPartida] = None):
         self.categoria = categoria
         self.config = config or ConfiguracionPartida()
-        self.arbol = generar_arbol_por_categoria(categoria)
+        self.arbol_pesos: Optional[ArbolPesos] = None
+        if self.config.seguir_pesos:
+            self.arbol_pesos = construir_arbol_pesos(crear_preguntas_por_categoria(categoria))
+            self.arbol = None
+        else:
+            self.arbol = generar_arbol_por_categoria(categoria)
         self.preguntas_usadas = set()
+        # Por nivel, la lista del índice del árbol y la posición del primer nodo
+        # que puede no estar usado todavía en esa lista
+        self._siguiente_por_nivel: Dict[int, Tuple[List[NodoArbol], int]] = {}
+        self._muestreador: Optional[MuestreadorPesos] = None
+        self._arbol_muestreado: Optional[Union[NodoArbol, ArbolPesos]] = None
         
     def seleccionar_preguntas(self) -> List[Pregunta]:
         """
         Selecciona preguntas para la partida según la configuración.
         
+        Los niveles que no alcanzan se completan con un sorteo proporcional al
+        peso; sin permitir_repeticion se sortea de una vez entre las preguntas
+        todavía no usadas.
+        
         Returns:
-            List[Pregunta]: Lista de preguntas seleccionadas
+            List[Pregunta]: Lista de preguntas seleccionadas; puede tener menos de
+                num_preguntas si no quedan preguntas sin usar
         """
         preguntas = []
         niveles_por_pregunta = self._distribuir_niveles()
@@ -36,11 +63,18 @@ class SelectorPreguntas:
                 preguntas.append(pregunta)
                 
         # Si no se completó el número deseado, rellenar con preguntas aleatorias
-        while len(preguntas) < self.config.num_preguntas:
-            pregunta = self._seleccionar_pregunta_aleatoria()
-            if pregunta and (self.config.permitir_repeticion or 
-                        pregunta not in self.preguntas_usadas):
-                preguntas.append(pregunta)
+        faltan = self.config.num_preguntas - len(preguntas)
+        if faltan > 0:
+            if self.config.permitir_repeticion:
+                extras = [self._seleccionar_pregunta_aleatoria() for _ in range(faltan)]
+            else:
+                muestreador = self._obtener_muestreador()
+                extras = []
+                if muestreador is not None:
+                    extras = muestreador.muestrear_varias(faltan, excluir=self.preguntas_usadas)
+            extras = [pregunta for pregunta in extras if pregunta is not None]
+            self.preguntas_usadas.update(extras)
+            preguntas.extend(extras)
                 
         return preguntas
     
@@ -72,51 +106,82 @@ class SelectorPreguntas:
         """
         Selecciona una pregunta del nivel especificado.
         
+        Toma el primer nodo no usado del nivel, de izquierda a derecha, desde el
+        índice por niveles del árbol. Un cursor por nivel salta los nodos ya
+        usados, así que elegir todas las preguntas de un nivel cuesta O(1)
+        amortizado por pregunta. El cursor vale solo para la lista del índice
+        en la que se calculó: si el árbol cambia (se modifica y su índice se
+        rearma, o se reemplaza self.arbol) la lista es otra y se empieza de 0.
+        ArbolPesos arma la lista en cada consulta, así que con seguir_pesos el
+        nivel se vuelve a recorrer desde el principio cada vez.
+        
         Args:
             nivel_objetivo: Nivel del árbol del que se desea obtener la pregunta
             
         Returns:
             Optional[Pregunta]: Pregunta seleccionada o None si no se encuentra
         """
-        def _seleccionar_rec(nodo: Optional[NodoArbol], nivel_actual: int) -> Optional[Pregunta]:
-            if not nodo or nivel_actual > nivel_objetivo:
+        raiz = self._raiz()
+        if raiz is None:
+            return None
+        nodos = raiz.nodos_en_nivel(nivel_objetivo)
+        if not nodos:
+            return None
+        if self.config.permitir_repeticion:
+            pregunta = nodos[0].pregunta
+        else:
+            lista, posicion = self._siguiente_por_nivel.get(nivel_objetivo, (None, 0))
+            if lista is not nodos:
+                posicion = 0
+            while posicion < len(nodos) and nodos[posicion].pregunta in self.preguntas_usadas:
+                posicion += 1
+            self._siguiente_por_nivel[nivel_objetivo] = (nodos, posicion)
+            if posicion == len(nodos):
                 return None
-                
-            if nivel_actual == nivel_objetivo:
-                if (self.config.permitir_repeticion or 
-                    nodo.pregunta not in self.preguntas_usadas):
-                    self.preguntas_usadas.add(nodo.pregunta)
-                    return nodo.pregunta
-                return None
-                
-            # Intentar ambos subárboles
-            pregunta = _seleccionar_rec(nodo.izquierdo, nivel_actual + 1)
-            if not pregunta:
-                pregunta = _seleccionar_rec(nodo.derecho, nivel_actual + 1)
-            return pregunta
-            
-        return _seleccionar_rec(self.arbol, 1)
+            pregunta = nodos[posicion].pregunta
+        self.preguntas_usadas.add(pregunta)
+        return pregunta
     
     def _seleccionar_pregunta_aleatoria(self) -> Optional[Pregunta]:
         """
         Selecciona una pregunta aleatoria del árbol.
         
+        La probabilidad de cada pregunta es proporcional a su peso + 1, sin
+        importar su posición en el árbol, y los cambios de peso por
+        registrar_respuesta se aplican en el sorteo siguiente.
+        
         Returns:
             Optional[Pregunta]: Pregunta seleccionada o None si no hay disponibles
         """
-        def _seleccionar_rec(nodo: Optional[NodoArbol]) -> Optional[Pregunta]:
-            if not nodo:
-                return None
-                
-            if random.random() < 0.5:
-                return nodo.pregunta
-                
-            subpregunta = _seleccionar_rec(nodo.izquierdo)
-            if not subpregunta:
-                subpregunta = _seleccionar_rec(nodo.derecho)
-            return subpregunta
-            
-        return _seleccionar_rec(self.arbol)
+        muestreador = self._obtener_muestreador()
+        return muestreador.muestrear() if muestreador is not None else None
+
+    def _raiz(self) -> Optional[NodoArbol]:
+        """Raíz actual; la de arbol_pesos cambia con las rotaciones, así que no se guarda."""
+        if self.arbol_pesos is not None:
+            return self.arbol_pesos.raiz
+        return self.arbol
+
+    def _obtener_muestreador(self) -> Optional[MuestreadorPesos]:
+        """
+        Devuelve el muestreador con las preguntas del árbol, armándolo si el árbol cambió.
+        
+        Returns:
+            Optional[MuestreadorPesos]: El muestreador, o None si no hay árbol
+        """
+        arbol = self.arbol_pesos if self.arbol_pesos is not None else self.arbol
+        if arbol is None:
+            return None
+        if self._muestreador is None or self._arbol_muestreado is not arbol:
+            if self._muestreador is not None:
+                self._muestreador.vaciar()
+            if self.arbol_pesos is not None:
+                preguntas = list(self.arbol_pesos)
+            else:
+                preguntas = [nodo.pregunta for nivel in self.arbol.niveles() for nodo in nivel]
+            self._muestreador = MuestreadorPesos(preguntas)
+            self._arbol_muestreado = arbol
+        return self._muestreador
 
 def iniciar_partida(categoria: str, config: Optional[ConfiguracionPartida] = None) -> List[Pregunta]:
     """
@@ -0,0 +1,80 @@
+import random
+import pygame
+from typing import Iterable, Optional
+from Modulo_Juego import JuegoMejorado, responder_siempre
+
+
+# Teclas de dirección que lee JuegoMejorado.handle_player_movement
+TECLAS_MOVIMIENTO = (pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_DOWN)
+
+class EstadoTeclas:
+    """
+    Estado de teclado sintético compatible con el resultado de pygame.key.get_pressed().
+
+    Atributos:
+        presionadas (frozenset): Códigos de las teclas presionadas.
+    """
+    def __init__(self, presionadas: Iterable[int] = ()):
+        self.presionadas = frozenset(presionadas)
+
+    def __getitem__(self, tecla: int) -> bool:
+        return tecla in self.presionadas
+
+class EntradaAleatoria:
+    """
+    Fuente de entrada determinista que simula a un jugador moviéndose al azar.
+
+    Mantiene cada combinación de teclas durante varios ticks para que el recorrido
+    se parezca al de una persona y no a ruido. Los 16 estados posibles se crean
+    una sola vez, así que cambiar de combinación no crea objetos nuevos.
+
+    Atributos:
+        rng (random.Random): Generador aleatorio de la entrada.
+        duracion_max (int): Máximo de ticks que se mantiene una combinación.
+    """
+    def __init__(self, semilla: Optional[int] = None, duracion_max: int = 30):
+        self.rng = random.Random(semilla)
+        self.duracion_max = duracion_max
+        # El bit i del índice indica si TECLAS_MOVIMIENTO[i] está presionada
+        self._estados = [
+            EstadoTeclas(t for i, t in enumerate(TECLAS_MOVIMIENTO) if indice >> i & 1)
+            for indice in range(1 << len(TECLAS_MOVIMIENTO))
+        ]
+        self._estado = self._estados[0]
+        self._restantes = 0
+
+    def __call__(self) -> EstadoTeclas:
+        if self._restantes <= 0:
+            indice = 0
+            bit = 1
+            while bit < len(self._estados):
+                if self.rng.random() < 0.3:
+                    indice |= bit
+                bit <<= 1
+            self._estado = self._estados[indice]
+            # Entero en [1, duracion_max] calculado como float: randint() crea enteros nuevos
+            self._restantes = (self.rng.random() * self.duracion_max) // 1.0 + 1.0
+        self._restantes -= 1
+        return self._estado
+
+def crear_juego_headless(categoria: str = "granja", semilla: Optional[int] = 0,
+                         entrada=None, responder=None) -> JuegoMejorado:
+    """
+    Crea una partida sin ventana, con semilla fija y entrada simulada.
+
+    Args:
+        categoria (str): Categoría inicial.
+        semilla (int, opcional): Semilla de la partida y de la entrada aleatoria.
+        entrada (Callable, opcional): Fuente de teclado. Por defecto EntradaAleatoria(semilla).
+        responder (Callable, opcional): Respondedor de preguntas. Por defecto siempre acierta.
+
+    Returns:
+        JuegoMejorado: Juego listo para avanzar con update().
+    """
+    return JuegoMejorado(
+        categoria,
+        headless=True,
+        semilla=semilla,
+        entrada=entrada or EntradaAleatoria(semilla),
+        responder=responder or responder_siempre(True),
+    )
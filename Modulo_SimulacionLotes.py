@@ -0,0 +1,277 @@
+import argparse
+import numpy as np
+import pygame
+from typing import Callable, Dict, List, Optional, Tuple
+from Modulo_Assets import AssetManager
+from Modulo_Juego import GameConfig, DificultadJuego, CATEGORIA_PROGRESSION
+
+
+# Columnas del arreglo de teclas que devuelven las políticas
+IZQ, DER, ARR, ABA = range(4)
+TAM_JUGADOR = 50
+
+class SimuladorLotes:
+    """
+    Avanza N partidas independientes a la vez con arreglos NumPy.
+
+    Aplica las mismas reglas y en el mismo orden que JuegoMejorado.update():
+    movimiento del jugador, movimiento/descarte/aparición de obstáculos,
+    colisiones y progresión de categoría. Cada partida tiene su propio jugador,
+    obstáculos, puntaje, vidas y categoría; las partidas terminadas quedan
+    congeladas.
+
+    La dificultad es fija durante toda la simulación: la velocidad de los
+    obstáculos es la que fijarían las preguntas de cada categoría para ese nivel.
+
+    Atributos:
+        n (int): Cantidad de partidas.
+        px, py (np.ndarray): Posición del jugador, forma (n,).
+        ox, oy (np.ndarray): Posición de los obstáculos, forma (n, capacidad).
+        activo (np.ndarray): Qué ranuras de obstáculo están en uso, forma (n, capacidad).
+        puntaje, puntaje_total, vidas, categoria, ticks_vivo (np.ndarray): Estado por partida.
+    """
+    def __init__(self, n: int, dificultad: int = DificultadJuego.NORMAL,
+                 categoria: str = "granja", config: Optional[GameConfig] = None,
+                 tamanos: Optional[Dict[str, Tuple[int, int, int]]] = None,
+                 semilla: Optional[int] = None):
+        """
+        Args:
+            n (int): Cantidad de partidas a simular.
+            dificultad (int): Nivel de DificultadJuego que fija la velocidad de los obstáculos.
+            categoria (str): Categoría inicial.
+            config (GameConfig, opcional): Configuración del juego.
+            tamanos (Dict, opcional): Por categoría, (ancho obstáculo, alto obstáculo,
+                alto jugador). Por defecto se leen de los assets con tamanos_por_categoria().
+            semilla (int, opcional): Semilla del generador aleatorio.
+        """
+        self.n = n
+        self.config = config or GameConfig()
+        self.rng = np.random.default_rng(semilla)
+        self.velocidad = DificultadJuego.obtener_velocidad_base(dificultad)
+        tamanos = tamanos or tamanos_por_categoria()
+        self.ancho_obs = np.array([tamanos[c][0] for c in CATEGORIA_PROGRESSION], dtype=np.float64)
+        self.alto_obs = np.array([tamanos[c][1] for c in CATEGORIA_PROGRESSION], dtype=np.float64)
+        self.alto_jugador = np.array([tamanos[c][2] for c in CATEGORIA_PROGRESSION], dtype=np.float64)
+
+        c = self.config
+        capacidad = max(c.INITIAL_OBSTACLE_COUNT, c.MAX_OBSTACLE_COUNT)
+        self.categoria = np.full(n, CATEGORIA_PROGRESSION.index(categoria.lower()))
+        self.px = np.full(n, float(c.SCREEN_WIDTH // 2))
+        self.py = c.SCREEN_HEIGHT - self.alto_jugador[self.categoria] - 10
+        self.ox = np.zeros((n, capacidad))
+        self.oy = np.zeros((n, capacidad))
+        self.activo = np.zeros((n, capacidad), dtype=bool)
+        self.cantidad_obs = np.full(n, c.INITIAL_OBSTACLE_COUNT)
+        self.contador_spawn = np.zeros(n, dtype=np.int64)
+        self.puntaje = np.zeros(n, dtype=np.int64)
+        self.puntaje_total = np.zeros(n, dtype=np.int64)
+        self.vidas = np.full(n, 3)
+        self.ticks_vivo = np.zeros(n, dtype=np.int64)
+        self._poblar(np.ones(n, dtype=bool))
+
+    @property
+    def vivas(self) -> np.ndarray:
+        """Máscara de las partidas que siguen en juego."""
+        return self.vidas > 0
+
+    def _poblar(self, filas: np.ndarray):
+        """Vacía los obstáculos de las filas indicadas y genera los iniciales (spawn_obstacle(random_position=True))."""
+        self.activo[filas] = False
+        idx = np.flatnonzero(filas)
+        if not len(idx):
+            return
+        k = self.config.INITIAL_OBSTACLE_COUNT
+        ancho = self.ancho_obs[self.categoria[idx]][:, None]
+        self.ox[idx, :k] = self.rng.integers(0, self.config.SCREEN_WIDTH - ancho + 1, size=(len(idx), k))
+        self.oy[idx, :k] = self.rng.integers(-200, 1, size=(len(idx), k))
+        self.activo[idx, :k] = True
+
+    def paso(self, teclas: np.ndarray):
+        """
+        Avanza un tick en todas las partidas vivas.
+
+        Args:
+            teclas (np.ndarray): Booleanos de forma (n, 4) con las columnas IZQ, DER, ARR, ABA.
+        """
+        c = self.config
+        vivas = self.vivas
+        v = c.PLAYER_SPEED
+
+        # handle_player_movement: cada tecla se evalúa con la posición ya actualizada
+        mover = teclas & vivas[:, None]
+        self.px -= v * (mover[:, IZQ] & (self.px > 0))
+        self.px += v * (mover[:, DER] & (self.px < c.SCREEN_WIDTH - TAM_JUGADOR))
+        self.py -= v * (mover[:, ARR] & (self.py > 0))
+        self.py += v * (mover[:, ABA] & (self.py < c.SCREEN_HEIGHT - TAM_JUGADOR))
+
+        # update_obstacles: mover, descartar los que salieron y sumar puntos
+        activos = self.activo & vivas[:, None]
+        self.oy += self.velocidad * activos
+        fuera = activos & (self.oy > c.SCREEN_HEIGHT)
+        esquivados = fuera.sum(axis=1)
+        self.puntaje += 10 * esquivados
+        self.puntaje_total += 10 * esquivados
+        self.activo &= ~fuera
+
+        # Aparición de obstáculos con retraso
+        faltan = vivas & (self.activo.sum(axis=1) < self.cantidad_obs)
+        self.contador_spawn += faltan
+        aparecen = np.flatnonzero(faltan & (self.contador_spawn >= c.OBSTACLE_SPAWN_DELAY))
+        if len(aparecen):
+            self.contador_spawn[aparecen] = 0
+            ranura = np.argmin(self.activo[aparecen], axis=1)
+            cat = self.categoria[aparecen]
+            self.ox[aparecen, ranura] = self.rng.integers(0, c.SCREEN_WIDTH - self.ancho_obs[cat] + 1)
+            self.oy[aparecen, ranura] = -self.alto_obs[cat]
+            self.activo[aparecen, ranura] = True
+
+        # check_collisions: jugador de 50x50 contra cada obstáculo activo
+        ancho = self.ancho_obs[self.categoria][:, None]
+        alto = self.alto_obs[self.categoria][:, None]
+        px, py = self.px[:, None], self.py[:, None]
+        choque = (self.activo & (self.ox < px + TAM_JUGADOR) & (px < self.ox + ancho)
+                  & (self.oy < py + TAM_JUGADOR) & (py < self.oy + alto)).any(axis=1) & vivas
+        self.vidas -= choque
+        reinicio = choque & (self.vidas > 0)
+        self.px[reinicio] = c.SCREEN_WIDTH // 2
+        self.py[reinicio] = c.SCREEN_HEIGHT - 100
+
+        # check_category_progression
+        avanza = self.vivas & (self.puntaje >= c.POINTS_TO_ADVANCE) \
+            & (self.categoria < len(CATEGORIA_PROGRESSION) - 1)
+        if avanza.any():
+            self.categoria[avanza] += 1
+            self.puntaje[avanza] = 0
+            self.cantidad_obs[avanza] = c.INITIAL_OBSTACLE_COUNT
+            self.px[avanza] = c.SCREEN_WIDTH // 2
+            self.py[avanza] = c.SCREEN_HEIGHT - self.alto_jugador[self.categoria[avanza]] - 10
+            self._poblar(avanza)
+
+        self.ticks_vivo += vivas
+
+    def simular(self, politica: Callable[["SimuladorLotes"], np.ndarray], max_ticks: int) -> int:
+        """
+        Avanza hasta que terminen todas las partidas o se alcance max_ticks.
+
+        Returns:
+            int: Ticks ejecutados.
+        """
+        for tick in range(max_ticks):
+            if not self.vivas.any():
+                return tick
+            self.paso(politica(self))
+        return max_ticks
+
+def tamanos_por_categoria() -> Dict[str, Tuple[int, int, int]]:
+    """
+    Obtiene de los assets el tamaño del obstáculo y la altura del jugador por categoría.
+
+    Returns:
+        Dict[str, Tuple[int, int, int]]: (ancho obstáculo, alto obstáculo, alto jugador).
+    """
+    if not pygame.get_init():
+        pygame.init()
+    tamanos = {}
+    for categoria in CATEGORIA_PROGRESSION:
+        gestor = AssetManager(categoria)
+        obstaculo, jugador = gestor.images["obstacle"], gestor.images["player"]
+        tamanos[categoria] = (obstaculo.get_width(), obstaculo.get_height(), jugador.get_height())
+        gestor.liberar()
+    return tamanos
+
+def politica_quieto(sim: SimuladorLotes) -> np.ndarray:
+    """Bot que nunca se mueve."""
+    return np.zeros((sim.n, 4), dtype=bool)
+
+def politica_aleatoria(sim: SimuladorLotes, prob: float = 0.3) -> np.ndarray:
+    """Bot que presiona cada tecla al azar con la probabilidad dada en cada tick."""
+    return sim.rng.random((sim.n, 4)) < prob
+
+def politica_esquivar(sim: SimuladorLotes, margen: float = 150.0) -> np.ndarray:
+    """
+    Bot que se aparta horizontalmente del obstáculo más cercano que viene por encima.
+
+    Solo mira obstáculos que se superponen en x con el jugador (más un margen) y
+    están a menos de `margen` píxeles por encima de él.
+    """
+    teclas = np.zeros((sim.n, 4), dtype=bool)
+    ancho = sim.ancho_obs[sim.categoria][:, None]
+    px, py = sim.px[:, None], sim.py[:, None]
+    centro_obs = sim.ox + ancho / 2
+    amenaza = (sim.activo & (sim.ox < px + TAM_JUGADOR + 10) & (px - 10 < sim.ox + ancho)
+               & (sim.oy < py + TAM_JUGADOR) & (sim.oy > py - margen))
+    distancia = np.where(amenaza, py - sim.oy, np.inf)
+    cercano = np.argmin(distancia, axis=1)
+    hay = np.isfinite(distancia[np.arange(sim.n), cercano])
+    centro = centro_obs[np.arange(sim.n), cercano]
+    jugador = sim.px + TAM_JUGADOR / 2
+    a_la_izquierda = (jugador < centro) & (sim.px > 0) | (sim.px >= sim.config.SCREEN_WIDTH - TAM_JUGADOR)
+    teclas[:, IZQ] = hay & a_la_izquierda
+    teclas[:, DER] = hay & ~a_la_izquierda
+    return teclas
+
+POLITICAS: Dict[str, Callable[[SimuladorLotes], np.ndarray]] = {
+    "quieto": politica_quieto,
+    "aleatoria": politica_aleatoria,
+    "esquivar": politica_esquivar,
+}
+
+def distribuciones_por_dificultad(partidas: int = 1000, max_ticks: int = 18000,
+                                  politica: str = "esquivar", categoria: str = "granja",
+                                  niveles: Optional[List[int]] = None,
+                                  config: Optional[GameConfig] = None,
+                                  semilla: Optional[int] = 0) -> Dict[int, Dict[str, float]]:
+    """
+    Simula un lote de partidas por nivel de dificultad y resume los resultados.
+
+    Args:
+        partidas (int): Partidas por nivel.
+        max_ticks (int): Límite de ticks por partida (18000 son 5 minutos a 60 ticks/s).
+        politica (str): Nombre de la política del bot en POLITICAS.
+        categoria (str): Categoría inicial.
+        niveles (List[int], opcional): Niveles a simular. Por defecto del 1 al 5.
+        config (GameConfig, opcional): Configuración a evaluar.
+        semilla (int, opcional): Semilla base.
+
+    Returns:
+        Dict[int, Dict[str, float]]: Por nivel, percentiles de supervivencia (en
+            segundos) y de puntaje total, y la categoría media alcanzada.
+    """
+    niveles = niveles or [DificultadJuego.MUY_BAJO, DificultadJuego.BAJO, DificultadJuego.NORMAL,
+                          DificultadJuego.INTERMEDIO, DificultadJuego.DIFICIL]
+    config = config or GameConfig()
+    tamanos = tamanos_por_categoria()
+    resultados = {}
+    for nivel in niveles:
+        sim = SimuladorLotes(partidas, nivel, categoria, config, tamanos,
+                             None if semilla is None else semilla + nivel)
+        sim.simular(POLITICAS[politica], max_ticks)
+        segundos = sim.ticks_vivo / config.TICK_RATE
+        s10, s50, s90 = np.percentile(segundos, [10, 50, 90])
+        p10, p50, p90 = np.percentile(sim.puntaje_total, [10, 50, 90])
+        resultados[nivel] = {
+            "supervivencia_p10_s": s10, "supervivencia_p50_s": s50, "supervivencia_p90_s": s90,
+            "vivas_al_final": float(sim.vivas.mean()),
+            "puntaje_p10": p10, "puntaje_p50": p50, "puntaje_p90": p90,
+            "categoria_media": float(sim.categoria.mean()),
+        }
+    return resultados
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulación en lote para ajustar la dificultad")
+    parser.add_argument("--partidas", type=int, default=500)
+    parser.add_argument("--ticks", type=int, default=18000)
+    parser.add_argument("--politica", choices=sorted(POLITICAS), default="esquivar")
+    parser.add_argument("--categoria", default="granja")
+    parser.add_argument("--semilla", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    resultados = distribuciones_por_dificultad(args.partidas, args.ticks, args.politica,
+                                               args.categoria, semilla=args.semilla)
+    columnas = list(next(iter(resultados.values())))
+    print("nivel  " + "  ".join(f"{c:>20}" for c in columnas))
+    for nivel, fila in resultados.items():
+        print(f"{nivel:>5}  " + "  ".join(f"{fila[c]:>20.2f}" for c in columnas))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+import pygame
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+
+Color = Tuple[int, int, int]
+
+class CacheTexto:
+    """
+    Registro compartido de fuentes y caché acotada de superficies de texto.
+
+    Crear un pygame.font.Font y rasterizar texto es caro; el HUD y los diálogos
+    muestran casi siempre los mismos textos, así que cada fuente se crea una sola
+    vez y cada texto se renderiza solo cuando cambia. Las superficies se
+    descartan en orden LRU cuando se supera el máximo.
+
+    Las fuentes dejan de ser válidas con pygame.quit(), por lo que hay que llamar
+    a limpiar() cada vez que pygame se reinicia.
+
+    Atributos:
+        max_superficies (int): Máximo de superficies de texto en caché.
+        fuentes (Dict[Tuple[Optional[str], int], pygame.font.Font]): Fuentes creadas.
+        superficies (OrderedDict): Superficies renderizadas, de la menos a la más reciente.
+    """
+    def __init__(self, max_superficies: int = 256):
+        self.max_superficies = max_superficies
+        self.fuentes: Dict[Tuple[Optional[str], int], pygame.font.Font] = {}
+        self.superficies: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+
+    def fuente(self, tam: int = 36, nombre: Optional[str] = None) -> pygame.font.Font:
+        """
+        Obtiene una fuente del registro, creándola la primera vez.
+
+        Args:
+            tam (int): Tamaño de la fuente.
+            nombre (str, opcional): Archivo de fuente. None usa la fuente por defecto de pygame.
+        """
+        clave = (nombre, tam)
+        fuente = self.fuentes.get(clave)
+        if fuente is None:
+            fuente = pygame.font.Font(nombre, tam)
+            self.fuentes[clave] = fuente
+        return fuente
+
+    def renderizar(self, texto: str, color: Color = (255, 255, 255), tam: int = 36,
+                   nombre: Optional[str] = None, antialias: bool = True) -> pygame.Surface:
+        """
+        Devuelve la superficie de un texto, renderizándola solo si no está en caché.
+
+        Args:
+            texto (str): Texto a renderizar.
+            color (Tuple[int, int, int]): Color del texto.
+            tam (int): Tamaño de la fuente.
+            nombre (str, opcional): Archivo de fuente.
+            antialias (bool): Si se suavizan los bordes.
+
+        Returns:
+            pygame.Surface: Superficie con el texto. No debe modificarse, es compartida.
+        """
+        clave = (texto, color, tam, nombre, antialias)
+        superficie = self.superficies.get(clave)
+        if superficie is not None:
+            self.superficies.move_to_end(clave)
+            return superficie
+        superficie = self.fuente(tam, nombre).render(texto, antialias, color)
+        self.superficies[clave] = superficie
+        if len(self.superficies) > self.max_superficies:
+            self.superficies.popitem(last=False)
+        return superficie
+
+    def limpiar(self):
+        """Descarta todas las fuentes y superficies."""
+        self.fuentes.clear()
+        self.superficies.clear()
+
+
+# Caché compartida por el juego y los diálogos de preguntas
+cache_texto = CacheTexto()
+
+def renderizar_texto(texto: str, color: Color = (255, 255, 255), tam: int = 36) -> pygame.Surface:
+    """Atajo para renderizar con la caché compartida y la fuente por defecto."""
+    return cache_texto.renderizar(texto, color, tam)
@@ -1,5 +1,5 @@
 import random
-from typing import Optional
+from typing import Callable, List, Optional
 
 class Pregunta:
     """
@@ -7,15 +7,50 @@ class Pregunta:
     
     Attributes:
         texto (str): El texto de la pregunta
-        peso (int): Peso actual de la pregunta basado en respuestas
+        respuesta (str, opcional): La respuesta correcta, si se conoce
+        dificultad (int): Dificultad declarada de la pregunta
+        peso (int): Peso actual de la pregunta basado en respuestas. Al cambiar
+            se avisa a los observadores registrados con observar_peso()
         correctas (int): Número de respuestas correctas
         incorrectas (int): Número de respuestas incorrectas
     """
-    def __init__(self, texto: str) -> None:
+    __slots__ = ("texto", "respuesta", "dificultad", "_peso", "correctas", "incorrectas", "_observadores")
+
+    def __init__(self, texto: str, respuesta: Optional[str] = None, dificultad: int = 1) -> None:
         self.texto = texto
-        self.peso = 0
+        self.respuesta = respuesta
+        self.dificultad = dificultad
+        self._peso = 0
         self.correctas = 0
         self.incorrectas = 0
+        self._observadores: Optional[List[Callable[["Pregunta", int], None]]] = None
+
+    @property
+    def peso(self) -> int:
+        return self._peso
+
+    @peso.setter
+    def peso(self, valor: int) -> None:
+        anterior = self._peso
+        self._peso = valor
+        if self._observadores and valor != anterior:
+            for observador in list(self._observadores):
+                observador(self, anterior)
+
+    def observar_peso(self, observador: Callable[["Pregunta", int], None]) -> None:
+        """
+        Registra una función que se llama con (pregunta, peso_anterior) cada vez que cambia el peso.
+        
+        Las estructuras ordenadas por peso la usan para mantenerse al día.
+        """
+        if self._observadores is None:
+            self._observadores = []
+        self._observadores.append(observador)
+
+    def dejar_de_observar_peso(self, observador: Callable[["Pregunta", int], None]) -> None:
+        """Quita una función registrada con observar_peso()."""
+        if self._observadores and observador in self._observadores:
+            self._observadores.remove(observador)
 
     def registrar_respuesta(self, correcta: bool) -> None:
         """
@@ -36,20 +71,104 @@ class Pregunta:
         return f"Pregunta('{self.texto}', peso={self.peso})"
 
 class NodoArbol:
+    """
+    Nodo de un árbol binario de preguntas.
+    
+    Cada nodo guarda la altura de su subárbol y, la primera vez que se
+    consulta, un índice de sus descendientes por nivel. Al cambiar un hijo se
+    recalculan las alturas y se descartan los índices de ese nodo y de sus
+    ancestros, así que las consultas nunca recorren el árbol salvo para
+    reconstruir un índice después de una modificación.
+    
+    Attributes:
+        pregunta (Pregunta): La pregunta del nodo
+        padre (NodoArbol, opcional): Nodo padre, None en la raíz
+    """
+    __slots__ = ("pregunta", "padre", "_izquierdo", "_derecho", "_altura", "_niveles")
+
     def __init__(self, pregunta: Pregunta) -> None:
         self.pregunta = pregunta
-        self.izquierdo = None
-        self.derecho = None
+        self.padre: Optional["NodoArbol"] = None
+        self._izquierdo: Optional["NodoArbol"] = None
+        self._derecho: Optional["NodoArbol"] = None
+        self._altura = 1
+        self._niveles: Optional[List[List["NodoArbol"]]] = None
+
+    @property
+    def izquierdo(self) -> Optional["NodoArbol"]:
+        return self._izquierdo
+
+    @izquierdo.setter
+    def izquierdo(self, nodo: Optional["NodoArbol"]) -> None:
+        self._enlazar("_izquierdo", nodo)
+
+    @property
+    def derecho(self) -> Optional["NodoArbol"]:
+        return self._derecho
+
+    @derecho.setter
+    def derecho(self, nodo: Optional["NodoArbol"]) -> None:
+        self._enlazar("_derecho", nodo)
+
+    def _enlazar(self, atributo: str, nodo: Optional["NodoArbol"]) -> None:
+        """Reemplaza un hijo y actualiza alturas e índices hasta la raíz."""
+        anterior = getattr(self, atributo)
+        if anterior is not None and anterior.padre is self:
+            anterior.padre = None
+        if nodo is not None:
+            nodo.padre = self
+        setattr(self, atributo, nodo)
+        actual = self
+        while actual is not None:
+            altura_izq = actual._izquierdo._altura if actual._izquierdo else 0
+            altura_der = actual._derecho._altura if actual._derecho else 0
+            actual._altura = max(altura_izq, altura_der) + 1
+            actual._niveles = None
+            actual = actual.padre
         
     def es_hoja(self) -> bool:
         """Verifica si el nodo es una hoja."""
-        return self.izquierdo is None and self.derecho is None
+        return self._izquierdo is None and self._derecho is None
     
     def altura(self) -> int:
-        """Calcula la altura del subárbol desde este nodo."""
-        altura_izq = self.izquierdo.altura() if self.izquierdo else 0
-        altura_der = self.derecho.altura() if self.derecho else 0
-        return max(altura_izq, altura_der) + 1
+        """Devuelve la altura del subárbol desde este nodo, sin recorrerlo."""
+        return self._altura
+
+    def niveles(self) -> List[List["NodoArbol"]]:
+        """
+        Devuelve los nodos del subárbol agrupados por nivel, de izquierda a derecha.
+        
+        El índice se arma con un recorrido por niveles la primera vez y se
+        reutiliza hasta que el subárbol cambie.
+        
+        Returns:
+            List[List[NodoArbol]]: En la posición k, los nodos a profundidad k + 1
+                (este nodo está en el nivel 1). No debe modificarse.
+        """
+        if self._niveles is None:
+            niveles = []
+            nivel = [self]
+            while nivel:
+                niveles.append(nivel)
+                nivel = [hijo for nodo in nivel for hijo in (nodo._izquierdo, nodo._derecho) if hijo is not None]
+            self._niveles = niveles
+        return self._niveles
+
+    def nodos_en_nivel(self, nivel: int) -> List["NodoArbol"]:
+        """
+        Devuelve los nodos a una profundidad dada, contando este nodo como nivel 1.
+        
+        Args:
+            nivel (int): Profundidad buscada.
+        
+        Returns:
+            List[NodoArbol]: Nodos del nivel de izquierda a derecha; vacía si el
+                nivel no existe. No debe modificarse.
+        """
+        niveles = self.niveles()
+        if 1 <= nivel <= len(niveles):
+            return niveles[nivel - 1]
+        return []
 
 
 def construir_arbol_balanceado(preguntas):
@@ -0,0 +1,19 @@
+import os
+import sys
+
+# Los módulos del juego están en la raíz del repositorio, sin paquete
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Sin ventana ni audio reales: las pruebas corren en CI
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+import pytest
+
+
+@pytest.fixture
+def pygame_iniciado():
+    """pygame inicializado; JuegoMejorado.cleanup() lo cierra, así que se abre por prueba."""
+    if not pygame.get_init():
+        pygame.init()
+    yield
@@ -0,0 +1,77 @@
+import random
+
+from Modulo_creacionDelArbol import NodoArbol, Pregunta, construir_arbol_balanceado
+from Modulo_EstructuraArbol import obtener_pregunta_por_dificultad
+from Modulo_SeleccionPreguntas import ConfiguracionPartida, SelectorPreguntas
+
+
+def _pregunta_en_nivel_dfs(nodo, nivel, usadas=None, nivel_actual=1):
+    """Búsqueda de referencia: recorrido en profundidad desde la raíz."""
+    if nodo is None or nivel_actual > nivel:
+        return None
+    if nivel_actual == nivel:
+        if usadas is None or nodo.pregunta not in usadas:
+            return nodo.pregunta
+        return None
+    return (_pregunta_en_nivel_dfs(nodo.izquierdo, nivel, usadas, nivel_actual + 1)
+            or _pregunta_en_nivel_dfs(nodo.derecho, nivel, usadas, nivel_actual + 1))
+
+
+def _altura_recursiva(nodo):
+    if nodo is None:
+        return 0
+    return max(_altura_recursiva(nodo.izquierdo), _altura_recursiva(nodo.derecho)) + 1
+
+
+def _arbol(tamano, rng):
+    preguntas = [Pregunta(f"p{i}") for i in range(tamano)]
+    for pregunta in preguntas:
+        pregunta.peso = rng.randrange(10)
+    return construir_arbol_balanceado(preguntas)
+
+
+def test_el_indice_por_nivel_sigue_las_modificaciones():
+    rng = random.Random(0)
+    arbol = _arbol(127, rng)
+    for i in range(50):
+        nodo = rng.choice([n for nivel in arbol.niveles() for n in nivel])
+        if rng.random() < 0.5:
+            nodo.izquierdo = NodoArbol(Pregunta(f"nueva{i}"))
+        else:
+            nodo.derecho = None
+        for nivel in arbol.niveles():
+            for n in nivel:
+                assert n.altura() == _altura_recursiva(n)
+        for nivel in range(1, arbol.altura() + 2):
+            assert obtener_pregunta_por_dificultad(arbol, nivel) is _pregunta_en_nivel_dfs(arbol, nivel)
+
+
+def test_el_selector_recorre_todo_el_nivel_sin_repetir():
+    arbol = _arbol(127, random.Random(1))
+    profundo = arbol.altura()
+    selector = SelectorPreguntas("Granja", ConfiguracionPartida(num_preguntas=0))
+    selector.arbol = arbol
+    en_nivel = len(arbol.nodos_en_nivel(profundo))
+    elegidas = [selector._seleccionar_pregunta_nivel(profundo) for _ in range(en_nivel)]
+    assert set(elegidas) == {nodo.pregunta for nodo in arbol.nodos_en_nivel(profundo)}
+    assert selector._seleccionar_pregunta_nivel(profundo) is None
+
+
+def test_el_cursor_del_selector_se_reinicia_cuando_cambia_el_arbol():
+    arbol = _arbol(100, random.Random(2))
+    profundo = arbol.altura()
+    selector = SelectorPreguntas("Granja", ConfiguracionPartida(num_preguntas=0))
+    selector.arbol = arbol
+    for _ in arbol.nodos_en_nivel(profundo):
+        selector._seleccionar_pregunta_nivel(profundo)
+    assert selector._seleccionar_pregunta_nivel(profundo) is None
+
+    # Un nodo nuevo a la izquierda del nivel queda antes de la posición del cursor
+    padre = next(n for n in arbol.nodos_en_nivel(profundo - 1) if n.izquierdo is None)
+    nueva = Pregunta("nueva")
+    padre.izquierdo = NodoArbol(nueva)
+    assert selector._seleccionar_pregunta_nivel(profundo) is nueva
+
+    # Otro árbol: el cursor del anterior no se aplica
+    selector.arbol = _arbol(100, random.Random(3))
+    assert selector._seleccionar_pregunta_nivel(profundo) is selector.arbol.nodos_en_nivel(profundo)[0].pregunta
@@ -0,0 +1,31 @@
+import random
+
+from Modulo_ArbolCompacto import ArbolCompacto
+from Modulo_creacionDelArbol import Pregunta, construir_arbol_balanceado, obtener_pregunta_aleatoria
+
+
+def _arboles(tamano, semilla=0):
+    rng = random.Random(semilla)
+    textos = [f"¿Pregunta número {i}?" for i in range(tamano)]
+    pesos = [rng.randrange(10) for _ in range(tamano)]
+    preguntas = [Pregunta(texto) for texto in textos]
+    for pregunta, peso in zip(preguntas, pesos):
+        pregunta.peso = peso
+    return construir_arbol_balanceado(preguntas), ArbolCompacto(textos, pesos).raiz
+
+
+def test_mismas_consultas_que_el_arbol_de_punteros():
+    punteros, compacto = _arboles(1000)
+    elegidas = []
+    for arbol in (punteros, compacto):
+        random.seed(0)
+        elegidas.append([obtener_pregunta_aleatoria(arbol).texto for _ in range(5000)])
+    assert elegidas[0] == elegidas[1]
+
+
+def test_mismos_niveles_que_el_arbol_de_punteros():
+    punteros, compacto = _arboles(1000)
+    assert punteros.altura() == compacto.altura()
+    for nivel in range(1, punteros.altura() + 1):
+        assert ([n.pregunta.texto for n in punteros.nodos_en_nivel(nivel)]
+                == [n.pregunta.texto for n in compacto.nodos_en_nivel(nivel)])
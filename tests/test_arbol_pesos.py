@@ -0,0 +1,83 @@
+import random
+
+import pytest
+
+from Modulo_ArbolCompacto import ArbolCompacto, PreguntaCompacta
+from Modulo_ArbolPesos import ArbolPesos
+from Modulo_creacionDelArbol import Pregunta
+from Modulo_SeleccionPreguntas import ConfiguracionPartida, SelectorPreguntas
+
+
+def _preguntas(tamano, rng):
+    preguntas = [Pregunta(f"p{i}") for i in range(tamano)]
+    for pregunta in preguntas:
+        pregunta.peso = rng.randrange(5)
+    return preguntas
+
+
+def test_el_orden_por_peso_sigue_las_respuestas():
+    rng = random.Random(0)
+    preguntas = _preguntas(500, rng)
+    arbol = ArbolPesos(preguntas)
+    for _ in range(2000):
+        rng.choice(preguntas).registrar_respuesta(rng.random() < 0.5)
+    orden = list(arbol)
+    assert len(orden) == len(preguntas)
+    assert [p.peso for p in orden] == sorted(p.peso for p in preguntas)
+    for k, pregunta in enumerate(orden):
+        assert arbol.rango(pregunta) == k
+        assert arbol.k_esima(k) is pregunta
+    for minimo in range(-2, 8):
+        for maximo in range(minimo - 1, 8):
+            esperadas = [p for p in orden if minimo <= p.peso <= maximo]
+            assert arbol.contar_en_rango(minimo, maximo) == len(esperadas)
+            assert arbol.preguntas_en_rango(minimo, maximo) == esperadas
+    arbol.vaciar()
+
+
+def test_con_pesos_iguales_conserva_el_orden_de_insercion():
+    preguntas = [Pregunta(f"p{i}") for i in range(20)]
+    assert list(ArbolPesos(preguntas)) == preguntas
+
+
+def test_eliminar_deja_de_observar_el_peso():
+    rng = random.Random(1)
+    preguntas = _preguntas(50, rng)
+    arbol = ArbolPesos(preguntas)
+    quitada = preguntas[10]
+    arbol.eliminar(quitada)
+    quitada.registrar_respuesta(False)
+    assert quitada not in arbol and len(arbol) == 49
+    with pytest.raises(KeyError):
+        arbol.rango(quitada)
+    with pytest.raises(ValueError):
+        arbol.insertar(preguntas[0])
+    arbol.vaciar()
+
+
+def test_sigue_los_pesos_de_preguntas_compactas():
+    rng = random.Random(2)
+    compacto = ArbolCompacto([f"p{i}" for i in range(200)], [rng.randrange(5) for _ in range(200)])
+    preguntas = [PreguntaCompacta(compacto, i) for i in range(200)]
+    arbol = ArbolPesos(preguntas)
+    for _ in range(1000):
+        # Una vista nueva de la misma pregunta también avisa a los observadores
+        PreguntaCompacta(compacto, rng.randrange(200)).registrar_respuesta(rng.random() < 0.5)
+    assert [p.peso for p in arbol] == sorted(compacto.pesos)
+    arbol.vaciar()
+    assert not compacto._observadores
+
+
+def test_el_selector_elige_por_nivel_con_los_pesos_actuales():
+    selector = SelectorPreguntas("Granja", ConfiguracionPartida(num_preguntas=0, seguir_pesos=True))
+    arbol = selector.arbol_pesos
+    pesada = arbol.k_esima(0)
+    for _ in range(10):
+        pesada.registrar_respuesta(False)
+    # La más pesada pasa al extremo derecho del orden y el nivel 1 es la nueva raíz
+    assert arbol.k_esima(len(arbol) - 1) is pesada
+    assert selector._seleccionar_pregunta_nivel(1) is arbol.raiz.pregunta
+    profundo = arbol.raiz.altura()
+    en_nivel = [n.pregunta for n in arbol.raiz.nodos_en_nivel(profundo)]
+    assert [selector._seleccionar_pregunta_nivel(profundo) for _ in en_nivel] == en_nivel
+    assert selector._seleccionar_pregunta_aleatoria() in arbol
@@ -0,0 +1,78 @@
+import os
+
+import pygame
+import pytest
+from PIL import Image
+
+import Modulo_Assets
+from Modulo_Assets import MAX_IMAGENES_ESCALADAS, AssetManager
+from Modulo_CacheAssets import CacheDiscoAssets
+from Modulo_Juego import CATEGORIA_PROGRESSION
+from Modulo_RegistroAssets import registro_assets
+
+pytestmark = pytest.mark.usefixtures("pygame_iniciado")
+
+
+def _pixeles(superficie):
+    return superficie.get_size(), pygame.image.tostring(superficie, "RGBA")
+
+
+def _cargar_todas():
+    registro_assets.vaciar()
+    imagenes = {}
+    for categoria in CATEGORIA_PROGRESSION:
+        gestor = AssetManager(categoria, convertir=False, usar_atlas=False)
+        imagenes.update({(categoria, nombre): _pixeles(imagen) for nombre, imagen in gestor.images.items()})
+        gestor.liberar()
+    return imagenes
+
+
+def test_la_cache_en_disco_devuelve_los_mismos_pixeles(tmp_path, monkeypatch):
+    cache = CacheDiscoAssets(str(tmp_path), activo=False)
+    monkeypatch.setattr(Modulo_Assets, "cache_disco", cache)
+    referencia = _cargar_todas()
+    cache.activo = True
+    assert _cargar_todas() == referencia  # fría: decodifica y escribe
+    cache.aciertos = cache.fallos = 0
+    assert _cargar_todas() == referencia  # caliente: lee los blobs
+    assert cache.aciertos > 0 and cache.fallos == 0
+    registro_assets.vaciar()
+
+
+@pytest.mark.parametrize("error", [pygame.error("falla"), OSError(28, "Disco lleno")])
+def test_guardar_borra_el_temporal_si_falla(tmp_path, monkeypatch, error):
+    cache = CacheDiscoAssets(str(tmp_path))
+    superficie = pygame.Surface((4, 4), pygame.SRCALPHA, 32)
+
+    def fallar(*args):
+        raise error
+
+    monkeypatch.setattr(pygame.image, "tostring", fallar)
+    cache.guardar("granja/player.png", "h", (4, 4), "lanczos", superficie)
+    assert os.listdir(tmp_path) == []
+
+
+def _escalar_con_copias(superficie, tam):
+    """Camino de escalado original: tostring, frombytes, resize, tobytes, fromstring."""
+    imagen = Image.frombytes("RGBA", superficie.get_size(), pygame.image.tostring(superficie, "RGBA"))
+    imagen = imagen.resize(tam, Image.Resampling.LANCZOS)
+    return pygame.image.fromstring(imagen.tobytes(), imagen.size, imagen.mode)
+
+
+@pytest.mark.parametrize("archivo, tam", [("background.png", (800, 600)), ("obstacle.png", (50, 30))])
+def test_escalado_alta_igual_al_camino_por_copias(archivo, tam):
+    gestor = AssetManager("granja", convertir=False)
+    original = gestor._pil_to_pygame(Image.open(os.path.join(gestor.assets_path, archivo)))
+    escalada = gestor.scale_image(original, *tam, force_aspect_ratio=False, calidad="alta")
+    assert _pixeles(escalada) == _pixeles(_escalar_con_copias(original, tam))
+    gestor.liberar()
+
+
+def test_get_scaled_image_acota_la_cache():
+    gestor = AssetManager("granja", convertir=False)
+    for i in range(3 * MAX_IMAGENES_ESCALADAS):
+        gestor.get_scaled_image("background", 0.25 + i * 0.02)
+    assert len(gestor.cache) <= MAX_IMAGENES_ESCALADAS
+    with pytest.raises(ValueError):
+        gestor.get_scaled_image("background", 0)
+    gestor.liberar()
@@ -0,0 +1,40 @@
+import pygame
+import pytest
+
+from Modulo_Assets import AssetManager
+from Modulo_Atlas import SPRITES_CATEGORIA, AtlasSprites, construir_atlas
+from Modulo_Juego import CATEGORIA_PROGRESSION
+from Modulo_Manifiesto import manifiesto_compartido
+from Modulo_RegistroAssets import registro_assets
+
+pytestmark = pytest.mark.usefixtures("pygame_iniciado")
+
+
+def test_el_atlas_tiene_los_mismos_pixeles_que_los_sprites_separados(tmp_path):
+    manifiesto = manifiesto_compartido()
+    ruta_atlas, ruta_indice = str(tmp_path / "atlas.rgba"), str(tmp_path / "atlas.json")
+    construir_atlas(manifiesto, ruta_atlas, ruta_indice)
+    atlas = AtlasSprites.cargar(manifiesto, ruta_atlas, ruta_indice)
+    assert atlas is not None
+
+    registro_assets.vaciar()
+    for categoria in CATEGORIA_PROGRESSION:
+        gestor = AssetManager(categoria, convertir=False, usar_atlas=False)
+        for nombre in SPRITES_CATEGORIA:
+            original, sprite = gestor.originales[nombre], atlas.original(f"{categoria}/{nombre}")
+            assert sprite.get_size() == original.get_size()
+            assert pygame.image.tostring(sprite, "RGBA") == pygame.image.tostring(original, "RGBA")
+        gestor.liberar()
+    # Todos los sprites comparten los pixeles de una sola superficie
+    assert len({id(atlas.original(clave).get_parent()) for clave in atlas.rects}) == 1
+
+
+def test_un_atlas_obsoleto_no_se_carga(tmp_path):
+    manifiesto = manifiesto_compartido()
+    ruta_atlas, ruta_indice = str(tmp_path / "atlas.rgba"), str(tmp_path / "atlas.json")
+    construir_atlas(manifiesto, ruta_atlas, ruta_indice)
+    with open(ruta_indice) as f:
+        indice = f.read()
+    with open(ruta_indice, "w") as f:
+        f.write(indice.replace('"version": ', '"version": 9'))
+    assert AtlasSprites.cargar(manifiesto, ruta_atlas, ruta_indice) is None
@@ -0,0 +1,76 @@
+import random
+
+import pygame
+import pytest
+
+from Modulo_Colisiones import HashEspacial
+
+
+def _intersecta(a, b):
+    ax, ay, aw, ah = a
+    bx, by, bw, bh = b
+    return ax < bx + bw and bx < ax + aw and ay < by + bh and by < ay + ah
+
+
+@pytest.mark.parametrize("tabla", [32, 2])
+def test_colisiona_coincide_con_fuerza_bruta(tabla):
+    # Con una tabla de 2 x 2 cubetas muchas celdas comparten cubeta
+    rng = random.Random(tabla)
+    rejilla = HashEspacial(50, capacidad=4, filas=tabla, columnas=tabla)
+    cajas = {}
+    dy = 0.0
+    for _ in range(3000):
+        operacion = rng.random()
+        clave = rng.randrange(64)
+        x, y = rng.uniform(-100, 500), rng.uniform(-100, 500)
+        w, h = rng.randint(1, 140), rng.randint(1, 140)
+        if operacion < 0.3:
+            rejilla.insertar(clave, x, y, w, h)
+            cajas[clave] = [x, y - dy, w, h]
+        elif operacion < 0.45:
+            rejilla.eliminar(clave)
+            cajas.pop(clave, None)
+        elif operacion < 0.6:
+            rejilla.actualizar(clave, x, y, w, h)
+            cajas[clave] = [x, y - dy, w, h]
+        elif operacion < 0.7:
+            rejilla.desplazar(0, 3.5)
+            dy += 3.5
+        consulta = (rng.uniform(-100, 500), rng.uniform(-100, 500), rng.randint(1, 200), rng.randint(1, 200))
+        chocan = {c for c, (cx, cy, cw, ch) in cajas.items() if _intersecta(consulta, (cx, cy + dy, cw, ch))}
+        assert rejilla.colisiona(*consulta) == bool(chocan)
+        assert chocan <= set(rejilla.candidatos(*consulta))
+        assert len(rejilla) == len(cajas)
+    rejilla.limpiar()
+    assert len(rejilla) == 0 and not rejilla.colisiona(-1000, -1000, 3000, 3000)
+
+
+def test_colisiona_con_mascaras_coincide_con_fuerza_bruta(pygame_iniciado):
+    # Un anillo: los rectángulos se tocan pero el hueco del centro no choca
+    sprite = pygame.Surface((40, 40), pygame.SRCALPHA)
+    pygame.draw.circle(sprite, (255, 255, 255, 255), (20, 20), 20, 6)
+    mascara = pygame.mask.from_surface(sprite)
+    rng = random.Random(0)
+    rejilla = HashEspacial(30, filas=4, columnas=4)
+    cajas = []
+    for clave in range(40):
+        x, y = float(rng.randint(0, 300)), float(rng.randint(0, 300))
+        rejilla.insertar(clave, x, y, 40, 40)
+        cajas.append((x, y))
+    rejilla.desplazar(0, 0.25)
+    diferencias = 0
+    for _ in range(2000):
+        px, py = rng.uniform(-40, 340), rng.uniform(-40, 340)
+        por_rect = rejilla.colisiona(px, py, 40, 40)
+        esperado = any(
+            mascara.overlap(mascara, (int((x - px + 0.5) // 1), int((y + 0.25 - py + 0.5) // 1)))
+            for x, y in cajas if _intersecta((px, py, 40, 40), (x, y + 0.25, 40, 40)))
+        assert rejilla.colisiona(px, py, 40, 40, mascara, mascara) == esperado
+        diferencias += por_rect != esperado
+    # La prueba solo tiene sentido si las máscaras descartan algún choque por rectángulo
+    assert diferencias
+
+
+def test_insertar_rechaza_claves_negativas():
+    with pytest.raises(ValueError):
+        HashEspacial().insertar(-1, 0, 0, 1, 1)
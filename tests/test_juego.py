@@ -0,0 +1,42 @@
+import itertools
+import time
+import types
+
+from Modulo_Juego import GameConfig, JuegoMejorado
+from Modulo_Simulacion import EntradaAleatoria, crear_juego_headless, responder_siempre
+
+
+def test_el_pool_alcanza_para_los_obstaculos_iniciales():
+    config = GameConfig(INITIAL_OBSTACLE_COUNT=30, MAX_OBSTACLE_COUNT=10)
+    juego = JuegoMejorado("granja", headless=True, semilla=0, entrada=EntradaAleatoria(0),
+                          responder=responder_siempre(True), config=config)
+    assert juego.manejar_preguntas_inicio_categoria()
+    assert len(juego.obstacles) == 30
+    for _ in range(200):
+        juego.update()
+    juego.cleanup()
+
+
+def test_el_acumulado_no_queda_negativo_tras_reiniciar_el_reloj(monkeypatch):
+    juego = crear_juego_headless(semilla=0)
+    juego.config.INTERPOLATE = True
+    dt = 1.0 / juego.config.TICK_RATE
+    reloj = itertools.count(0.0, 2.5 * dt)
+    monkeypatch.setattr(time, "perf_counter", lambda: next(reloj))
+    alphas = []
+
+    def update():
+        juego._reiniciar_reloj()  # como al abrir el diálogo de preguntas
+        return True
+
+    def draw(alpha=1.0):
+        alphas.append(alpha)
+        juego.running = len(alphas) < 5
+
+    monkeypatch.setattr(juego, "update", update)
+    monkeypatch.setattr(juego, "draw", draw)
+    monkeypatch.setattr(juego, "clock", types.SimpleNamespace(tick=lambda fps: 0))
+    juego._run_fixed_timestep()
+    juego.cleanup()
+    assert len(alphas) == 5
+    assert all(0.0 <= alpha < 1.0 for alpha in alphas)
@@ -0,0 +1,51 @@
+import sys
+
+import pytest
+
+from Modulo_Assets import AssetManager
+from Modulo_Juego import CATEGORIA_PROGRESSION
+from Modulo_Manifiesto import ManifiestoAssets, manifiesto_compartido
+from Modulo_RegistroAssets import registro_assets
+
+pytestmark = pytest.mark.usefixtures("pygame_iniciado")
+
+# Los hooks de auditoría no se pueden quitar: se instala uno y se activa por prueba
+_eventos = None
+
+
+def _contar(evento, argumentos):
+    if _eventos is not None and evento in ("open", "os.listdir", "os.scandir"):
+        _eventos[evento] = _eventos.get(evento, 0) + 1
+
+
+sys.addaudithook(_contar)
+
+
+def test_un_cambio_de_categoria_abre_solo_los_blobs():
+    global _eventos
+    manifiesto_compartido()
+    for categoria in CATEGORIA_PROGRESSION:
+        AssetManager(categoria, convertir=False, usar_atlas=False).liberar()  # llena la caché en disco
+    registro_assets.vaciar()
+    _eventos, imagenes = {}, 0
+    try:
+        for categoria in CATEGORIA_PROGRESSION:
+            gestor = AssetManager(categoria, convertir=False, usar_atlas=False)
+            imagenes += len(gestor.images)
+            gestor.liberar()
+        eventos = _eventos
+    finally:
+        _eventos = None
+    assert eventos.get("os.listdir", 0) == eventos.get("os.scandir", 0) == 0
+    # Con el manifiesto leído, cada imagen abre solo su blob de la caché en disco
+    assert eventos.get("open", 0) <= imagenes
+
+
+def test_el_manifiesto_guardado_coincide_con_el_reconstruido(tmp_path):
+    construido = ManifiestoAssets.construir()
+    ruta = str(tmp_path / "manifiesto.json")
+    construido.guardar(ruta)
+    leido = ManifiestoAssets.leer(ruta)
+    assert leido is not None
+    assert leido.validar() == []
+    assert {c: set(e) for c, e in leido.categorias.items()} == {c: set(e) for c, e in construido.categorias.items()}
@@ -0,0 +1,80 @@
+import gc
+import itertools
+import tracemalloc
+
+from Modulo_Simulacion import crear_juego_headless
+
+FASES_LOGICA = ("handle_player_movement", "update_obstacles", "check_collisions", "check_category_progression")
+
+
+def _pico(funcion, veces):
+    """Memoria trazada máxima, por encima de la del inicio, mientras se llama `funcion` `veces` veces."""
+    repeticiones = itertools.repeat(None, veces)
+    # CPython guarda hasta 100 float liberados para reutilizarlos; se llena esa
+    # lista antes de medir para que los float temporales no cuenten la primera
+    # vez que un tick necesita más que nunca a la vez
+    flotantes = [float(i) for i in range(100)]
+    del flotantes
+    base = tracemalloc.get_traced_memory()[0]
+    tracemalloc.reset_peak()
+    for _ in repeticiones:
+        funcion()
+    return tracemalloc.get_traced_memory()[1] - base
+
+
+def test_el_regimen_estable_no_acumula_memoria():
+    juego = crear_juego_headless(semilla=0)
+    juego.config.POINTS_TO_ADVANCE = 10 ** 12
+    fases = [getattr(juego, nombre) for nombre in FASES_LOGICA]
+
+    def avanzar(n):
+        for _ in range(n):
+            for fase in fases:
+                fase()
+
+    # Se traza desde antes del calentamiento: los bloques creados sin trazar no
+    # descuentan al liberarse y sus reemplazos parecerían crecimiento
+    tracemalloc.start()
+    try:
+        avanzar(2000)
+        gc.collect()
+        antes = tracemalloc.get_traced_memory()[0]
+        avanzar(5000)
+        gc.collect()
+        despues = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+        juego.cleanup()
+    # Tolerancia fija, independiente de los ticks: una fuga de un byte por tick la supera
+    assert despues - antes <= 4096
+
+
+def test_el_tick_estable_no_asigna_memoria():
+    juego = crear_juego_headless(semilla=0)
+
+    # CPython crea un objeto por cada entero fuera de [-5, 256]: el puntaje y las
+    # vidas se fijan en cada tick para que su crecimiento no cuente como asignación
+    def reiniciar_contadores():
+        juego.score = 0
+        juego.lives = 3
+
+    def tick():
+        reiniciar_contadores()
+        juego.update()
+
+    # Una recolección completa vacía las listas libres de float y tuple de CPython:
+    # se recolecta antes del calentamiento y no se vuelve a recolectar hasta medir
+    gc.collect()
+    gc.disable()
+    tracemalloc.start()
+    try:
+        for _ in range(3000):
+            tick()
+        referencia = _pico(reiniciar_contadores, 3000)
+        pico = _pico(tick, 3000)
+    finally:
+        gc.enable()
+        tracemalloc.stop()
+        juego.cleanup()
+    # Cualquier objeto creado en un tick, aunque se libere en el mismo tick, sube el pico
+    assert pico <= referencia
@@ -0,0 +1,63 @@
+import random
+
+import pytest
+
+from Modulo_creacionDelArbol import Pregunta
+from Modulo_EstructuraArbol import PREGUNTAS_POR_CATEGORIA
+from Modulo_MuestreoPesos import MuestreadorPesos, peso_de_muestreo
+from Modulo_SeleccionPreguntas import ConfiguracionPartida, SelectorPreguntas
+
+
+def _banco(tamano, rng):
+    preguntas = [Pregunta(f"p{i}") for i in range(tamano)]
+    for pregunta in preguntas:
+        pregunta.peso = rng.randrange(8)
+    return preguntas
+
+
+def test_la_distribucion_es_proporcional_al_peso():
+    rng = random.Random(0)
+    preguntas = _banco(31, rng)
+    muestreador = MuestreadorPesos(preguntas)
+    total = sum(peso_de_muestreo(p.peso) for p in preguntas)
+    sorteos = 50000
+    frecuencias = dict.fromkeys(preguntas, 0)
+    for _ in range(sorteos):
+        frecuencias[muestreador.muestrear(rng)] += 1
+    # El ruido de muestreo da alrededor de 0.01 de distancia de variación total
+    distancia = 0.5 * sum(abs(frecuencias[p] / sorteos - peso_de_muestreo(p.peso) / total) for p in preguntas)
+    assert distancia < 0.03
+    muestreador.vaciar()
+
+
+def test_el_total_sigue_las_respuestas_sin_acumular_error():
+    rng = random.Random(1)
+    preguntas = _banco(2000, rng)
+    muestreador = MuestreadorPesos(preguntas)
+    for _ in range(20000):
+        rng.choice(preguntas).registrar_respuesta(rng.random() < 0.5)
+    assert muestreador.total == pytest.approx(sum(peso_de_muestreo(p.peso) for p in preguntas), abs=1e-6)
+    muestreador.vaciar()
+
+
+def test_muestrear_varias_sin_reposicion_y_restaura_los_pesos():
+    rng = random.Random(2)
+    preguntas = _banco(100, rng)
+    muestreador = MuestreadorPesos(preguntas)
+    total = muestreador.total
+    excluidas = set(preguntas[:30])
+    for _ in range(200):
+        lote = muestreador.muestrear_varias(10, rng, excluir=excluidas)
+        assert len(set(lote)) == 10
+        assert not excluidas & set(lote)
+    assert len(muestreador.muestrear_varias(1000, rng, excluir=excluidas)) == 70
+    assert muestreador.total == pytest.approx(total)
+    muestreador.vaciar()
+
+
+@pytest.mark.parametrize("categoria", list(PREGUNTAS_POR_CATEGORIA))
+@pytest.mark.parametrize("num_preguntas", [ConfiguracionPartida().num_preguntas, 1000])
+def test_las_partidas_no_repiten_preguntas(categoria, num_preguntas):
+    selector = SelectorPreguntas(categoria, ConfiguracionPartida(num_preguntas=num_preguntas))
+    elegidas = selector.seleccionar_preguntas()
+    assert len(elegidas) == len(set(elegidas))
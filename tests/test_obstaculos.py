@@ -0,0 +1,46 @@
+import random
+
+from Modulo_Obstaculos import AlmacenObstaculos
+
+
+def _filas(almacen):
+    n = almacen.n
+    return {clave: (x, y) for clave, x, y in zip(
+        almacen.ids[:n].tolist(), almacen.x[:n].tolist(), almacen.y[:n].tolist())}
+
+
+def test_descartar_fuera_conserva_los_demas_y_libera_sus_ids():
+    rng = random.Random(3)
+    almacen = AlmacenObstaculos(40)
+    esperado = {}
+    for _ in range(2000):
+        while almacen.n < almacen.capacidad and rng.random() < 0.7:
+            x, y = float(rng.randint(0, 770)), float(rng.randint(-200, 0))
+            esperado[almacen.agregar(x, y, 30, 30, 5.0)] = (x, y)
+        almacen.mover()
+        esperado = {clave: (x, y + 5.0) for clave, (x, y) in esperado.items()}
+        cantidad = almacen.descartar_fuera(600)
+        fuera = {clave for clave, (_, y) in esperado.items() if y > 600}
+        assert cantidad == len(fuera)
+        assert set(almacen.eliminados[:cantidad].tolist()) == fuera
+        for clave in fuera:
+            del esperado[clave]
+        assert _filas(almacen) == esperado
+    # Los identificadores liberados se reutilizan sin repetirse
+    almacen.limpiar()
+    claves = [almacen.agregar(0, 0, 1, 1, 0) for _ in range(almacen.capacidad)]
+    assert sorted(claves) == list(range(almacen.capacidad))
+
+
+def test_reservar_conserva_filas_e_ids_libres():
+    almacen = AlmacenObstaculos(4)
+    for i in range(4):
+        almacen.agregar(float(i), 700.0 if i % 2 else 0.0, 1, 1, 0)
+    assert almacen.descartar_fuera(600) == 2
+    almacen.reservar(8)
+    antes = _filas(almacen)
+    claves = [almacen.agregar(0, 0, 1, 1, 0) for _ in range(6)]
+    # Primero los liberados antes de agrandar (las filas 1 y 3 quedaron fuera)
+    assert set(claves[:2]) == {1, 3}
+    assert sorted(claves + list(antes)) == list(range(8))
+    assert {clave: antes[clave] for clave in antes} == {clave: _filas(almacen)[clave] for clave in antes}
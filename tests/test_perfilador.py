@@ -0,0 +1,25 @@
+import itertools
+import time
+
+import pytest
+
+from Modulo_Perfilador import PerfiladorFrames
+
+
+@pytest.mark.parametrize("cuadros", [5, 30])
+def test_el_primer_cuadro_no_cuenta_en_las_estadisticas(monkeypatch, cuadros):
+    reloj = itertools.count(0.0, 0.01)
+    monkeypatch.setattr(time, "perf_counter", lambda: next(reloj))
+    perfilador = PerfiladorFrames(capacidad=10, overlay_visible=False)
+    for _ in range(cuadros):
+        perfilador.cerrar_frame()
+    estadisticas = perfilador.estadisticas()
+    assert estadisticas["fps"]["valor"] == pytest.approx(100.0)
+    assert estadisticas["frame"]["p50"] == pytest.approx(10.0)
+    assert estadisticas["frame"]["p99"] == pytest.approx(10.0)
+
+
+def test_sin_cuadros_completos_no_hay_estadisticas():
+    perfilador = PerfiladorFrames(capacidad=10, overlay_visible=False)
+    perfilador.cerrar_frame()
+    assert perfilador.estadisticas() == {}
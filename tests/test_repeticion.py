@@ -0,0 +1,32 @@
+import pytest
+
+from Modulo_Juego import GameConfig, JuegoMejorado
+from Modulo_Repeticion import GrabadorPartida, RegistroPartida, huella_estado, reproducir
+from Modulo_Simulacion import EntradaAleatoria, responder_siempre
+
+
+@pytest.mark.parametrize("semilla, config", [
+    (0, GameConfig()),
+    (1, GameConfig(MAX_OBSTACLE_COUNT=20, INITIAL_OBSTACLE_COUNT=12, BASE_OBSTACLE_SPEED=8)),
+    (-5, GameConfig()),
+], ids=["defecto", "config", "semilla_negativa"])
+def test_la_repeticion_coincide_con_la_grabacion(tmp_path, semilla, config):
+    juego = JuegoMejorado("granja", headless=True, semilla=semilla, entrada=EntradaAleatoria(semilla),
+                          responder=responder_siempre(semilla % 2 == 0), config=config)
+    grabador = GrabadorPartida(juego)
+    if juego.manejar_preguntas_inicio_categoria():
+        for _ in range(1500):
+            if not juego.update():
+                break
+    ruta = str(tmp_path / "partida.jgr")
+    registro = grabador.terminar(ruta)
+    juego.cleanup()
+
+    cargado = RegistroPartida.cargar(ruta)
+    assert cargado.config == registro.config
+    assert huella_estado(reproducir(cargado)) == tuple(registro.huella)
+
+
+def test_semilla_fuera_de_rango(tmp_path):
+    with pytest.raises(ValueError):
+        RegistroPartida(2 ** 63, "granja").guardar(str(tmp_path / "partida.jgr"))
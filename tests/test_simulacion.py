@@ -0,0 +1,43 @@
+import os
+
+from Modulo_Juego import JuegoMejorado
+from Modulo_Repeticion import huella_estado
+from Modulo_Simulacion import EntradaAleatoria, crear_juego_headless
+
+
+def _jugar(semilla, ticks=600):
+    juego = crear_juego_headless("granja", semilla)
+    for _ in range(ticks):
+        if not juego.update():
+            break
+    huella = huella_estado(juego)
+    juego.cleanup()
+    return huella
+
+
+def test_misma_semilla_misma_partida():
+    assert _jugar(3) == _jugar(3)
+
+
+def test_semillas_distintas_partidas_distintas():
+    assert _jugar(3) != _jugar(4)
+
+
+def test_headless_restaura_el_driver_de_video(monkeypatch):
+    monkeypatch.delenv("SDL_VIDEODRIVER", raising=False)
+    JuegoMejorado("granja", headless=True, semilla=0).cleanup()
+    assert "SDL_VIDEODRIVER" not in os.environ
+
+    monkeypatch.setenv("SDL_VIDEODRIVER", "offscreen")
+    JuegoMejorado("granja", headless=True, semilla=0).cleanup()
+    assert os.environ["SDL_VIDEODRIVER"] == "offscreen"
+
+
+def test_headless_sin_respondedor_no_espera_eventos():
+    juego = JuegoMejorado("granja", headless=True, semilla=0, entrada=EntradaAleatoria(0))
+    try:
+        # Con el diálogo real esto se bloquearía en pygame.event.wait
+        assert juego.manejar_preguntas_inicio_categoria()
+        assert juego.update()
+    finally:
+        juego.cleanup()